@@ -1,2 +1,10 @@
 from .pcgw import PCGW
-from .utils import Support
+from .errors import PCGWAPIError
+from .query import Query
+from .utils import Support, SupportValue
+from .cache import Cache, MemoryCache, SQLiteCache
+from .throttling import RateLimiter, RetryPolicy
+from .index import OfflineIndex
+from .snapshot import Snapshot
+from .frame import GameFrame
+from .observers import Observer, RequestEvent, DecodeEvent
@@ -0,0 +1,215 @@
+from collections import OrderedDict
+import json
+import sqlite3
+import threading
+import time
+
+import httpx
+
+class CacheEntry:
+    """
+    Represents a cached API response.
+
+    Attributes:
+        value: decoded json response.
+        expires: timestamp after which the entry must be revalidated.
+        etag: ETag header of the response, if any.
+        last_modified: Last-Modified header of the response, if any.
+    """
+    def __init__(self, value: dict, expires: float,
+                       etag: str|None = None, last_modified: str|None = None):
+        self.value = value
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+class Cache:
+    """
+    Base class for the caches of API responses used by PCGW.
+
+    Responses are keyed on the normalized parameters of the request. Once an
+    entry has expired, the request is sent again with the validators of the
+    cached response so that the server can answer with 304 Not Modified.
+    Subclasses implement the storage through the _get, _set and clear methods,
+    guarded by _lock, which also guards the counters.
+
+    Attributes:
+        ttl: default time to live of an entry, in seconds.
+        table_ttls: time to live of the entries by table name, the smallest
+                    value among the tables of a request is used.
+        hits: number of requests served from the cache.
+        misses: number of requests that needed an API request.
+        revalidations: number of expired entries revalidated by the server.
+    """
+    def __init__(self, ttl: float = 3600, table_ttls: dict[str, float]|None = None):
+        self.ttl = ttl
+        self.table_ttls = table_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> CacheEntry|None:
+        raise NotImplementedError
+
+    def _set(self, key: str, entry: CacheEntry):
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes every entry of the cache.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """
+        Returns the cache key of the request parameters.
+        """
+        return json.dumps(sorted((k, str(v)) for k, v in params.items()
+                                 if k != 'format'))
+
+    def get_ttl(self, params: dict) -> float:
+        """
+        Returns the time to live of the response to a request.
+        """
+        ttls = [self.table_ttls[table] for table in str(params.get('tables', '')).split(',')
+                if table in self.table_ttls]
+        return min(ttls, default=self.ttl)
+
+    def lookup(self, params: dict) -> tuple[dict|None, dict[str, str]]:
+        """
+        Looks up the response to a request.
+
+        Parameters:
+            params: parameters of the request.
+
+        Returns:
+            The cached response if it is still fresh, None otherwise, and the
+            conditional headers to send with the request.
+        """
+        entry = self._get(self.make_key(params))
+        if entry is not None and entry.expires > time.time():
+            with self._lock:
+                self.hits += 1
+            return entry.value, {}
+        with self._lock:
+            self.misses += 1
+        if entry is None:
+            return None, {}
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return None, headers
+
+    def store(self, params: dict, response: httpx.Response) -> dict|None:
+        """
+        Stores the response to a request and returns its decoded value.
+
+        A 304 Not Modified response refreshes the expired entry instead.
+        Error responses are not stored.
+
+        Returns:
+            The decoded value, None for a 304 response whose entry has been
+            evicted since the lookup, in which case the request must be
+            sent again without the conditional headers.
+        """
+        key = self.make_key(params)
+        expires = time.time() + self.get_ttl(params)
+        if response.status_code == 304:
+            entry = self._get(key)
+            if entry is None:
+                return None
+            with self._lock:
+                self.revalidations += 1
+            entry.expires = expires
+            self._set(key, entry)
+            return entry.value
+        value = response.json()
+        if response.is_success and 'error' not in value:
+            self._set(key, CacheEntry(value, expires,
+                                      response.headers.get('ETag'),
+                                      response.headers.get('Last-Modified')))
+        return value
+
+class MemoryCache(Cache):
+    """
+    In-memory cache of API responses, evicting the least recently used
+    entries beyond max_entries.
+    """
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600,
+                       table_ttls: dict[str, float]|None = None):
+        super().__init__(ttl, table_ttls)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def _get(self, key: str) -> CacheEntry|None:
+        with self._lock:
+            if entry := self._entries.get(key):
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+class SQLiteCache(Cache):
+    """
+    Cache of API responses persisted in a SQLite database, evicting the
+    least recently used entries beyond max_entries.
+    """
+    def __init__(self, path: str, max_entries: int = 100_000, ttl: float = 3600,
+                       table_ttls: dict[str, float]|None = None):
+        super().__init__(ttl, table_ttls)
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                             'key TEXT PRIMARY KEY, value TEXT, expires REAL, '
+                             'etag TEXT, last_modified TEXT, accessed REAL)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed '
+                             'ON responses(accessed)')
+
+    def _get(self, key: str) -> CacheEntry|None:
+        with self._lock, self._db:
+            row = self._db.execute('SELECT value, expires, etag, last_modified '
+                                   'FROM responses WHERE key=?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE responses SET accessed=? WHERE key=?', (time.time(), key))
+        return CacheEntry(json.loads(row[0]), row[1], row[2], row[3])
+
+    def _set(self, key: str, entry: CacheEntry):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                             (key, json.dumps(entry.value), entry.expires,
+                              entry.etag, entry.last_modified, time.time()))
+            self._db.execute('DELETE FROM responses WHERE key IN ('
+                             'SELECT key FROM responses ORDER BY accessed DESC '
+                             'LIMIT -1 OFFSET ?)', (self.max_entries,))
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException|None = None
+
+class SingleFlight:
+    """
+    Coalesces identical calls made concurrently by several threads: the
+    first caller of a key runs the function while the others wait for its
+    result (or exception) instead of running it again.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Returns the result of function, shared with the concurrent calls
+        with the same key.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if leader:
+            try:
+                call.result = function()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical calls made concurrently by several tasks of an event
+    loop. The coroutine of the first caller runs in a task of its own, so
+    that cancelling one of the callers does not cancel the others.
+    """
+    def __init__(self):
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the result of the coroutine returned by function, shared
+        with the concurrent calls with the same key.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get((loop, key))
+        if task is None:
+            task = self._tasks[loop, key] = loop.create_task(function())
+            task.add_done_callback(lambda _: self._tasks.pop((loop, key), None))
+        return await asyncio.shield(task)
+
+class _Batch:
+    __slots__ = ('keys', 'full', 'done', 'results', 'error')
+
+    def __init__(self):
+        self.keys: dict[Hashable, None] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: Mapping = {}
+        self.error: BaseException|None = None
+
+class MicroBatcher:
+    """
+    Groups the keys submitted concurrently by several threads into batches
+    handled by a single call of function.
+
+    The first thread submitting a key of a group opens a batch, which
+    collects the keys submitted during window seconds, or until it holds
+    max_size keys, then calls function with the group and the keys. Every
+    thread receives the result of its own key.
+    """
+    def __init__(self, function: Callable[[Hashable, list], Mapping], window: float, max_size: int = 50):
+        self.function = function
+        self.window = window
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._batches: dict[Hashable, _Batch] = {}
+
+    def submit(self, group: Hashable, key: Hashable) -> Any:
+        """
+        Returns the result of key, None if function returned none for it.
+        """
+        with self._lock:
+            batch = self._batches.get(group)
+            leader = batch is None
+            if leader:
+                batch = self._batches[group] = _Batch()
+            batch.keys[key] = None
+            if len(batch.keys) >= self.max_size:
+                del self._batches[group]
+                batch.full.set()
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._batches.get(group) is batch:
+                    del self._batches[group]
+            try:
+                batch.results = self.function(group, list(batch.keys))
+            except BaseException as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.results.get(key)
+
+class _AsyncBatch:
+    __slots__ = ('keys', 'full', 'task')
+
+    def __init__(self):
+        self.keys: dict[Hashable, None] = {}
+        self.full = asyncio.Event()
+        self.task: asyncio.Task|None = None
+
+class AsyncMicroBatcher:
+    """
+    Groups the keys submitted concurrently by several tasks of an event loop
+    into batches handled by a single call of function, as MicroBatcher.
+    """
+    def __init__(self, function: Callable[[Hashable, list], Awaitable[Mapping]], window: float,
+                       max_size: int = 50):
+        self.function = function
+        self.window = window
+        self.max_size = max_size
+        self._batches: dict[tuple[asyncio.AbstractEventLoop, Hashable], _AsyncBatch] = {}
+
+    async def submit(self, group: Hashable, key: Hashable) -> Any:
+        """
+        Returns the result of key, None if function returned none for it.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get((loop, group))
+        if batch is None:
+            batch = self._batches[loop, group] = _AsyncBatch()
+            batch.task = loop.create_task(self._run(loop, group, batch))
+        batch.keys[key] = None
+        if len(batch.keys) >= self.max_size:
+            self._close(loop, group, batch)
+            batch.full.set()
+        return (await asyncio.shield(batch.task)).get(key)
+
+    def _close(self, loop: asyncio.AbstractEventLoop, group: Hashable, batch: _AsyncBatch):
+        if self._batches.get((loop, group)) is batch:
+            del self._batches[loop, group]
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, group: Hashable, batch: _AsyncBatch) -> Mapping:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.window)
+        except TimeoutError:
+            pass
+        self._close(loop, group, batch)
+        return await self.function(group, list(batch.keys))
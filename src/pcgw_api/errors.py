@@ -0,0 +1,26 @@
+class PCGWAPIError(Exception):
+    """
+    Error returned by the API in the body of a response, for instance for an
+    invalid where clause or a maxlag error still present after the retries.
+
+    Attributes:
+        code: MediaWiki error code.
+        info: description of the error.
+    """
+    def __init__(self, code: str, info: str = ''):
+        super().__init__(code, info)
+        self.code = code
+        self.info = info
+
+    def __str__(self):
+        return f'{self.code}: {self.info}' if self.info else self.code
+
+def raise_for_error(value: dict) -> dict:
+    """
+    Raises a PCGWAPIError if a decoded response holds an error, returns the
+    response otherwise.
+    """
+    if isinstance(value, dict) and 'error' in value:
+        error = value['error'] if isinstance(value['error'], dict) else {'info': str(value['error'])}
+        raise PCGWAPIError(str(error.get('code', 'unknown')), str(error.get('info', '')))
+    return value
@@ -0,0 +1,118 @@
+from array import array
+from typing import Sequence
+
+from pcgw_api.utils import FieldSpec, Support, SUPPORT_NORMALIZATION, field_decoder, parse_value
+
+SUPPORT_LABELS: tuple[Support, ...] = tuple(Support)
+SUPPORT_CODES: dict[str|None, int] = {raw_value: SUPPORT_LABELS.index(support)
+                                      for raw_value, support in SUPPORT_NORMALIZATION.items()}
+OTHER_VALUE_CODE = SUPPORT_LABELS.index(Support.OTHER_VALUE)
+
+class GameFrame:
+    """
+    Columnar representation of games, decoded directly from the rows of
+    API responses without building Game objects.
+
+    The columns are named "page_id", "name" and "<attribute>.<field>" for the
+    fields of the tables, for instance "infobox.genres", following the
+    attributes of Game and of the classes of the tables module. String fields
+    are lists of strings, list fields lists of tuples, dates and numbers lists
+    of parsed values, and support fields arrays of signed chars holding the
+    index in SUPPORT_LABELS of the Support value.
+
+    Attributes:
+        columns: columns indexed by name.
+    """
+    def __init__(self, columns: dict[str, Sequence]):
+        self.columns = columns
+
+    @classmethod
+    def from_rows(cls, rows: list[dict], fields: Sequence[tuple[str, FieldSpec]]) -> "GameFrame":
+        """
+        Decodes rows of an API response into columns.
+
+        Parameters:
+            rows: rows of the response, with the page name and ID aliased
+                  as Page and PageID.
+            fields: names of the columns to build and specifications of the
+                    corresponding fields.
+
+        Returns:
+            A GameFrame.
+        """
+        columns: dict[str, Sequence] = {
+            'page_id': [parse_value(j, 'PageID', int) for j in rows],
+            'name': [j.get('Page') for j in rows],
+        }
+        for column, spec in fields:
+            key = spec.key
+            if spec.kind == 'str':
+                columns[column] = [j.get(key) for j in rows]
+            elif spec.kind == 'support':
+                columns[column] = array('b', [SUPPORT_CODES.get(j.get(key), OTHER_VALUE_CODE) for j in rows])
+            else:
+                decode = field_decoder(spec)
+                columns[column] = [decode(j.get(key)) for j in rows]
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.columns['page_id'])
+
+    def __getitem__(self, column: str) -> Sequence:
+        return self.columns[column]
+
+    def support_values(self, column: str) -> list[Support]:
+        """
+        Returns a support column as a list of Support values.
+        """
+        return [SUPPORT_LABELS[code] for code in self.columns[column]]
+
+    def to_pandas(self):
+        """
+        Converts the frame into a pandas DataFrame, support columns becoming
+        categorical columns of Support value names.
+
+        Raises:
+            ImportError: if pandas is not installed.
+        """
+        try:
+            import pandas
+        except ImportError as e:
+            raise ImportError('GameFrame.to_pandas requires pandas') from e
+        categories = [support.name for support in SUPPORT_LABELS]
+        return pandas.DataFrame({
+            column: pandas.Categorical.from_codes(values, categories=categories)
+                    if isinstance(values, array) else values
+            for column, values in self.columns.items()
+        })
+
+    def to_arrow(self):
+        """
+        Converts the frame into a pyarrow Table, support columns becoming
+        dictionary columns of Support value names.
+
+        Raises:
+            ImportError: if pyarrow is not installed.
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError('GameFrame.to_arrow requires pyarrow') from e
+        categories = pyarrow.array([support.name for support in SUPPORT_LABELS])
+        return pyarrow.table({
+            column: pyarrow.DictionaryArray.from_arrays(pyarrow.array(values, pyarrow.int8()), categories)
+                    if isinstance(values, array) else pyarrow.array([list(v) if isinstance(v, tuple) else v
+                                                                     for v in values])
+            for column, values in self.columns.items()
+        })
+
+    def to_parquet(self, path: str):
+        """
+        Writes the frame into a Parquet file.
+
+        Raises:
+            ImportError: if pyarrow is not installed.
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path)
@@ -0,0 +1,204 @@
+import datetime
+import difflib
+import json
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from pcgw_api.pcgw import PCGW
+
+class OfflineIndex:
+    """
+    Local index of the PCGamingWiki games stored in a SQLite database.
+
+    The index keeps the data of every game as returned by the API, and
+    indexes the names of the games with a trigram full-text index, which
+    allows case-insensitive substring and fuzzy searches without requests.
+    It is populated by paging through the whole catalogue with build, and
+    kept up to date with PCGW.sync.
+
+    Attributes:
+        last_sync: time of the last complete build or synchronization,
+                   persisted in the database.
+    """
+    def __init__(self, path: str):
+        """
+        Constructor for an OfflineIndex.
+
+        Parameters:
+            path: path of the SQLite database, created if needed.
+        """
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS games ('
+                             'page_id INTEGER PRIMARY KEY, name TEXT, data TEXT)')
+            self._db.execute('CREATE VIRTUAL TABLE IF NOT EXISTS names '
+                             'USING fts5(name, tokenize="trigram")')
+            self._db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)')
+
+    def add(self, rows: Iterable[dict]):
+        """
+        Adds or replaces games in the index.
+
+        Parameters:
+            rows: data of the games as returned by the API, with the page
+                  name and ID aliased as Page and PageID.
+        """
+        with self._lock, self._db:
+            for j in rows:
+                try:
+                    page_id = int(j.get('PageID', '') or '')
+                except ValueError:
+                    continue
+                self._db.execute('INSERT OR REPLACE INTO games VALUES (?, ?, ?)',
+                                 (page_id, j.get('Page'), json.dumps(j)))
+                self._db.execute('DELETE FROM names WHERE rowid=?', (page_id,))
+                self._db.execute('INSERT INTO names(rowid, name) VALUES (?, ?)',
+                                 (page_id, j.get('Page') or ''))
+
+    def remove(self, page_ids: Iterable[int]):
+        """
+        Removes games from the index.
+        """
+        with self._lock, self._db:
+            for page_id in page_ids:
+                self._db.execute('DELETE FROM games WHERE page_id=?', (page_id,))
+                self._db.execute('DELETE FROM names WHERE rowid=?', (page_id,))
+
+    def build(self, client: "PCGW", resume: bool = True, batch_size: int = 500) -> int:
+        """
+        Populates the index with every game of PCGamingWiki.
+
+        The games are stored by batches along with the ID of the last game
+        stored, so that an interrupted build, for instance by a failed
+        request, can be resumed. Once every game has been fetched, last_sync
+        is set to the start of the build and the next build starts over.
+
+        Parameters:
+            client: API client used to fetch the games.
+            resume: whether to resume the previous build instead of starting over.
+            batch_size: number of games stored at a time.
+
+        Returns:
+            The number of games added to the index.
+
+        Raises:
+            PCGWAPIError, httpx.HTTPError: if a request failed, the games
+                                           fetched so far being kept.
+        """
+        after_page_id = self._get_meta('last_page_id', 0) if resume else 0
+        if not after_page_id:
+            self._set_meta('build_started', datetime.datetime.now(datetime.timezone.utc).isoformat())
+        batch = []
+        count = 0
+        for game in client.iter_all_games(after_page_id=after_page_id):
+            batch.append(game.json_data)
+            if len(batch) >= batch_size:
+                count += self._add_batch(batch, game.id)
+                batch = []
+        if batch:
+            count += self._add_batch(batch, int(batch[-1]['PageID']))
+        # only reached once iter_all_games is exhausted without error
+        if started := self._get_meta('build_started'):
+            self.last_sync = datetime.datetime.fromisoformat(started)
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM meta WHERE key IN (?, ?)', ('build_started', 'last_page_id'))
+        return count
+
+    @property
+    def last_sync(self) -> datetime.datetime|None:
+        value = self._get_meta('last_sync')
+        return None if value is None else datetime.datetime.fromisoformat(value)
+
+    @last_sync.setter
+    def last_sync(self, value: datetime.datetime):
+        self._set_meta('last_sync', value.isoformat())
+
+    def _add_batch(self, batch: list[dict], last_page_id: int) -> int:
+        self.add(batch)
+        self._set_meta('last_page_id', last_page_id)
+        return len(batch)
+
+    def _get_meta(self, key: str, default=None):
+        with self._lock:
+            row = self._db.execute('SELECT value FROM meta WHERE key=?', (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def _set_meta(self, key: str, value):
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    def get(self, page_id: int) -> dict|None:
+        """
+        Returns the data of a game of the index, None if it is not indexed.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT data FROM games WHERE page_id=?', (page_id,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def search(self, query: str, limit: int = 50, fuzzy: bool = True,
+                     min_similarity: float = .5) -> list[dict]:
+        """
+        Searches the games of the index by name.
+
+        The games with name containing the query, case-insensitively, are
+        returned first: exact matches, then names starting with the query,
+        then shorter names first. If there are none and fuzzy is set, the
+        games with names sharing enough trigrams with the query are returned
+        by decreasing similarity.
+
+        Parameters:
+            query: query string.
+            limit: maximum number of results.
+            fuzzy: whether to fall back to a fuzzy search.
+            min_similarity: minimum similarity ratio of the fuzzy results,
+                            between 0 and 1.
+
+        Returns:
+            The data of the matching games.
+        """
+        query = query.strip()
+        if len(query) < 3:
+            sql = "SELECT g.name, g.data FROM games g WHERE g.name LIKE ? ESCAPE '\\'"
+            params: tuple = ('%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%',)
+        else:
+            sql = ('SELECT g.name, g.data FROM names JOIN games g ON g.page_id = names.rowid '
+                   'WHERE names MATCH ?')
+            params = ('"' + query.replace('"', '""') + '"',)
+        sql += (' ORDER BY lower(g.name) = lower(?) DESC, lower(substr(g.name, 1, ?)) = lower(?) DESC,'
+                ' length(g.name), g.name LIMIT ?')
+        params += (query, len(query), query, limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        if not rows and fuzzy and len(query) >= 3:
+            rows = self._fuzzy_search(query, limit, min_similarity)
+        return [json.loads(data) for _, data in rows]
+
+    def _fuzzy_search(self, query: str, limit: int, min_similarity: float) -> list[tuple[str, str]]:
+        lowered = query.lower()
+        trigrams = {lowered[i:i+3] for i in range(len(lowered) - 2)}
+        with self._lock:
+            candidates = self._db.execute(
+                    'SELECT g.name, g.data FROM names JOIN games g ON g.page_id = names.rowid '
+                    'WHERE names MATCH ? ORDER BY bm25(names) LIMIT ?',
+                    (' OR '.join('"' + t.replace('"', '""') + '"' for t in trigrams), limit * 10)
+                    ).fetchall()
+        scored = []
+        for name, data in candidates:
+            ratio = difflib.SequenceMatcher(None, lowered, (name or '').lower()).ratio()
+            if ratio >= min_similarity:
+                scored.append((ratio, name, data))
+        scored.sort(key=lambda x: -x[0])
+        return [(name, data) for _, name, data in scored[:limit]]
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM games').fetchone()[0]
@@ -0,0 +1,253 @@
+import re
+import time
+from typing import NamedTuple
+
+import httpx
+
+class RequestEvent(NamedTuple):
+    """
+    Report of a request sent to the API, once its response is received or
+    its last attempt failed.
+
+    Attributes:
+        endpoint: "cargoquery:<table>" for cargoquery requests, where table is
+                  Infobox_game for the requests of games and the first table
+                  requested otherwise, the action for other requests.
+        status: HTTP status of the response, None if the request failed.
+        latency: time elapsed from the first attempt to the response, in
+                 seconds, including the retries and the waits of the rate
+                 limiter.
+        server_time: processing time reported by the server, in seconds,
+                     None if it did not report it.
+        response_bytes: size of the body of the response as received, before
+                        decompression when it is known.
+        retries: number of attempts made before the last one.
+        error: MediaWiki error code of the response or name of the transport
+               error, None if the request succeeded.
+    """
+    endpoint: str
+    status: int|None
+    latency: float
+    server_time: float|None
+    response_bytes: int
+    retries: int
+    error: str|None
+
+class DecodeEvent(NamedTuple):
+    """
+    Report of the decoding of a response.
+
+    Attributes:
+        endpoint: endpoint of the request, as in RequestEvent.
+        stage: "json" for the parsing of the body of the response and its
+               storage in the cache if there is one, "games" for the
+               construction of the Game objects (their tables being
+               deserialized later, on first access).
+        rows: number of rows decoded.
+        duration: time spent decoding, in seconds.
+    """
+    endpoint: str
+    stage: str
+    rows: int
+    duration: float
+
+class Observer:
+    """
+    Receives reports of the activity of a PCGW client.
+
+    Subclasses override the methods of the reports they are interested in,
+    the default implementations do nothing. The methods are called from
+    the thread or task making the requests and should return quickly. The
+    exceptions they raise are logged and do not fail the requests.
+    """
+    def on_request(self, event: RequestEvent):
+        """
+        Called when a request to the API is complete.
+        """
+
+    def on_cache(self, endpoint: str, hit: bool):
+        """
+        Called when a response is looked up in the cache, with whether a
+        fresh response was found.
+        """
+
+    def on_decode(self, event: DecodeEvent):
+        """
+        Called when a response has been decoded.
+        """
+
+_BACKEND_TIMING = re.compile(r'\bD=(\d+)')
+_SERVER_TIMING = re.compile(r'\bdur=([\d.]+)')
+
+def get_endpoint(params: dict) -> str:
+    """
+    Returns the name of the endpoint of a request reported to the observers.
+    """
+    action = params.get('action', '')
+    if action == 'cargoquery':
+        tables = params.get('tables', '').split(',')
+        return f'{action}:{"Infobox_game" if "Infobox_game" in tables else tables[0]}'
+    return action
+
+def parse_server_time(response: httpx.Response) -> float|None:
+    """
+    Parses the processing time reported by the server in the Backend-Timing
+    (MediaWiki, in microseconds) or Server-Timing (in milliseconds) header.
+
+    Returns:
+        The time in seconds or None if neither header is present.
+    """
+    if match := _BACKEND_TIMING.search(response.headers.get('Backend-Timing', '')):
+        return int(match.group(1)) / 1e6
+    if durations := _SERVER_TIMING.findall(response.headers.get('Server-Timing', '')):
+        return max(float(duration) for duration in durations) / 1e3
+    return None
+
+def make_request_event(params: dict, response: httpx.Response|None, start: float, retries: int,
+                       error: Exception|None = None) -> RequestEvent:
+    """
+    Builds the report of a request whose body has been read.
+
+    Parameters:
+        params: parameters of the request.
+        response: response to the request, None if it failed.
+        start: time.perf_counter() value when the request started.
+        retries: number of attempts made before the last one.
+        error: exception raised by the last attempt, if any.
+    """
+    if response is None:
+        return RequestEvent(get_endpoint(params), None, time.perf_counter() - start, None, 0, retries,
+                            type(error).__name__ if error is not None else None)
+    response_bytes = response.num_bytes_downloaded
+    if not response_bytes:
+        try:
+            response_bytes = len(response.content)
+        except httpx.ResponseNotRead:
+            pass
+    return RequestEvent(get_endpoint(params), response.status_code, time.perf_counter() - start,
+                        parse_server_time(response), response_bytes, retries,
+                        response.headers.get('MediaWiki-API-Error'))
+
+class PrometheusObserver(Observer):
+    """
+    Observer exporting the reports as Prometheus metrics, with the
+    prometheus_client library:
+
+    - <namespace>_request_duration_seconds (histogram, by endpoint and status)
+    - <namespace>_server_duration_seconds (histogram, by endpoint)
+    - <namespace>_response_bytes (histogram, by endpoint)
+    - <namespace>_retries_total (counter, by endpoint)
+    - <namespace>_request_errors_total (counter, by endpoint and error)
+    - <namespace>_cache_lookups_total (counter, by endpoint and result, "hit" or "miss")
+    - <namespace>_decode_duration_seconds (histogram, by endpoint and stage)
+    - <namespace>_decoded_rows_total (counter, by endpoint and stage)
+    """
+    def __init__(self, registry=None, namespace: str = 'pcgw'):
+        """
+        Constructor for a PrometheusObserver.
+
+        Parameters:
+            registry: prometheus_client registry in which to register the
+                      metrics, the default registry if None.
+            namespace: prefix of the names of the metrics.
+
+        Raises:
+            ImportError: if prometheus_client is not installed.
+        """
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError('PrometheusObserver requires prometheus_client') from e
+        options = {'namespace': namespace}
+        if registry is not None:
+            options['registry'] = registry
+        self.request_duration = prometheus_client.Histogram(
+                'request_duration_seconds', 'Duration of the requests to the API',
+                ['endpoint', 'status'], **options)
+        self.server_duration = prometheus_client.Histogram(
+                'server_duration_seconds', 'Processing time reported by the API',
+                ['endpoint'], **options)
+        self.response_bytes = prometheus_client.Histogram(
+                'response_bytes', 'Size of the responses of the API', ['endpoint'],
+                buckets=(1e3, 1e4, 1e5, 1e6, 1e7, float('inf')), **options)
+        self.retries = prometheus_client.Counter(
+                'retries', 'Retries of requests to the API', ['endpoint'], **options)
+        self.errors = prometheus_client.Counter(
+                'request_errors', 'Failed requests to the API', ['endpoint', 'error'], **options)
+        self.cache_lookups = prometheus_client.Counter(
+                'cache_lookups', 'Lookups of responses in the cache', ['endpoint', 'result'], **options)
+        self.decode_duration = prometheus_client.Histogram(
+                'decode_duration_seconds', 'Time spent decoding the responses',
+                ['endpoint', 'stage'], **options)
+        self.decoded_rows = prometheus_client.Counter(
+                'decoded_rows', 'Rows decoded from the responses', ['endpoint', 'stage'], **options)
+
+    def on_request(self, event: RequestEvent):
+        self.request_duration.labels(event.endpoint, str(event.status)).observe(event.latency)
+        if event.server_time is not None:
+            self.server_duration.labels(event.endpoint).observe(event.server_time)
+        self.response_bytes.labels(event.endpoint).observe(event.response_bytes)
+        if event.retries:
+            self.retries.labels(event.endpoint).inc(event.retries)
+        if event.error is not None:
+            self.errors.labels(event.endpoint, event.error).inc()
+
+    def on_cache(self, endpoint: str, hit: bool):
+        self.cache_lookups.labels(endpoint, 'hit' if hit else 'miss').inc()
+
+    def on_decode(self, event: DecodeEvent):
+        self.decode_duration.labels(event.endpoint, event.stage).observe(event.duration)
+        self.decoded_rows.labels(event.endpoint, event.stage).inc(event.rows)
+
+class OpenTelemetryObserver(Observer):
+    """
+    Observer exporting the reports as OpenTelemetry metrics, with the
+    opentelemetry-api library. The metrics are the same as the ones of
+    PrometheusObserver, named "pcgw.request.duration", "pcgw.server.duration",
+    "pcgw.response.size", "pcgw.request.retries", "pcgw.request.errors",
+    "pcgw.cache.lookups", "pcgw.decode.duration" and "pcgw.decode.rows",
+    with the labels as attributes.
+    """
+    def __init__(self, meter=None):
+        """
+        Constructor for an OpenTelemetryObserver.
+
+        Parameters:
+            meter: OpenTelemetry meter creating the instruments, the meter
+                   "pcgw_api" of the global meter provider if None.
+
+        Raises:
+            ImportError: if opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError('OpenTelemetryObserver requires opentelemetry-api') from e
+        meter = meter or metrics.get_meter('pcgw_api')
+        self.request_duration = meter.create_histogram('pcgw.request.duration', unit='s')
+        self.server_duration = meter.create_histogram('pcgw.server.duration', unit='s')
+        self.response_size = meter.create_histogram('pcgw.response.size', unit='By')
+        self.retries = meter.create_counter('pcgw.request.retries')
+        self.errors = meter.create_counter('pcgw.request.errors')
+        self.cache_lookups = meter.create_counter('pcgw.cache.lookups')
+        self.decode_duration = meter.create_histogram('pcgw.decode.duration', unit='s')
+        self.decoded_rows = meter.create_counter('pcgw.decode.rows')
+
+    def on_request(self, event: RequestEvent):
+        attributes = {'endpoint': event.endpoint}
+        self.request_duration.record(event.latency, {**attributes, 'status': str(event.status)})
+        if event.server_time is not None:
+            self.server_duration.record(event.server_time, attributes)
+        self.response_size.record(event.response_bytes, attributes)
+        if event.retries:
+            self.retries.add(event.retries, attributes)
+        if event.error is not None:
+            self.errors.add(1, {**attributes, 'error': event.error})
+
+    def on_cache(self, endpoint: str, hit: bool):
+        self.cache_lookups.add(1, {'endpoint': endpoint, 'result': 'hit' if hit else 'miss'})
+
+    def on_decode(self, event: DecodeEvent):
+        attributes = {'endpoint': event.endpoint, 'stage': event.stage}
+        self.decode_duration.record(event.duration, attributes)
+        self.decoded_rows.add(event.rows, attributes)
@@ -1,10 +1,51 @@
-import json
-from typing import Sequence
+import asyncio
+import datetime
+import logging
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Collection, Iterable, Iterator, Sequence
 
 import httpx
 
 import pcgw_api.tables as tables
-from pcgw_api.utils import TABLES_INFO_FILENAME
+from pcgw_api.cache import Cache
+from pcgw_api.coalescing import AsyncMicroBatcher, AsyncSingleFlight, MicroBatcher, SingleFlight
+from pcgw_api.errors import raise_for_error
+from pcgw_api.frame import GameFrame
+from pcgw_api.index import OfflineIndex
+from pcgw_api.observers import DecodeEvent, Observer, get_endpoint, make_request_event
+from pcgw_api.query import Query, quote
+from pcgw_api.snapshot import Snapshot, write_snapshot
+from pcgw_api.streaming import CargoqueryParser
+from pcgw_api.throttling import RateLimiter, RetryPolicy
+from pcgw_api.utils import FieldSpec, GameProjection, get_schema
+
+logger = logging.getLogger(__name__)
+
+class _LazyTable:
+    """
+    Descriptor deserializing a table of a Game from its json_data on first
+    access. The result is stored in the instance dictionary, which takes
+    precedence over the descriptor for the following accesses.
+    """
+    def __init__(self, table_class: type):
+        self.table_class = table_class
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, game: "Game|None", owner: type|None = None):
+        if game is None:
+            return self
+        if not game.has_table(self.name):
+            raise AttributeError(f'table {self.table_class.__name__} was not requested for game "{game}"')
+        value = self.table_class(game.json_data)
+        game.__dict__[self.name] = value
+        if game._drop_json_data and all(attr in game.__dict__ for attr in game.TABLES
+                                        if game.has_table(attr)):
+            game.json_data = None
+        return value
 
 class Game:
     """
@@ -12,10 +53,13 @@ class Game:
 
     Centralizes the information about a PCGamingWiki game page
     fetched from the API and deserialized by the classes from the
-    tables module.
+    tables module. Each table is deserialized on first access.
 
     Attributes:
-        json_data: data before deserialization.
+        json_data: data before deserialization, None once every table has
+                   been deserialized if drop_json_data was set.
+        loaded_tables: names of the tables requested for the game, None if
+                       every table was.
         pcgw_client: API client class to optionnally fetch data from association
                      tables after initialization.
         name: name of the game.
@@ -35,7 +79,40 @@ class Game:
         languages: list of languages supported by the game.
         engines: list of engines used by the game.
     """
-    def __init__(self, j: dict, pcgw_client: "PCGW|None" = None):
+    ASSOCIATION_TABLES = {
+        'L10n': 'languages',
+        'Infobox_game_engine': 'engines',
+    }
+    TABLES = {
+        'api': 'API',
+        'audio': 'Audio',
+        'availability': 'Availability',
+        'cloud': 'Cloud',
+        'infobox': 'Infobox_game',
+        'input': 'Input',
+        'middleware': 'Middleware',
+        'multiplayer': 'Multiplayer',
+        'tags': 'Tags',
+        'vr_support': 'VR_support',
+        'video': 'Video',
+        'xdg': 'XDG',
+    }
+
+    api = _LazyTable(tables.API)
+    audio = _LazyTable(tables.Audio)
+    availability = _LazyTable(tables.Availability)
+    cloud = _LazyTable(tables.Cloud)
+    infobox = _LazyTable(tables.Infobox_game)
+    input = _LazyTable(tables.Input)
+    middleware = _LazyTable(tables.Middleware)
+    multiplayer = _LazyTable(tables.Multiplayer)
+    tags = _LazyTable(tables.Tags)
+    vr_support = _LazyTable(tables.VR_support)
+    video = _LazyTable(tables.Video)
+    xdg = _LazyTable(tables.XDG)
+
+    def __init__(self, j: dict, pcgw_client: "PCGW|None" = None, drop_json_data: bool = False,
+                       loaded_tables: Collection[str]|None = None):
         """
         Constructor for a Game.
 
@@ -44,28 +121,48 @@ class Game:
                 typically a json response from the API.
             pcgw_client: API client class to optionally fetch data from
                          association tables later.
+            drop_json_data: whether to release json_data once every table
+                            has been deserialized.
+            loaded_tables: names of the tables present in j, every table if None.
+                           The attributes of the other tables are absent.
         """
-        self.json_data = j
+        self.json_data: dict|None = j
+        self._drop_json_data = drop_json_data
+        self.loaded_tables = loaded_tables
         self.pcgw_client: PCGW|None = pcgw_client
         self.name = j.get('Page')
         try:
             self.id = int(j.get('PageID', '') or '')
         except ValueError:
             self.id = None
-        self.api = tables.API(j)
-        self.audio = tables.Audio(j)
-        self.availability = tables.Availability(j)
-        self.cloud = tables.Cloud(j)
-        self.infobox = tables.Infobox_game(j)
-        self.input = tables.Input(j)
-        self.middleware = tables.Middleware(j)
-        self.multiplayer = tables.Multiplayer(j)
-        self.tags = tables.Tags(j)
-        self.vr_support = tables.VR_support(j)
-        self.video = tables.Video(j)
-        self.xdg = tables.XDG(j)
         self.languages = []
         self.engines = []
+        self._fetched_associations: set[str] = set()
+
+    def has_table(self, attr: str) -> bool:
+        """
+        Returns whether the table of the given attribute was requested for the game.
+        """
+        return self.loaded_tables is None or self.TABLES[attr] in self.loaded_tables
+
+    def load_tables(self):
+        """
+        Deserializes every table not deserialized yet, releasing json_data
+        afterwards if drop_json_data was set.
+        """
+        for attr in self.TABLES:
+            if self.has_table(attr):
+                getattr(self, attr)
+
+    def _build_association_request(self, table: str) -> dict:
+        return {
+            'action' : 'cargoquery',
+            'where'  : f'Infobox_game._pageName={quote(self.name)}',
+            'tables' : f'Infobox_game,{table}',
+            'join_on': f'Infobox_game._pageID={table}._pageID',
+            'fields' : get_schema().get(table).fields_string,
+            'format' : 'json',
+        }
 
     def _get_association_table(self, table: str, attr: str) -> list:
         """
@@ -74,20 +171,30 @@ class Game:
         (<Game name>, <Table info 1>, <Table info 2>…). Populates and returns the
         corresponding attribute.
         """
-        if not getattr(self,attr) and self.pcgw_client:
-            tables_info = {k:v for k,v in json.load(open(TABLES_INFO_FILENAME)).items()}
-            params = {
-                'action' : 'cargoquery',
-                'where'  : f'Infobox_game._pageName="{self.name}"',
-                'tables' : f'Infobox_game,{table}',
-                'join_on': f'Infobox_game._pageID={table}._pageID',
-                'fields' : ','.join(f'{table}.{field}' for field in tables_info.get(table,[])),
-                'format' : 'json',
-            }
-            response = self.pcgw_client.http_client.get(self.pcgw_client.API_URL, params=params).json()
-            setattr(self, attr, [getattr(tables, table)(j.get('title', {})) for j in response.get('cargoquery', [])])
+        if attr not in self._fetched_associations and not getattr(self,attr) and self.pcgw_client:
+            response = self.pcgw_client._cargoquery(self._build_association_request(table))
+            self._set_association_table(table, [j.get('title', {}) for j in response.get('cargoquery', [])])
+        return getattr(self, attr)
+
+    async def _async_get_association_table(self, table: str, attr: str) -> list:
+        """
+        Generic function to fetch list elements corresponding to an association
+        table in the PCGamingWiki database, asynchronous version.
+        """
+        if attr not in self._fetched_associations and not getattr(self,attr) and self.pcgw_client:
+            response = await self.pcgw_client._async_cargoquery(self._build_association_request(table))
+            self._set_association_table(table, [j.get('title', {}) for j in response.get('cargoquery', [])])
         return getattr(self, attr)
 
+    def _set_association_table(self, table: str, rows: list[dict]):
+        """
+        Populates the attribute corresponding to an association table with
+        the deserialization of the given rows.
+        """
+        attr = self.ASSOCIATION_TABLES[table]
+        setattr(self, attr, [getattr(tables, table)(j) for j in rows])
+        self._fetched_associations.add(attr)
+
     def get_languages(self) -> list[tables.L10n]:
         """
         Populates and returns the languages attribute with the list elements corresponding
@@ -102,6 +209,20 @@ class Game:
         """
         return self._get_association_table('Infobox_game_engine', 'engines')
 
+    async def async_get_languages(self) -> list[tables.L10n]:
+        """
+        Populates and returns the languages attribute, asynchronous version
+        of get_languages.
+        """
+        return await self._async_get_association_table('L10n', 'languages')
+
+    async def async_get_engines(self) -> list[tables.Infobox_game_engine]:
+        """
+        Populates and returns the engines attribute, asynchronous version
+        of get_engines.
+        """
+        return await self._async_get_association_table('Infobox_game_engine', 'engines')
+
     def __str__(self):
         if self.name:
             return self.name
@@ -113,81 +234,739 @@ class PCGW:
     """
     Main class interacting with the PCGamingWiki API.
 
+    The requests go through a pool of connections kept alive between
+    requests. A client can be used as a context manager (synchronous or
+    asynchronous) closing its connections on exit, or closed with close
+    and aclose.
+
     Attributes:
         API_URL: the URL of the PCGamingWiki API.
+        MAX_LIMIT: maximum number of rows returned by a single cargoquery request.
+        DEFAULT_LIMITS: default limits of the pool of connections.
+        DEFAULT_TIMEOUT: default timeouts of the requests.
         http_client: httpx client used for synchronous requests.
         async_http_client: httpx client used for asynchronous requests.
+        cache: optional cache of the API responses.
+        drop_json_data: whether the returned games release their json_data
+                        once every table has been deserialized.
+        rate_limiter: optional limiter of the rate of the requests.
+        retry_policy: policy deciding the retries of failed requests.
+        maxlag: optional maximum replication lag in seconds above which the
+                server answers with a maxlag error, retried by the retry policy.
+        store_id_index: page IDs of the games found for store IDs, by store
+                        ("steam", "gog") and store ID, filled by
+                        get_games_by_store_ids.
+        offline_index: optional local index of the games used by search.
+        observers: observers to which the requests, cache lookups and
+                   decoding of responses are reported.
     """
     API_URL = "https://www.pcgamingwiki.com/w/api.php"
+    MAX_LIMIT = 500
+    DEFAULT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60)
+    DEFAULT_TIMEOUT = httpx.Timeout(30, connect=10)
+    MAX_BATCH_SIZE = 50
+    STORE_ID_FIELDS = {
+        'steam': 'Steam_AppID',
+        'gog': 'GOGcom_ID',
+    }
+
+    def __init__(self, cache: Cache|None = None, drop_json_data: bool = False,
+                       rate_limiter: RateLimiter|None = None,
+                       retry_policy: RetryPolicy|None = None,
+                       maxlag: int|None = None,
+                       offline_index: OfflineIndex|str|None = None,
+                       observers: Sequence[Observer] = (),
+                       limits: httpx.Limits|None = None,
+                       timeout: httpx.Timeout|float|None = None,
+                       http2: bool = False,
+                       compression: bool = True,
+                       transport: httpx.BaseTransport|None = None,
+                       async_transport: httpx.AsyncBaseTransport|None = None,
+                       coalesce: bool = True,
+                       batch_window: float|None = None):
+        """
+        Constructor for the API client.
+
+        Parameters:
+            cache: cache in which to store the API responses, for instance
+                   a pcgw_api.MemoryCache or a pcgw_api.SQLiteCache.
+            drop_json_data: whether the returned games release their json_data
+                            once every table has been deserialized.
+            rate_limiter: limiter of the rate of the requests, which can be
+                          shared between several clients.
+            retry_policy: policy deciding the retries of failed requests,
+                          a default RetryPolicy if None.
+            maxlag: maximum replication lag in seconds tolerated by the requests.
+            offline_index: local index of the games, or path of its database,
+                           searched before the API. See OfflineIndex.build
+                           to populate it.
+            observers: observers of the activity of the client, such as
+                       pcgw_api.observers.PrometheusObserver.
+            limits: limits of the pool of connections (maximum number of
+                    connections, of idle connections kept alive and their
+                    expiry), DEFAULT_LIMITS if None.
+            timeout: timeouts of the requests, in seconds, DEFAULT_TIMEOUT if None.
+            http2: whether to use HTTP/2 when the server supports it, which
+                   requires the h2 package (pip install pcgw_api[http2]).
+            compression: whether to accept compressed responses: gzip and
+                         deflate, and brotli and zstd when the brotli and
+                         zstandard packages are installed.
+            transport: transport of the synchronous requests, replacing the
+                       default HTTP transport (limits and http2 then being
+                       ignored), for instance a httpx.MockTransport.
+            async_transport: transport of the asynchronous requests.
+            coalesce: whether identical requests made concurrently by several
+                      threads or tasks share a single request to the API.
+            batch_window: if set, the calls of get_game by page ID made by
+                          several threads or tasks within batch_window seconds
+                          are grouped into a single get_games request (of at
+                          most MAX_BATCH_SIZE games), each call being delayed
+                          by up to batch_window seconds.
+        """
+        self.cache = cache
+        self.drop_json_data = drop_json_data
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.maxlag = maxlag
+        self.store_id_index: dict[str, dict[int, list[int]]] = {store: {} for store in self.STORE_ID_FIELDS}
+        if isinstance(offline_index, str):
+            offline_index = OfflineIndex(offline_index)
+        self.offline_index = offline_index
+        self.observers = list(observers)
+        self._facets: dict[tuple[str, str], tuple[float, dict[str|None, int]]] = {}
+        options = {
+            'limits' : limits or self.DEFAULT_LIMITS,
+            'timeout': self.DEFAULT_TIMEOUT if timeout is None else timeout,
+            'http2'  : http2,
+        }
+        if not compression:
+            options['headers'] = {'Accept-Encoding': 'identity'}
+        self.async_http_client = httpx.AsyncClient(transport=async_transport, **options)
+        self.http_client = httpx.Client(transport=transport, **options)
+        self._async_used = False
+        self._single_flight = SingleFlight() if coalesce else None
+        self._async_single_flight = AsyncSingleFlight() if coalesce else None
+        self._batcher = None
+        self._async_batcher = None
+        if batch_window is not None:
+            self._batcher = MicroBatcher(self._get_game_batch, batch_window, self.MAX_BATCH_SIZE)
+            self._async_batcher = AsyncMicroBatcher(self._async_get_game_batch, batch_window,
+                                                    self.MAX_BATCH_SIZE)
+
+    def close(self):
+        """
+        Closes the connections of the synchronous requests.
+
+        The connections of the asynchronous requests belong to the event loop
+        that opened them and can only be closed by aclose (or by leaving an
+        async with block), a ResourceWarning is emitted if asynchronous
+        requests were made and aclose has not been called.
+        """
+        self.http_client.close()
+        if self._async_used and not self.async_http_client.is_closed:
+            warnings.warn('the connections of the asynchronous requests of the PCGW client are not '
+                          'closed, use aclose or async with', ResourceWarning, stacklevel=2)
+
+    async def aclose(self):
+        """
+        Closes the connections of the asynchronous requests. Leaving an
+        async with block closes the connections of both kinds of requests.
+        """
+        await self.async_http_client.aclose()
+
+    def __enter__(self) -> "PCGW":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self) -> "PCGW":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+        self.close()
+
+    def _send(self, params: dict, headers: dict[str, str]|None = None,
+                    stream: bool = False) -> tuple[httpx.Response, float, int]:
+        """
+        Sends a request to the API under the rate limiter, retrying it
+        according to the retry policy. With stream, the body of the response
+        is not read and the response must be closed by the caller.
+
+        Returns:
+            The response, the time.perf_counter() value when the request
+            started and the number of retries.
+
+        Raises:
+            httpx.HTTPStatusError: if the response still has an error status
+                                   once the retries are exhausted.
+        """
+        if self.maxlag is not None:
+            params = {**params, 'maxlag': self.maxlag}
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                response = self.http_client.send(
+                        self.http_client.build_request('POST', self.API_URL, data=params, headers=headers),
+                        stream=stream)
+            except httpx.TransportError as e:
+                if (delay := self.retry_policy.get_delay(attempt)) is None:
+                    self._notify('on_request', make_request_event(params, None, start, attempt, e))
+                    raise
+            else:
+                if (delay := self.retry_policy.get_delay(attempt, response)) is None:
+                    if response.is_error:
+                        response.close()
+                        self._notify('on_request', make_request_event(params, response, start, attempt))
+                        response.raise_for_status()
+                    return response, start, attempt
+                response.close()
+                if self.rate_limiter:
+                    self.rate_limiter.pause(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    async def _async_send(self, params: dict, headers: dict[str, str]|None = None,
+                                stream: bool = False) -> tuple[httpx.Response, float, int]:
+        """
+        Sends a request to the API under the rate limiter, retrying it
+        according to the retry policy, asynchronous version.
+        """
+        if self.maxlag is not None:
+            params = {**params, 'maxlag': self.maxlag}
+        start = time.perf_counter()
+        attempt = 0
+        self._async_used = True
+        while True:
+            if self.rate_limiter:
+                await self.rate_limiter.async_acquire()
+            try:
+                response = await self.async_http_client.send(
+                        self.async_http_client.build_request('POST', self.API_URL, data=params, headers=headers),
+                        stream=stream)
+            except httpx.TransportError as e:
+                if (delay := self.retry_policy.get_delay(attempt)) is None:
+                    self._notify('on_request', make_request_event(params, None, start, attempt, e))
+                    raise
+            else:
+                if (delay := self.retry_policy.get_delay(attempt, response)) is None:
+                    if response.is_error:
+                        await response.aclose()
+                        self._notify('on_request', make_request_event(params, response, start, attempt))
+                        response.raise_for_status()
+                    return response, start, attempt
+                await response.aclose()
+                if self.rate_limiter:
+                    self.rate_limiter.pause(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _post(self, params: dict, headers: dict[str, str]|None = None) -> httpx.Response:
+        """
+        Sends a request to the API and reports it to the observers.
+        """
+        response, start, retries = self._send(params, headers)
+        if self.observers:
+            self._notify('on_request', make_request_event(params, response, start, retries))
+        return response
+
+    async def _async_post(self, params: dict, headers: dict[str, str]|None = None) -> httpx.Response:
+        """
+        Sends a request to the API and reports it to the observers,
+        asynchronous version.
+        """
+        response, start, retries = await self._async_send(params, headers)
+        if self.observers:
+            self._notify('on_request', make_request_event(params, response, start, retries))
+        return response
+
+    def _notify(self, method: str, *args):
+        """
+        Calls a method of every observer, logging the exceptions they raise
+        instead of letting them fail the request.
+        """
+        for observer in self.observers:
+            try:
+                getattr(observer, method)(*args)
+            except Exception:
+                logger.exception('observer %r failed in %s', observer, method)
+
+    def _lookup(self, params: dict) -> tuple[dict|None, dict[str, str]]:
+        """
+        Looks up the response to a request in the cache and reports the
+        lookup to the observers.
+        """
+        value, headers = self.cache.lookup(params)
+        if self.observers:
+            self._notify('on_cache', get_endpoint(params), value is not None)
+        return value, headers
+
+    def _stream_cargoquery(self, params: dict) -> Iterator[dict]:
+        """
+        Sends a request to the API and yields the rows of the response as
+        they are received. A fresh response from the cache is used if there
+        is one, but streamed responses are not stored in the cache.
+        """
+        if self.cache is not None:
+            value, _ = self._lookup(params)
+            if value is not None:
+                yield from (j.get('title', {}) for j in value.get('cargoquery', []))
+                return
+        response, start, retries = self._send(params, stream=True)
+        rows = 0
+        duration = 0.
+        try:
+            parser = CargoqueryParser()
+            for text in response.iter_text():
+                decode_start = time.perf_counter()
+                parsed = parser.feed(text)
+                duration += time.perf_counter() - decode_start
+                rows += len(parsed)
+                yield from parsed
+        finally:
+            response.close()
+            if self.observers:
+                self._notify('on_request', make_request_event(params, response, start, retries))
+                self._notify('on_decode', DecodeEvent(get_endpoint(params), 'json', rows, duration))
+
+    def _stream_cargoquery_pages(self, params: dict) -> Iterator[dict]:
+        """
+        Yields the rows of a request ordered by page ID as they are received,
+        requesting them by pages of MAX_LIMIT rows.
+        """
+        offset = 0
+        while True:
+            n_rows = 0
+            for row in self._stream_cargoquery({**params, 'order_by': 'Infobox_game._pageID',
+                                                'limit': self.MAX_LIMIT, 'offset': offset}):
+                n_rows += 1
+                yield row
+            if n_rows < self.MAX_LIMIT:
+                return
+            offset += n_rows
+
+    async def _async_stream_cargoquery(self, params: dict) -> AsyncIterator[dict]:
+        """
+        Sends a request to the API and yields the rows of the response as
+        they are received, asynchronous version.
+        """
+        if self.cache is not None:
+            value, _ = self._lookup(params)
+            if value is not None:
+                for j in value.get('cargoquery', []):
+                    yield j.get('title', {})
+                return
+        response, start, retries = await self._async_send(params, stream=True)
+        rows = 0
+        duration = 0.
+        try:
+            parser = CargoqueryParser()
+            async for text in response.aiter_text():
+                decode_start = time.perf_counter()
+                parsed = parser.feed(text)
+                duration += time.perf_counter() - decode_start
+                rows += len(parsed)
+                for row in parsed:
+                    yield row
+        finally:
+            await response.aclose()
+            if self.observers:
+                self._notify('on_request', make_request_event(params, response, start, retries))
+                self._notify('on_decode', DecodeEvent(get_endpoint(params), 'json', rows, duration))
 
-    def __init__(self):
-        self.async_http_client = httpx.AsyncClient()
-        self.http_client = httpx.Client()
-        j = {k:v for k,v in json.load(open(TABLES_INFO_FILENAME)).items() if k not in ('L10n','Infobox_game_engine')}
-        self._game_req_tables = list(j.keys())
-        self._game_req_joins = [f'Infobox_game._pageID={table}._pageID' for table in j
-                                if table not in ('Infobox_game',)]
-        self._game_req_fields = [
-            'Infobox_game._pageName=Page,'
-            'Infobox_game._pageID=PageID,'
-        ]
-        for table in j:
-            for field in j[table]:
-                self._game_req_fields.append(f'{table}.{field}')
-
-    def _build_search_request(self, query: str) -> dict:
+    async def _async_stream_cargoquery_pages(self, params: dict) -> AsyncIterator[dict]:
+        """
+        Yields the rows of a request ordered by page ID as they are received,
+        requesting them by pages of MAX_LIMIT rows, asynchronous version.
+        """
+        offset = 0
+        while True:
+            n_rows = 0
+            async for row in self._async_stream_cargoquery({**params, 'order_by': 'Infobox_game._pageID',
+                                                            'limit': self.MAX_LIMIT, 'offset': offset}):
+                n_rows += 1
+                yield row
+            if n_rows < self.MAX_LIMIT:
+                return
+            offset += n_rows
+
+    def _cargoquery(self, params: dict) -> dict:
+        """
+        Sends a request to the API, going through the cache if there is one,
+        or waits for the response of the identical request in flight.
+        """
+        if self._single_flight is None:
+            return self._fetch_cargoquery(params)
+        return self._single_flight.do(tuple(sorted(params.items())), lambda: self._fetch_cargoquery(params))
+
+    async def _async_cargoquery(self, params: dict) -> dict:
+        """
+        Sends a request to the API, going through the cache if there is one,
+        or waits for the response of the identical request in flight,
+        asynchronous version.
+        """
+        if self._async_single_flight is None:
+            return await self._async_fetch_cargoquery(params)
+        return await self._async_single_flight.do(tuple(sorted(params.items())),
+                                                  lambda: self._async_fetch_cargoquery(params))
+
+    def _fetch_cargoquery(self, params: dict) -> dict:
+        if self.cache is None:
+            return self._decode(params, self._post(params))
+        value, headers = self._lookup(params)
+        if value is not None:
+            return value
+        value = self._decode(params, self._post(params, headers))
+        if value is None:
+            value = self._decode(params, self._post(params))
+        return value
+
+    async def _async_fetch_cargoquery(self, params: dict) -> dict:
+        if self.cache is None:
+            return self._decode(params, await self._async_post(params))
+        value, headers = self._lookup(params)
+        if value is not None:
+            return value
+        value = self._decode(params, await self._async_post(params, headers))
+        if value is None:
+            value = self._decode(params, await self._async_post(params))
+        return value
+
+    def _decode(self, params: dict, response: httpx.Response) -> dict|None:
+        """
+        Decodes a response, storing it in the cache if there is one, and
+        reports the decoding to the observers. Returns None when the response
+        is a 304 whose cache entry has been evicted (see Cache.store).
+
+        Raises:
+            PCGWAPIError: if the response is an error of the API.
+        """
+        start = time.perf_counter()
+        value = response.json() if self.cache is None else self.cache.store(params, response)
+        if value is None:
+            return None
+        raise_for_error(value)
+        if self.observers:
+            self._notify('on_decode', DecodeEvent(get_endpoint(params), 'json',
+                                                  len(value.get('cargoquery', ())), time.perf_counter() - start))
+        return value
+
+    @staticmethod
+    def _projection(tables: Sequence[str]|None, fields: Sequence[str]|None) -> GameProjection:
+        return get_schema().game_projection(None if tables is None else tuple(tables),
+                                            None if fields is None else tuple(fields))
+
+    def _build_game_request(self, where: str, projection: GameProjection) -> dict:
+        params = {
+            'action' : 'cargoquery',
+            'where'  : where,
+            'tables' : projection.tables,
+            'fields' : projection.fields,
+            'format' : 'json',
+        }
+        if projection.join_on:
+            params['join_on'] = projection.join_on
+        return params
+
+    def _make_game(self, j: dict, projection: GameProjection) -> Game:
+        return Game(j, self, self.drop_json_data, projection.loaded_tables)
+
+    def _make_games(self, rows: Iterable[dict], projection: GameProjection,
+                          endpoint: str = 'cargoquery:Infobox_game') -> list[Game]:
+        """
+        Builds the games of the rows of a response and reports their
+        construction to the observers.
+        """
+        if not self.observers:
+            return [self._make_game(j, projection) for j in rows]
+        start = time.perf_counter()
+        games = [self._make_game(j, projection) for j in rows]
+        self._notify('on_decode', DecodeEvent(endpoint, 'games', len(games), time.perf_counter() - start))
+        return games
+
+    def _build_search_request(self, query: str, projection: GameProjection) -> dict:
+        return self._build_game_request(f'Infobox_game._pageName LIKE {quote(f"%{query}%")}', projection)
+
+    def _handle_search_response(self, response: dict, projection: GameProjection) -> list[Game]:
+        return self._make_games([j.get('title', {}) for j in response.get('cargoquery', [])], projection)
+
+    def _frame_fields(self, projection: GameProjection) -> list[tuple[str, FieldSpec]]:
+        """
+        Returns the column names and field specifications of the fields
+        requested by a projection.
+        """
+        requested: dict[str, set[str]] = {}
+        for field in projection.fields.split(','):
+            table, _, name = field.partition('.')
+            if '=' not in name:
+                requested.setdefault(table, set()).add(name.replace('_', ' '))
+        return [(f'{attr}.{spec.name}', spec)
+                for attr, table in Game.TABLES.items() if table in requested
+                for spec in getattr(tables, table).FIELDS if spec.key in requested[table]]
+
+    def _search_offline_index(self, query: str, projection: GameProjection) -> list[Game]:
+        if self.offline_index is None:
+            return []
+        return self._make_games(self.offline_index.search(query), projection, 'offline_index')
+
+    def _build_page_request(self, after_page_id: int, limit: int, projection: GameProjection) -> dict:
         return {
-            'action': 'cargoquery',
-            'where': f'Infobox_game._pageName LIKE "%{query}%"',
-            'tables' : ','.join(self._game_req_tables),
-            'join_on': ','.join(self._game_req_joins),
-            'fields' : ','.join(self._game_req_fields),
-            'format': 'json',
+            **self._build_game_request(f'Infobox_game._pageID>{after_page_id}', projection),
+            'order_by': 'Infobox_game._pageID',
+            'limit'   : limit,
         }
-    
-    def _handle_search_response(self, response: dict) -> list[Game]:
-        return [Game(j.get('title', {}), self) for j in response.get('cargoquery', [])]
 
-    def search(self, query: str) -> list[Game]:
+    def _handle_page_response(self, response: dict, after_page_id: int,
+                                    projection: GameProjection) -> tuple[list[Game], int]:
+        """
+        Deserializes a page of results ordered by page ID, discarding the rows
+        at or before after_page_id and the duplicated rows of a same page.
+
+        Returns:
+            The list of games and the number of rows in the response.
+        """
+        rows = response.get('cargoquery', [])
+        games = []
+        for game in self._make_games([j.get('title', {}) for j in rows], projection):
+            if game.id is not None and game.id > after_page_id:
+                games.append(game)
+                after_page_id = game.id
+        return games, len(rows)
+
+    def search(self, query: str, tables: Sequence[str]|None = None,
+                                 fields: Sequence[str]|None = None) -> list[Game]:
         """
         Searches PCGamingWiki.
 
         The search returns the games with name containing the query string,
-        the API request using the SQL LIKE operator.
+        the API request using the SQL LIKE operator. If the client has an
+        offline index, it is searched first and the API is only requested
+        when the index has no result.
 
         Parameters:
             query: query string.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
 
         Returns:
             A list of results deserialized into Game objects.
         """
-        return self._handle_search_response(self.http_client.post(
-                                            self.API_URL,
-                                            data=self._build_search_request(query))
-                                    .json())
+        projection = self._projection(tables, fields)
+        if results := self._search_offline_index(query, projection):
+            return results
+        return self._handle_search_response(self._cargoquery(self._build_search_request(query, projection)),
+                                            projection)
 
-    async def async_search(self, query: str) -> list[Game]:
+    async def async_search(self, query: str, tables: Sequence[str]|None = None,
+                                             fields: Sequence[str]|None = None) -> list[Game]:
         """
         Searches PCGamingWiki, asynchronous version.
 
         The search returns the games with name containing the query string,
-        the API request using the SQL LIKE operator.
+        the API request using the SQL LIKE operator. If the client has an
+        offline index, it is searched first and the API is only requested
+        when the index has no result.
 
         Parameters:
             query: query string.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
 
         Returns:
             A list of results deserialized into Game objects.
         """
-        return self._handle_search_response((await self.async_http_client.post(
-                                                self.API_URL,
-                                                data=self._build_search_request(query))
-                                   ).json())
+        projection = self._projection(tables, fields)
+        if results := self._search_offline_index(query, projection):
+            return results
+        return self._handle_search_response(await self._async_cargoquery(self._build_search_request(query, projection)),
+                                            projection)
+
+    def search_stream(self, query: str, tables: Sequence[str]|None = None,
+                                        fields: Sequence[str]|None = None) -> Iterator[Game]:
+        """
+        Searches PCGamingWiki, yielding the results as the response is received.
+
+        Same as search, but the results are requested by pages of MAX_LIMIT
+        rows, ordered by page ID, instead of the 50 rows returned by default,
+        and each response is decoded incrementally, so that the first results
+        are available before the whole response is received and the raw
+        response is never held in memory at once.
+
+        Parameters:
+            query: query string.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            An iterator over the results deserialized into Game objects.
+
+        Raises:
+            PCGWAPIError: if the response is an error of the API.
+        """
+        projection = self._projection(tables, fields)
+        if results := self._search_offline_index(query, projection):
+            yield from results
+            return
+        for j in self._stream_cargoquery_pages(self._build_search_request(query, projection)):
+            yield self._make_game(j, projection)
+
+    async def async_search_stream(self, query: str, tables: Sequence[str]|None = None,
+                                                    fields: Sequence[str]|None = None) -> AsyncIterator[Game]:
+        """
+        Searches PCGamingWiki, yielding the results as the response is received,
+        asynchronous version.
+
+        See search_stream for the description of the parameters.
+
+        Returns:
+            An asynchronous iterator over the results deserialized into Game objects.
+        """
+        projection = self._projection(tables, fields)
+        if results := self._search_offline_index(query, projection):
+            for game in results:
+                yield game
+            return
+        async for j in self._async_stream_cargoquery_pages(self._build_search_request(query, projection)):
+            yield self._make_game(j, projection)
+
+    def search_frame(self, query: str, tables: Sequence[str]|None = None,
+                                       fields: Sequence[str]|None = None) -> GameFrame:
+        """
+        Searches PCGamingWiki, returning the results as columns.
+
+        Same as search, but the rows of the response are decoded directly
+        into the columns of a GameFrame, which can be exported to pandas or
+        Arrow, without building Game objects.
+
+        Parameters:
+            query: query string.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            A GameFrame with a row per result.
+        """
+        projection = self._projection(tables, fields)
+        response = self._cargoquery(self._build_search_request(query, projection))
+        return GameFrame.from_rows([j.get('title', {}) for j in response.get('cargoquery', [])],
+                                   self._frame_fields(projection))
+
+    def query(self, tables: Sequence[str]|None = None,
+                    fields: Sequence[str]|None = None) -> Query:
+        """
+        Starts a query of the games filtered by the API on the values of
+        their fields, for example:
+
+            from pcgw_api.query import API, Input
+            client.query(tables=['Input']).where(
+                Input.controller_hotplugging == Support.TRUE,
+                API.vulkan_versions.holds('1.2'),
+            ).order_by(API.vulkan_versions.desc()).limit(20).all()
+
+        The conditions are compiled into the where clause of the requests,
+        with the values escaped, and the tables of the conditions that are
+        not requested are joined.
+
+        Parameters:
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            A Query, whose games are requested when it is iterated.
+        """
+        return Query(self, tables, fields)
+
+    def iter_all_games(self, after_page_id: int = 0,
+                             page_size: int = MAX_LIMIT,
+                             tables: Sequence[str]|None = None,
+                             fields: Sequence[str]|None = None) -> Iterator[Game]:
+        """
+        Iterates over every game of PCGamingWiki.
+
+        The games are fetched by pages of page_size rows ordered by page ID,
+        each page being requested only when the previous one has been consumed,
+        so that memory usage does not depend on the size of the catalogue.
+        An interrupted iteration can be resumed by passing the ID of the last
+        game received as after_page_id.
+
+        Parameters:
+            after_page_id: only the games with a page ID greater than this one
+                           are returned.
+            page_size: number of rows requested at a time, at most MAX_LIMIT.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            An iterator over Game objects in ascending page ID order.
+
+        Raises:
+            PCGWAPIError: if a page could not be fetched, the games of the
+                          previous pages having been yielded.
+            httpx.HTTPError: if a request failed.
+        """
+        page_size = min(page_size, self.MAX_LIMIT)
+        projection = self._projection(tables, fields)
+        while True:
+            games, n_rows = self._handle_page_response(self._cargoquery(
+                                                self._build_page_request(after_page_id, page_size, projection)),
+                                            after_page_id, projection)
+            yield from games
+            if n_rows < page_size or not games:
+                return
+            after_page_id = games[-1].id
+
+    async def async_iter_all_games(self, after_page_id: int = 0,
+                                         page_size: int = MAX_LIMIT,
+                                         tables: Sequence[str]|None = None,
+                                         fields: Sequence[str]|None = None) -> AsyncIterator[Game]:
+        """
+        Iterates over every game of PCGamingWiki, asynchronous version.
+
+        The games are fetched by pages of page_size rows ordered by page ID,
+        each page being requested only when the previous one has been consumed,
+        so that memory usage does not depend on the size of the catalogue.
+        An interrupted iteration can be resumed by passing the ID of the last
+        game received as after_page_id.
+
+        Parameters:
+            after_page_id: only the games with a page ID greater than this one
+                           are returned.
+            page_size: number of rows requested at a time, at most MAX_LIMIT.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            An asynchronous iterator over Game objects in ascending page ID order.
+        """
+        page_size = min(page_size, self.MAX_LIMIT)
+        projection = self._projection(tables, fields)
+        while True:
+            games, n_rows = self._handle_page_response(await self._async_cargoquery(
+                                                self._build_page_request(after_page_id, page_size, projection)),
+                                            after_page_id, projection)
+            for game in games:
+                yield game
+            if n_rows < page_size or not games:
+                return
+            after_page_id = games[-1].id
 
     def get_game(self, *, page_id: int|None = None,
                           page_name: str|None = None,
                           gog_id: int|None = None,
-                          steam_id: int|None = None) -> Game|None:
+                          steam_id: int|None = None,
+                          tables: Sequence[str]|None = None,
+                          fields: Sequence[str]|None = None) -> Game|None:
         """
         Get information about a game from PCGamingWiki.
 
@@ -200,42 +979,102 @@ class PCGW:
             page_name: name of a PCGamingWiki page.
             gog_id: ID of a GOG.com game.
             steam_id: AppID of a Steam game.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            A Game object or None if the request went wrong.
+        """
+        projection = self._projection(tables, fields)
+        if page_id and self._batcher is not None:
+            return self._batcher.submit(projection, page_id)
+        params = self._build_get_game_request(page_id, page_name, gog_id, steam_id, projection)
+        if params is None:
+            return None
+        return self._handle_get_game_response(self._cargoquery(params), projection)
+
+    async def async_get_game(self, *, page_id: int|None = None,
+                                      page_name: str|None = None,
+                                      gog_id: int|None = None,
+                                      steam_id: int|None = None,
+                                      tables: Sequence[str]|None = None,
+                                      fields: Sequence[str]|None = None) -> Game|None:
+        """
+        Get information about a game from PCGamingWiki, asynchronous version.
+
+        See get_game for the description of the parameters.
 
         Returns:
             A Game object or None if the request went wrong.
         """
+        projection = self._projection(tables, fields)
+        if page_id and self._async_batcher is not None:
+            return await self._async_batcher.submit(projection, page_id)
+        params = self._build_get_game_request(page_id, page_name, gog_id, steam_id, projection)
+        if params is None:
+            return None
+        return self._handle_get_game_response(await self._async_cargoquery(params), projection)
+
+    def _get_game_batch(self, projection: GameProjection, page_ids: list[int]) -> dict[int|str, Game]:
+        """
+        Requests a batch of games of get_game calls grouped by the batcher.
+        """
+        return self._handle_get_games_response(self._get_chunk_rows(page_ids, [], projection),
+                                               page_ids, [], projection)
+
+    async def _async_get_game_batch(self, projection: GameProjection,
+                                          page_ids: list[int]) -> dict[int|str, Game]:
+        """
+        Requests a batch of games of async_get_game calls grouped by the batcher.
+        """
+        return self._handle_get_games_response(await self._async_get_chunk_rows(page_ids, [], projection),
+                                               page_ids, [], projection)
+
+    def _build_get_game_request(self, page_id: int|None, page_name: str|None,
+                                      gog_id: int|None, steam_id: int|None,
+                                      projection: GameProjection) -> dict|None:
         if not page_id and not page_name and not gog_id and not steam_id:
             return None
         else:
             if page_id:
-                req_where = f'Infobox_game._pageID="{page_id}"'
+                req_where = f'Infobox_game._pageID={quote(str(page_id))}'
             elif page_name:
-                req_where = f'Infobox_game._pageName="{page_name}"'
+                req_where = f'Infobox_game._pageName={quote(page_name)}'
             elif gog_id:
-                req_where = f'Infobox_game.GOGcom_ID HOLDS "{gog_id}"'
+                req_where = f'Infobox_game.GOGcom_ID HOLDS {quote(str(gog_id))}'
             else:
-                req_where = f'Infobox_game.Steam_AppID HOLDS "{steam_id}"',
-        params = {
-            'action' : 'cargoquery',
-            'where'  : req_where,
-            'tables' : ','.join(self._game_req_tables),
-            'join_on': ','.join(self._game_req_joins),
-            'fields' : ','.join(self._game_req_fields),
-            'format' : 'json',
-        }
-        response = self.http_client.post(self.API_URL, data=params).json()
+                req_where = f'Infobox_game.Steam_AppID HOLDS {quote(str(steam_id))}'
+        return self._build_game_request(req_where, projection)
+
+    def _handle_get_game_response(self, response: dict, projection: GameProjection) -> Game|None:
         results = [j['title'] for j in response.get('cargoquery', []) if 'title' in j]
         if results:
-            return Game(results[0], self)
+            return self._make_games(results[:1], projection)[0]
 
     def get_games(self, page_ids: Sequence[int] = [],
-                        page_names: Sequence[str] = []) -> dict[int|str, Game]:
+                        page_names: Sequence[str] = [],
+                        tables: Sequence[str]|None = None,
+                        fields: Sequence[str]|None = None,
+                        chunk_size: int = 50,
+                        concurrency: int = 4) -> dict[int|str, Game]:
         """
-        Get information about multiple games from PCGamingWiki in one request.
+        Get information about multiple games from PCGamingWiki.
+
+        The keys are requested chunk_size at a time, with up to concurrency
+        requests running in parallel threads. A request whose response
+        reaches the MAX_LIMIT rows of a cargoquery request is split in two,
+        so that no game is missing from the results because of a truncated
+        response.
 
         Parameters:
             page_ids: sequence of IDs of PCGamingWiki pages.
             page_names: sequence of names of PCGamingWiki pages.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+            chunk_size: number of keys per request.
+            concurrency: maximum number of concurrent requests.
 
         Returns:
             A dictionary with the page_ids and page_names from the parameters
@@ -244,31 +1083,523 @@ class PCGW:
         """
         if not page_ids and not page_names:
             return {}
-        params = {
-            'action': 'cargoquery',
-            'where' : ' OR '.join(
-                    [f'Infobox_game._pageName="{nom}"' for nom in page_names] +
-                    [f'Infobox_game._pageID="{id}"' for id in page_ids]
-                    ),
-            'tables' : ','.join(self._game_req_tables),
-            'join_on': ','.join(self._game_req_joins),
-            'fields' : ','.join(self._game_req_fields),
-            'format' : 'json',
+        projection = self._projection(tables, fields)
+        rows = self._get_games_rows(page_ids, page_names, projection, chunk_size, concurrency)
+        return self._handle_get_games_response(rows, page_ids, page_names, projection)
+
+    async def async_get_games(self, page_ids: Sequence[int] = [],
+                                    page_names: Sequence[str] = [],
+                                    tables: Sequence[str]|None = None,
+                                    fields: Sequence[str]|None = None,
+                                    chunk_size: int = 50,
+                                    concurrency: int = 4) -> dict[int|str, Game]:
+        """
+        Get information about multiple games from PCGamingWiki, asynchronous
+        version, the chunks being requested concurrently.
+
+        See get_games for the description of the parameters and return value.
+        """
+        if not page_ids and not page_names:
+            return {}
+        projection = self._projection(tables, fields)
+        semaphore = asyncio.Semaphore(concurrency)
+        chunks = await asyncio.gather(*(self._async_get_chunk_rows(*chunk, projection, semaphore) for chunk in
+                                        self._chunk_keys(page_ids, page_names, chunk_size)))
+        return self._handle_get_games_response([row for rows in chunks for row in rows],
+                                               page_ids, page_names, projection)
+
+    def get_games_frame(self, page_ids: Sequence[int] = [],
+                              page_names: Sequence[str] = [],
+                              tables: Sequence[str]|None = None,
+                              fields: Sequence[str]|None = None,
+                              chunk_size: int = 50,
+                              concurrency: int = 4) -> GameFrame:
+        """
+        Get information about multiple games from PCGamingWiki, returning the
+        results as columns.
+
+        Same as get_games, but the rows of the responses are decoded directly
+        into the columns of a GameFrame without building Game objects. The
+        games that could not be found are absent from the frame.
+
+        Returns:
+            A GameFrame with a row per game found.
+        """
+        projection = self._projection(tables, fields)
+        if not page_ids and not page_names:
+            return GameFrame.from_rows([], self._frame_fields(projection))
+        rows = self._get_games_rows(page_ids, page_names, projection, chunk_size, concurrency)
+        return GameFrame.from_rows(list({row.get('PageID'): row for row in rows}.values()),
+                                   self._frame_fields(projection))
+
+    async def async_get_many(self, keys: Sequence[int|str],
+                                   chunk_size: int = 50,
+                                   concurrency: int = 4,
+                                   tables: Sequence[str]|None = None,
+                                   fields: Sequence[str]|None = None) -> AsyncIterator[tuple[int|str, Game|None]]:
+        """
+        Get information about many games from PCGamingWiki with concurrent requests.
+
+        The keys are split into chunks of chunk_size keys, each chunk being
+        requested with async_get_games, with at most concurrency requests
+        running at the same time.
+
+        Parameters:
+            keys: IDs (int) or names (str) of PCGamingWiki pages.
+            chunk_size: number of keys per request.
+            concurrency: maximum number of concurrent requests.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            An asynchronous iterator over (key, Game) pairs, yielded as the
+            requests complete. The Game is None if the page could not be found.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        async def fetch(chunk: Sequence[int|str]) -> dict[int|str, Game]:
+            async with semaphore:
+                return await self.async_get_games(page_ids=[k for k in chunk if isinstance(k, int)],
+                                                  page_names=[k for k in chunk if isinstance(k, str)],
+                                                  tables=tables, fields=fields)
+        keys = list(dict.fromkeys(keys))
+        tasks = [asyncio.ensure_future(fetch(keys[i:i+chunk_size]))
+                 for i in range(0, len(keys), chunk_size)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for item in (await task).items():
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _chunk_keys(page_ids: Sequence[int], page_names: Sequence[str],
+                    chunk_size: int) -> list[tuple[list[int], list[str]]]:
+        """
+        Splits the keys of get_games, without duplicates, into chunks of
+        chunk_size keys.
+        """
+        keys = [*dict.fromkeys(page_names), *dict.fromkeys(page_ids)]
+        return [([k for k in chunk if isinstance(k, int)], [k for k in chunk if isinstance(k, str)])
+                for chunk in (keys[i:i+chunk_size] for i in range(0, len(keys), chunk_size))]
+
+    def _get_games_rows(self, page_ids: Sequence[int], page_names: Sequence[str],
+                              projection: GameProjection, chunk_size: int, concurrency: int) -> list[dict]:
+        chunks = self._chunk_keys(page_ids, page_names, chunk_size)
+        if len(chunks) == 1 or concurrency <= 1:
+            return [row for chunk in chunks for row in self._get_chunk_rows(*chunk, projection)]
+        with ThreadPoolExecutor(min(concurrency, len(chunks))) as executor:
+            results = executor.map(lambda chunk: self._get_chunk_rows(*chunk, projection), chunks)
+            return [row for rows in results for row in rows]
+
+    def _get_chunk_rows(self, page_ids: list[int], page_names: list[str],
+                              projection: GameProjection) -> list[dict]:
+        """
+        Requests the rows of a chunk of keys of get_games, splitting the chunk
+        in two while the response is truncated. The rows of a single key all
+        belong to the same game, so a truncated response does not lose it.
+        """
+        response = self._cargoquery(self._build_get_games_request(page_ids, page_names, projection))
+        rows = response.get('cargoquery', [])
+        if len(rows) >= self.MAX_LIMIT and len(page_ids) + len(page_names) > 1:
+            half = (len(page_ids) + len(page_names) + 1) // 2
+            return [row for chunk in self._chunk_keys(page_ids, page_names, half)
+                    for row in self._get_chunk_rows(*chunk, projection)]
+        return [j['title'] for j in rows if 'title' in j]
+
+    async def _async_get_chunk_rows(self, page_ids: list[int], page_names: list[str],
+                                          projection: GameProjection,
+                                          semaphore: asyncio.Semaphore|None = None) -> list[dict]:
+        """
+        Requests the rows of a chunk of keys of get_games, splitting the chunk
+        in two while the response is truncated, asynchronous version. Every
+        request, including the ones of the halves, is made under semaphore
+        if given.
+        """
+        params = self._build_get_games_request(page_ids, page_names, projection)
+        if semaphore is None:
+            response = await self._async_cargoquery(params)
+        else:
+            async with semaphore:
+                response = await self._async_cargoquery(params)
+        rows = response.get('cargoquery', [])
+        if len(rows) >= self.MAX_LIMIT and len(page_ids) + len(page_names) > 1:
+            half = (len(page_ids) + len(page_names) + 1) // 2
+            chunks = await asyncio.gather(*(self._async_get_chunk_rows(*chunk, projection, semaphore)
+                                            for chunk in self._chunk_keys(page_ids, page_names, half)))
+            return [row for chunk_rows in chunks for row in chunk_rows]
+        return [j['title'] for j in rows if 'title' in j]
+
+    def _build_get_games_request(self, page_ids: Sequence[int], page_names: Sequence[str],
+                                       projection: GameProjection) -> dict:
+        return {
+            **self._build_game_request(' OR '.join(
+                    [f'Infobox_game._pageName={quote(nom)}' for nom in page_names] +
+                    [f'Infobox_game._pageID={quote(str(id))}' for id in page_ids]
+                    ), projection),
+            'limit': self.MAX_LIMIT,
         }
-        response = self.http_client.post(self.API_URL, data=params).json()
-        results = [Game(j['title'], self) for j in response.get('cargoquery', []) if 'title' in j]
-        mapped_results = {}
+
+    def _handle_get_games_response(self, rows: list[dict], page_ids: Sequence[int],
+                                         page_names: Sequence[str],
+                                         projection: GameProjection) -> dict[int|str, Game]:
+        results = self._make_games(rows, projection)
+        mapped_results: dict[int|str, Game|None] = {}
         for k in page_ids:
             mapped_results[k] = None
         for k in page_names:
             mapped_results[k] = None
         for result in results:
-            if result.id in page_ids:
+            if result.id in mapped_results:
                 mapped_results[result.id] = result
-            elif result.name in page_names:
+            if result.name in mapped_results:
                 mapped_results[result.name] = result
         return mapped_results
 
+    def get_games_by_store_ids(self, steam_ids: Sequence[int] = (),
+                                     gog_ids: Sequence[int] = (),
+                                     chunk_size: int = 50,
+                                     tables: Sequence[str]|None = None,
+                                     fields: Sequence[str]|None = None) -> dict[tuple[str, int], list[Game]]:
+        """
+        Get information about the games corresponding to Steam and GOG.com IDs.
+
+        A store ID can refer to several PCGamingWiki pages, for instance a game
+        and its remaster. The store IDs are resolved chunk_size at a time with
+        HOLDS queries, and the page IDs found are kept in store_id_index so that
+        later resolutions of the same store IDs request the pages directly.
+
+        Parameters:
+            steam_ids: AppIDs of Steam games.
+            gog_ids: IDs of GOG.com games.
+            chunk_size: number of IDs per request.
+            tables: names of the tables to request, every table if None.
+            fields: fields to request in addition to the tables, as
+                    "<table>.<field>" strings.
+
+        Returns:
+            A dictionary with ("steam", id) and ("gog", id) tuples as keys for
+            the IDs from the parameters and the lists of corresponding Game
+            objects as values, empty if no game was found.
+        """
+        if tables is not None or fields is not None:
+            fields = [*(fields or ()), *(f'Infobox_game.{field}' for field in self.STORE_ID_FIELDS.values())]
+        projection = self._projection(tables, fields)
+        games: dict[int, Game] = {}
+        for store, ids in (('steam', steam_ids), ('gog', gog_ids)):
+            index = self.store_id_index[store]
+            unknown = [id for id in dict.fromkeys(ids) if id not in index]
+            for i in range(0, len(unknown), chunk_size):
+                chunk = {str(id): id for id in unknown[i:i+chunk_size]}
+                found: dict[int, list[int]] = {id: [] for id in chunk.values()}
+                for game in self._iter_store_ids_results(store, list(chunk), projection):
+                    games[game.id] = game
+                    for store_id in self._get_store_ids(game, store):
+                        if store_id in chunk and game.id not in found[chunk[store_id]]:
+                            found[chunk[store_id]].append(game.id)
+                index.update(found)
+        page_ids = [page_id for store, ids in (('steam', steam_ids), ('gog', gog_ids))
+                    for id in ids for page_id in self.store_id_index[store][id]
+                    if page_id not in games]
+        page_ids = list(dict.fromkeys(page_ids))
+        for i in range(0, len(page_ids), chunk_size):
+            for page_id, game in self.get_games(page_ids=page_ids[i:i+chunk_size],
+                                                tables=tables, fields=fields).items():
+                if game is not None:
+                    games[page_id] = game
+        results: dict[tuple[str, int], list[Game]] = {}
+        for store, ids in (('steam', steam_ids), ('gog', gog_ids)):
+            for id in ids:
+                id_games = results.setdefault((store, id), [])
+                id_games.extend(games[page_id] for page_id in self.store_id_index[store][id]
+                                if page_id in games and games[page_id] not in id_games)
+        return results
+
+    def _iter_store_ids_results(self, store: str, ids: Sequence[str],
+                                      projection: GameProjection) -> Iterator[Game]:
+        """
+        Requests the games holding the given store IDs, following the pages
+        of results.
+        """
+        field = self.STORE_ID_FIELDS[store]
+        offset = 0
+        while True:
+            params = {
+                **self._build_game_request(' OR '.join(f'Infobox_game.{field} HOLDS {quote(str(id))}' for id in ids),
+                                           projection),
+                'order_by': 'Infobox_game._pageID',
+                'limit'   : self.MAX_LIMIT,
+                'offset'  : offset,
+            }
+            rows = self._cargoquery(params).get('cargoquery', [])
+            for game in self._make_games([j.get('title', {}) for j in rows], projection):
+                if game.id is not None:
+                    yield game
+            if len(rows) < self.MAX_LIMIT:
+                return
+            offset += len(rows)
+
+    def _get_store_ids(self, game: Game, store: str) -> set[str]:
+        value = (game.json_data or {}).get(self.STORE_ID_FIELDS[store].replace('_', ' ')) or ''
+        return {id.strip() for id in value.split(',')}
+
+    def changed_since(self, timestamp: datetime.datetime) -> set[int]:
+        """
+        Get the IDs of the pages created, modified, moved or deleted since a
+        given time.
+
+        The IDs are obtained from the recent changes of the wiki, for the
+        edits and creations, and from its logs, for the deletions, moves and
+        restorations, which only go back a limited time (90 days by default
+        on MediaWiki for the recent changes).
+
+        Parameters:
+            timestamp: time from which the changes are considered, assumed to
+                       be in UTC if it has no timezone.
+
+        Returns:
+            The set of IDs of the pages changed since timestamp.
+        """
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        start = timestamp.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        page_ids = set()
+        for change in self._iter_query_list('recentchanges', {
+                'list'       : 'recentchanges',
+                'rcstart'    : start,
+                'rcdir'      : 'newer',
+                'rcnamespace': 0,
+                'rctype'     : 'edit|new',
+                'rcprop'     : 'ids',
+                'rclimit'    : 'max',
+                }):
+            if change.get('pageid'):
+                page_ids.add(change['pageid'])
+        for event in self._iter_query_list('logevents', {
+                'list'       : 'logevents',
+                'lestart'    : start,
+                'ledir'      : 'newer',
+                'lenamespace': 0,
+                'leprop'     : 'ids|type',
+                'lelimit'    : 'max',
+                }):
+            # the ID of a deleted page is only kept as logpage
+            page_id = event.get('logpage') or event.get('pageid')
+            if event.get('type') in ('delete', 'move') and page_id:
+                page_ids.add(page_id)
+        return page_ids
+
+    def _iter_query_list(self, key: str, params: dict) -> Iterator[dict]:
+        """
+        Yields the elements of a list of the query action, following the
+        continuations.
+        """
+        params = {'action': 'query', 'format': 'json', **params}
+        while True:
+            response = raise_for_error(self._post(params).json())
+            yield from response.get('query', {}).get(key, [])
+            if 'continue' not in response:
+                return
+            params = {**params, **response['continue']}
+
+    def sync(self, store: OfflineIndex, since: datetime.datetime|None = None,
+                   chunk_size: int = 50) -> set[int]:
+        """
+        Updates a local store of games with the pages changed since its last
+        synchronization.
+
+        The changed pages are fetched with batched requests and added to the
+        store, the pages which are no longer games, such as deleted pages,
+        are removed from it. A page is only removed when a request for it
+        succeeded without returning it, and the store is only updated once
+        every request has succeeded, so that a failed synchronization leaves
+        it untouched.
+
+        Parameters:
+            store: store to update, such as an OfflineIndex, with add and remove
+                   methods and a last_sync attribute holding the time of the
+                   last synchronization.
+            since: time from which the changes are fetched, store.last_sync if None.
+            chunk_size: number of games per request.
+
+        Returns:
+            The set of IDs of the pages changed.
+
+        Raises:
+            ValueError: if since is None and the store was never synchronized.
+            PCGWAPIError: if a request returned an error.
+            httpx.HTTPError: if a request failed.
+        """
+        since = since or store.last_sync
+        if since is None:
+            raise ValueError('the store has never been synchronized, since must be given')
+        started = datetime.datetime.now(datetime.timezone.utc)
+        page_ids = sorted(self.changed_since(since))
+        results: dict[int, Game|None] = {}
+        for i in range(0, len(page_ids), chunk_size):
+            results.update(self.get_games(page_ids=page_ids[i:i+chunk_size]))
+        store.add(game.json_data for game in results.values() if game is not None)
+        store.remove(page_id for page_id, game in results.items() if game is None)
+        store.last_sync = started
+        return set(page_ids)
+
+    def save_snapshot(self, path: str, games: Iterable[Game]|None = None,
+                            tables: Sequence[str]|None = None,
+                            fields: Sequence[str]|None = None) -> int:
+        """
+        Saves games to a snapshot file, which load_snapshot opens almost
+        instantly whatever its size.
+
+        Parameters:
+            path: path of the file, replaced if it exists.
+            games: games to save, every game of PCGamingWiki (fetched with
+                   iter_all_games) if None.
+            tables: names of the tables to request when games is None,
+                    every table if None.
+            fields: fields to request in addition to the tables when games
+                    is None, as "<table>.<field>" strings.
+
+        Returns:
+            The number of games saved.
+
+        Raises:
+            ValueError: if the json_data of a game has been dropped.
+        """
+        if games is None:
+            games = self.iter_all_games(tables=tables, fields=fields)
+            loaded_tables = self._projection(tables, fields).loaded_tables
+        else:
+            games = list(games)
+            loaded_tables = None
+            if games and all(game.loaded_tables is not None for game in games):
+                loaded_tables = frozenset().union(*(game.loaded_tables for game in games))
+        def rows():
+            for game in games:
+                if game.json_data is None:
+                    raise ValueError(f'the json_data of game "{game}" has been dropped')
+                yield game.json_data
+        return write_snapshot(path, rows(), loaded_tables)
+
+    def load_snapshot(self, path: str) -> Snapshot:
+        """
+        Opens a snapshot file written by save_snapshot.
+
+        The file is memory-mapped and the games are built on first access,
+        with this client to fetch their association tables.
+
+        Parameters:
+            path: path of the snapshot file.
+
+        Returns:
+            A Snapshot, a mapping of the page IDs to the games.
+
+        Raises:
+            ValueError: if the file is not a snapshot of a supported version.
+        """
+        return Snapshot(path, self, self.drop_json_data)
+
+    def prefetch_associations(self, games: Sequence[Game],
+                                    tables: Sequence[str] = ('L10n', 'Infobox_game_engine'),
+                                    chunk_size: int = 100):
+        """
+        Fetches the association tables data of many games at once.
+
+        Instead of one request per game and table as with Game.get_languages
+        and Game.get_engines, the rows of each association table are requested
+        for chunk_size games at a time, and the corresponding attributes of
+        the games (languages, engines) are populated.
+
+        Parameters:
+            games: games to populate.
+            tables: association tables to fetch, among the keys of
+                    Game.ASSOCIATION_TABLES.
+            chunk_size: number of games per request.
+        """
+        games_by_id: dict[int, list[Game]] = {}
+        for game in games:
+            if game.id is not None:
+                games_by_id.setdefault(game.id, []).append(game)
+        page_ids = list(games_by_id)
+        for table in tables:
+            for i in range(0, len(page_ids), chunk_size):
+                chunk = page_ids[i:i+chunk_size]
+                rows: dict[int, list[dict]] = {page_id: [] for page_id in chunk}
+                offset = 0
+                while n_rows := self._handle_association_response(
+                        self._cargoquery(self._build_association_request(table, chunk, offset)), rows):
+                    offset += n_rows
+                self._set_association_tables(table, rows, games_by_id)
+
+    async def async_prefetch_associations(self, games: Sequence[Game],
+                                                tables: Sequence[str] = ('L10n', 'Infobox_game_engine'),
+                                                chunk_size: int = 100,
+                                                concurrency: int = 4):
+        """
+        Fetches the association tables data of many games at once,
+        asynchronous version.
+
+        The chunks of games are requested concurrently, with at most
+        concurrency requests running at the same time. See
+        prefetch_associations for the description of the other parameters.
+        """
+        games_by_id: dict[int, list[Game]] = {}
+        for game in games:
+            if game.id is not None:
+                games_by_id.setdefault(game.id, []).append(game)
+        page_ids = list(games_by_id)
+        semaphore = asyncio.Semaphore(concurrency)
+        async def fetch(table: str, chunk: Sequence[int]):
+            rows: dict[int, list[dict]] = {page_id: [] for page_id in chunk}
+            offset = 0
+            while True:
+                async with semaphore:
+                    response = await self._async_cargoquery(self._build_association_request(table, chunk, offset))
+                if not (n_rows := self._handle_association_response(response, rows)):
+                    break
+                offset += n_rows
+            self._set_association_tables(table, rows, games_by_id)
+        await asyncio.gather(*(fetch(table, page_ids[i:i+chunk_size])
+                               for table in tables
+                               for i in range(0, len(page_ids), chunk_size)))
+
+    def _handle_association_response(self, response: dict, rows: dict[int, list[dict]]) -> int:
+        """
+        Sorts the rows of a response to an association request by page ID.
+
+        Returns:
+            The number of rows of the response if another page of results
+            may follow, 0 otherwise.
+        """
+        page_rows = response.get('cargoquery', [])
+        for j in page_rows:
+            j = j.get('title', {})
+            try:
+                rows[int(j.get('PageID', ''))].append(j)
+            except (KeyError, ValueError):
+                pass
+        return len(page_rows) if len(page_rows) >= self.MAX_LIMIT else 0
+
+    @staticmethod
+    def _set_association_tables(table: str, rows: dict[int, list[dict]],
+                                games_by_id: dict[int, list[Game]]):
+        for page_id, page_id_rows in rows.items():
+            for game in games_by_id[page_id]:
+                game._set_association_table(table, page_id_rows)
+
+    def _build_association_request(self, table: str, page_ids: Sequence[int], offset: int) -> dict:
+        return {
+            'action'  : 'cargoquery',
+            'where'   : f'{table}._pageID IN ({",".join(str(page_id) for page_id in page_ids)})',
+            'tables'  : table,
+            'fields'  : ','.join([f'{table}._pageID=PageID'] +
+                                 [get_schema().get(table).fields_string]),
+            'order_by': f'{table}._pageID,{table}._ID',
+            'limit'   : self.MAX_LIMIT,
+            'offset'  : offset,
+            'format'  : 'json',
+        }
+
     def get_possible_values(self, table: str, attr: str) -> list[str]:
         """
         Get the list of possible values in the PCGamingWiki database 
@@ -281,12 +1612,21 @@ class PCGW:
         Returns:
             The list of possible values for the given field.
         """
-        tables = json.load(open(TABLES_INFO_FILENAME))
-        for field in tables.get(table, []):
-            if field.lower() == attr:
-                break
-        else:
-            field = attr
+        params, field = self._build_possible_values_request(table, attr)
+        return self._handle_possible_values_response(self._cargoquery(params), field)
+
+    async def async_get_possible_values(self, table: str, attr: str) -> list[str]:
+        """
+        Get the list of possible values in the PCGamingWiki database
+        for a given field, asynchronous version.
+
+        See get_possible_values for the description of the parameters.
+        """
+        params, field = self._build_possible_values_request(table, attr)
+        return self._handle_possible_values_response(await self._async_cargoquery(params), field)
+
+    def _build_possible_values_request(self, table: str, attr: str) -> tuple[dict, str]:
+        field = get_schema().get(table).fields_by_attr.get(attr, attr)
         params = {
             'action': 'cargoquery',
             'where' : 'Infobox_game._pageName LIKE "%"',
@@ -297,6 +1637,144 @@ class PCGW:
         }
         if table != 'Infobox_game':
             params['join_on'] = f'Infobox_game._pageID={table}._pageID'
+        return params, field
 
-        j = httpx.get(self.API_URL, params=params).json().get('cargoquery', {})
+    def _handle_possible_values_response(self, response: dict, field: str) -> list[str]:
+        j = response.get('cargoquery', {})
         return [row.get('title',{}).get(field.replace('_',' ')) for row in j]
+
+    def get_facets(self, fields: Sequence[tuple[str, str]], ttl: float = 3600,
+                         concurrency: int = 4) -> dict[tuple[str, str], dict[str|None, int]]:
+        """
+        Get the number of games for each value of several fields of the
+        PCGamingWiki database.
+
+        The fields are requested with concurrent group_by queries, with at
+        most concurrency requests running at the same time. The values of
+        list fields are split on their delimiter, so that each element is
+        counted separately. The counts are kept by the client for ttl seconds.
+
+        Parameters:
+            fields: (table, field) pairs, the field being either the name of
+                    the field in the database or the name of the attribute
+                    of the class from the tables module, for instance
+                    ("Infobox_game", "genres").
+            ttl: time in seconds during which the counts fetched are reused.
+            concurrency: maximum number of concurrent requests.
+
+        Returns:
+            A dictionary with the pairs from the parameters as keys and
+            dictionaries of the number of games by value as values, None
+            being the value of the games without value.
+
+        Raises:
+            ValueError: if a field is not part of the tables.
+        """
+        facets = self._get_cached_facets(fields)
+        missing = [field for field in dict.fromkeys(fields) if field not in facets]
+        if len(missing) <= 1 or concurrency <= 1:
+            results = [self._get_facet(*field) for field in missing]
+        else:
+            with ThreadPoolExecutor(min(concurrency, len(missing))) as executor:
+                results = list(executor.map(lambda field: self._get_facet(*field), missing))
+        return self._store_facets(facets, missing, results, ttl)
+
+    async def async_get_facets(self, fields: Sequence[tuple[str, str]], ttl: float = 3600,
+                                     concurrency: int = 4) -> dict[tuple[str, str], dict[str|None, int]]:
+        """
+        Get the number of games for each value of several fields of the
+        PCGamingWiki database, asynchronous version.
+
+        See get_facets for the description of the parameters and return value.
+        """
+        facets = self._get_cached_facets(fields)
+        missing = [field for field in dict.fromkeys(fields) if field not in facets]
+        semaphore = asyncio.Semaphore(concurrency)
+        async def fetch(table: str, attr: str) -> dict[str|None, int]:
+            async with semaphore:
+                return await self._async_get_facet(table, attr)
+        results = await asyncio.gather(*(fetch(*field) for field in missing))
+        return self._store_facets(facets, missing, results, ttl)
+
+    def _get_cached_facets(self, fields: Sequence[tuple[str, str]]) -> dict[tuple[str, str], dict[str|None, int]]:
+        now = time.monotonic()
+        return {field: dict(self._facets[field][1]) for field in fields
+                if field in self._facets and self._facets[field][0] > now}
+
+    def _store_facets(self, facets: dict[tuple[str, str], dict[str|None, int]],
+                            fields: list[tuple[str, str]], results: list[dict[str|None, int]],
+                            ttl: float) -> dict[tuple[str, str], dict[str|None, int]]:
+        expires = time.monotonic() + ttl
+        for field, counts in zip(fields, results):
+            self._facets[field] = (expires, counts)
+            facets[field] = dict(counts)
+        return facets
+
+    def _get_facet(self, table: str, attr: str) -> dict[str|None, int]:
+        field, delimiter = self._resolve_facet_field(table, attr)
+        counts: dict[str|None, int] = {}
+        offset = 0
+        while n_rows := self._add_facet_rows(counts, self._cargoquery(
+                self._build_facet_request(table, field, offset)), delimiter):
+            offset += n_rows
+        return counts
+
+    async def _async_get_facet(self, table: str, attr: str) -> dict[str|None, int]:
+        field, delimiter = self._resolve_facet_field(table, attr)
+        counts: dict[str|None, int] = {}
+        offset = 0
+        while n_rows := self._add_facet_rows(counts, await self._async_cargoquery(
+                self._build_facet_request(table, field, offset)), delimiter):
+            offset += n_rows
+        return counts
+
+    @staticmethod
+    def _resolve_facet_field(table: str, attr: str) -> tuple[str, str|None]:
+        """
+        Returns the name of a field in the database and its delimiter if it
+        is a list field.
+        """
+        table_schema = get_schema().get(table)
+        field = attr if attr in table_schema.fields else table_schema.fields_by_attr.get(attr.lower())
+        if field is None:
+            raise ValueError(f'unknown field "{table}.{attr}"')
+        key = field.replace('_', ' ')
+        spec = next((spec for spec in getattr(tables, table).FIELDS if spec.key == key), None)
+        return field, spec.delimiter if spec is not None and spec.kind == 'list' else None
+
+    def _build_facet_request(self, table: str, field: str, offset: int) -> dict:
+        params = {
+            'action'  : 'cargoquery',
+            'tables'  : ','.join(dict.fromkeys(['Infobox_game', table])),
+            'fields'  : f'{table}.{field}=Value,COUNT(DISTINCT Infobox_game._pageID)=Count',
+            'group_by': f'{table}.{field}',
+            'order_by': f'{table}.{field}',
+            'limit'   : self.MAX_LIMIT,
+            'offset'  : offset,
+            'format'  : 'json',
+        }
+        if table != 'Infobox_game':
+            params['join_on'] = f'Infobox_game._pageID={table}._pageID'
+        return params
+
+    def _add_facet_rows(self, counts: dict[str|None, int], response: dict, delimiter: str|None) -> int:
+        """
+        Adds the counts of a page of a facet request.
+
+        Returns:
+            The number of rows of the page if it is full, 0 otherwise.
+        """
+        rows = response.get('cargoquery', [])
+        for j in rows:
+            row = j.get('title', {})
+            try:
+                count = int(row.get('Count') or 0)
+            except ValueError:
+                continue
+            value = row.get('Value') or None
+            if value is None or delimiter is None:
+                counts[value] = counts.get(value, 0) + count
+            else:
+                for element in {element.strip() for element in value.split(delimiter)} - {''}:
+                    counts[element] = counts.get(element, 0) + count
+        return len(rows) if len(rows) >= self.MAX_LIMIT else 0
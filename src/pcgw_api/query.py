@@ -0,0 +1,349 @@
+import copy
+import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, Sequence
+
+import pcgw_api.tables as tables
+from pcgw_api.frame import GameFrame
+from pcgw_api.utils import ASSOCIATION_TABLES, SUPPORT_NORMALIZATION, FieldSpec, Support, SupportValue, get_schema
+
+if TYPE_CHECKING:
+    from pcgw_api.pcgw import PCGW, Game
+
+def quote(value: Any) -> str:
+    """
+    Returns a value as a literal of a Cargo where clause: numbers as they
+    are, dates in ISO format and other values as double-quoted strings with
+    backslashes and double quotes escaped.
+
+    Raises:
+        TypeError: value is None, which has no literal (use Column.is_null).
+    """
+    if value is None:
+        raise TypeError('None has no literal in a where clause, use is_null instead')
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        value = value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()
+    value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{value}"'
+
+def escape_like(value: str) -> str:
+    """
+    Escapes the wildcards of a LIKE pattern.
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+class Condition:
+    """
+    Condition of a query on the fields of the tables, compiled into a Cargo
+    where clause. Conditions are combined with & (and), | (or) and ~ (not).
+
+    Attributes:
+        clause: where clause of the condition.
+        tables: names of the tables of the fields of the condition.
+    """
+    def __init__(self, clause: str, tables: frozenset[str]):
+        self.clause = clause
+        self.tables = tables
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return Condition(f'({self.clause}) AND ({other.clause})', self.tables | other.tables)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return Condition(f'({self.clause}) OR ({other.clause})', self.tables | other.tables)
+
+    def __invert__(self) -> "Condition":
+        return Condition(f'NOT ({self.clause})', self.tables)
+
+    def __bool__(self):
+        raise TypeError('conditions must be combined with &, | and ~ instead of and, or and not')
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.clause!r})'
+
+class Column:
+    """
+    Field of a table in a query, comparing to values into Conditions.
+
+    Equality with a Support or SupportValue value matches every raw value
+    normalized into its Support value (any value that is not normalized for Support.OTHER_VALUE), and
+    equality with None or Support.NULL matches the games without value.
+
+    Attributes:
+        table: name of the table.
+        field: name of the field in the database.
+        spec: specification of the field, None for the page ID and name.
+    """
+    def __init__(self, table: str, field: str, spec: FieldSpec|None = None):
+        self.table = table
+        self.field = field
+        self.spec = spec
+
+    @property
+    def name(self) -> str:
+        return f'{self.table}.{self.field}'
+
+    def _condition(self, clause: str) -> Condition:
+        return Condition(clause, frozenset([self.table]))
+
+    def _compare(self, operator: str, value: Any) -> Condition:
+        if isinstance(value, SupportValue):
+            value = value.raw_value
+        elif isinstance(value, Support):
+            value = value.value
+        return self._condition(f'{self.name} {operator} {quote(value)}')
+
+    def __eq__(self, value: Any) -> Condition: # type: ignore[override]
+        if isinstance(value, SupportValue):
+            value = value.support
+        if value is None or value is Support.NULL:
+            return self.is_null()
+        if value is Support.OTHER_VALUE:
+            return ~self.in_(raw_value for raw_value, support in SUPPORT_NORMALIZATION.items()
+                             if support not in (Support.NULL, Support.OTHER_VALUE)) \
+                   & ~self.is_null()
+        if isinstance(value, Support):
+            return self.in_(raw_value for raw_value, support in SUPPORT_NORMALIZATION.items()
+                            if support is value)
+        return self._compare('=', value)
+
+    def __ne__(self, value: Any) -> Condition: # type: ignore[override]
+        if isinstance(value, SupportValue):
+            value = value.support
+        if value is None or value is Support.NULL:
+            return ~self.is_null()
+        if isinstance(value, Support):
+            return ~(self == value) | self.is_null()
+        return self._compare('!=', value)
+
+    def __lt__(self, value: Any) -> Condition:
+        return self._compare('<', value)
+
+    def __le__(self, value: Any) -> Condition:
+        return self._compare('<=', value)
+
+    def __gt__(self, value: Any) -> Condition:
+        return self._compare('>', value)
+
+    def __ge__(self, value: Any) -> Condition:
+        return self._compare('>=', value)
+
+    __hash__ = object.__hash__
+
+    def in_(self, values: Iterable[Any]) -> Condition:
+        """
+        Matches the values equal to one of values.
+        """
+        values = [value.value if isinstance(value, (Support, SupportValue)) else value for value in values]
+        return self._condition(f'{self.name} IN ({", ".join(quote(value) for value in values)})')
+
+    def is_null(self) -> Condition:
+        """
+        Matches the games without value.
+        """
+        return self._condition(f'{self.name} IS NULL')
+
+    def like(self, pattern: str) -> Condition:
+        """
+        Matches the values matching a LIKE pattern, where % matches any
+        string and _ any character.
+        """
+        return self._condition(f'{self.name} LIKE {quote(pattern)}')
+
+    def contains(self, value: str) -> Condition:
+        """
+        Matches the values containing a string.
+        """
+        return self.like(f'%{escape_like(value)}%')
+
+    def startswith(self, value: str) -> Condition:
+        """
+        Matches the values starting with a string.
+        """
+        return self.like(f'{escape_like(value)}%')
+
+    def holds(self, value: Any) -> Condition:
+        """
+        Matches the list fields holding an element equal to value.
+        """
+        return self._condition(f'{self.name} HOLDS {quote(value)}')
+
+    def holds_like(self, pattern: str) -> Condition:
+        """
+        Matches the list fields holding an element matching a LIKE pattern.
+        """
+        return self._condition(f'{self.name} HOLDS LIKE {quote(pattern)}')
+
+    def asc(self) -> str:
+        return f'{self.name} ASC'
+
+    def desc(self) -> str:
+        return f'{self.name} DESC'
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r})'
+
+class TableRef:
+    """
+    Table of the PCGamingWiki database in a query, whose attributes are the
+    Columns of its fields, named like the attributes of the classes of the
+    tables module. page_id and page_name are the ID and name of the pages.
+    """
+    def __init__(self, name: str):
+        self._name = name
+        self._specs = {spec.name: spec for spec in getattr(tables, name).FIELDS}
+        self._fields_by_attr = get_schema().get(name).fields_by_attr
+
+    def __getattr__(self, attr: str) -> Column:
+        if attr == 'page_id':
+            return Column(self._name, '_pageID')
+        if attr == 'page_name':
+            return Column(self._name, '_pageName')
+        field = self._fields_by_attr.get(attr)
+        if field is None:
+            raise AttributeError(f'table "{self._name}" has no field "{attr}"')
+        return Column(self._name, field, self._specs.get(attr))
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._name!r})'
+
+def __getattr__(name: str) -> TableRef:
+    if name in get_schema().tables:
+        return TableRef(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+class Query:
+    """
+    Query of the games matching conditions on the fields of the tables,
+    filtered, ordered and limited by the API, built with PCGW.query.
+
+    The methods where, order_by, limit and offset return a new Query, the
+    games are requested when the query is iterated or with all or frame.
+    """
+    def __init__(self, client: "PCGW", tables: Sequence[str]|None = None,
+                       fields: Sequence[str]|None = None):
+        self._client = client
+        self._projection = client._projection(tables, fields)
+        self._conditions: list[Condition] = []
+        self._order_by: list[str] = []
+        self._limit: int|None = None
+        self._offset = 0
+
+    def _copy(self, **attributes) -> "Query":
+        query = copy.copy(self)
+        query._conditions = list(self._conditions)
+        query._order_by = list(self._order_by)
+        for name, value in attributes.items():
+            setattr(query, name, value)
+        return query
+
+    def where(self, *conditions: Condition) -> "Query":
+        """
+        Returns the query restricted to the games matching every condition.
+        """
+        query = self._copy()
+        query._conditions += conditions
+        return query
+
+    def order_by(self, *columns: Column|str) -> "Query":
+        """
+        Returns the query with results ordered by columns, given as Columns
+        (ascending order) or as the strings returned by Column.asc and
+        Column.desc.
+        """
+        return self._copy(_order_by=[*self._order_by, *(column.name if isinstance(column, Column) else column
+                                                         for column in columns)])
+
+    def limit(self, limit: int|None) -> "Query":
+        """
+        Returns the query limited to limit results, every result if None.
+        """
+        return self._copy(_limit=limit)
+
+    def offset(self, offset: int) -> "Query":
+        """
+        Returns the query skipping the first offset results.
+        """
+        return self._copy(_offset=offset)
+
+    def compile(self) -> str:
+        """
+        Returns the where clause of the query.
+        """
+        return ' AND '.join(f'({condition.clause})' for condition in self._conditions)
+
+    def build_request(self, offset: int, limit: int) -> dict:
+        """
+        Returns the parameters of the request of a page of results, joining
+        the tables of the conditions that are not requested. The results
+        are ordered by page ID last, so that the pages are consistent.
+        """
+        params = self._client._build_game_request(self.compile(), self._projection)
+        if not params['where']:
+            del params['where']
+        joined = params['tables'].split(',')
+        extra = sorted({table for condition in self._conditions for table in condition.tables} - set(joined))
+        if extra:
+            schema = get_schema()
+            params['tables'] = ','.join(joined + extra)
+            params['join_on'] = ','.join(filter(None, [params.get('join_on'),
+                                                       *(schema[table].join_on for table in extra)]))
+        params['order_by'] = ','.join(dict.fromkeys([*self._order_by, 'Infobox_game._pageID']))
+        params['limit'] = limit
+        params['offset'] = offset
+        if any(table in ASSOCIATION_TABLES for table in extra):
+            params['group_by'] = 'Infobox_game._pageID'
+        return params
+
+    def _pages(self) -> Iterator[tuple[int, int]]:
+        """
+        Yields the offset and limit of the requests of the pages of results.
+        """
+        offset = self._offset
+        remaining = self._limit
+        while remaining is None or remaining > 0:
+            limit = self._client.MAX_LIMIT if remaining is None else min(remaining, self._client.MAX_LIMIT)
+            yield offset, limit
+            offset += limit
+            if remaining is not None:
+                remaining -= limit
+
+    def _iter_pages(self) -> Iterator[list[dict]]:
+        for offset, limit in self._pages():
+            rows = self._client._cargoquery(self.build_request(offset, limit)).get('cargoquery', [])
+            yield [j.get('title', {}) for j in rows]
+            if len(rows) < limit:
+                return
+
+    def __iter__(self) -> Iterator["Game"]:
+        for rows in self._iter_pages():
+            yield from self._client._make_games(rows, self._projection)
+
+    async def __aiter__(self) -> AsyncIterator["Game"]:
+        for offset, limit in self._pages():
+            rows = (await self._client._async_cargoquery(self.build_request(offset, limit))).get('cargoquery', [])
+            for game in self._client._make_games([j.get('title', {}) for j in rows], self._projection):
+                yield game
+            if len(rows) < limit:
+                return
+
+    def all(self) -> list["Game"]:
+        """
+        Requests the games matching the query.
+        """
+        return list(self)
+
+    async def async_all(self) -> list["Game"]:
+        """
+        Requests the games matching the query, asynchronous version.
+        """
+        return [game async for game in self]
+
+    def frame(self) -> GameFrame:
+        """
+        Requests the games matching the query, returning the results as
+        columns as in PCGW.search_frame.
+        """
+        return GameFrame.from_rows([row for rows in self._iter_pages() for row in rows], self._client._frame_fields(self._projection))
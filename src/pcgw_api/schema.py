@@ -0,0 +1,315 @@
+#!/bin/env python
+
+import argparse
+import asyncio
+import json
+import os
+import re
+
+from pcgw_api.cache import SQLiteCache
+from pcgw_api.pcgw import PCGW
+from pcgw_api.throttling import RateLimiter
+from pcgw_api.utils import TABLES_INFO_FILENAME
+
+PYTHON_TABLES_FILENAME = os.path.join(os.path.dirname(__file__), "tables.py")
+DEFAULT_CACHE_FILENAME = os.path.join(os.path.expanduser('~'), '.cache', 'pcgw_api', 'schema.db')
+
+TABLES = (
+    'API',
+    'Audio',
+    'Availability',
+    'Cloud',
+    'Infobox_game',
+    'Infobox_game_engine',
+    'Input',
+    'L10n',
+    'Middleware',
+    'Multiplayer',
+    'Tags',
+    'VR_support',
+    'Video',
+    'XDG',
+)
+
+SUPPORT_VALUES = {'null', 'unknown', 'n/a', 'false', 'limited', 'hackable', 'true', 'complete', 'always on'}
+
+FORCED_TYPES = {
+    'Multiplayer': {
+        'Local players': {'type':'int', 'post_processing':'int'},
+        'LAN players': {'type':'int', 'post_processing':'int'},
+        'Online players': {'type':'int', 'post_processing':'int'},
+    },
+    'Cloud': {
+        'Steam': {'type': 'Support', 'post_processing': ''},
+    },
+    'Input': {
+        'Controller support level': {'type': 'Support', 'post_processing': ''},
+        'Controller hotplugging': {'type': 'Support', 'post_processing': ''},
+    },
+    'L10n': {
+        'Interface': {'type': 'Support', 'post_processing': ''},
+        'Audio': {'type': 'Support', 'post_processing': ''},
+        'Subtitles': {'type': 'Support', 'post_processing': ''},
+    },
+    'Video': {
+        'Anisotropic filtering': {'type': 'Support', 'post_processing': ''},
+        'Antialiasing': {'type': 'Support', 'post_processing': ''},
+    },
+    'XDG': {
+        'Supported': {'type': 'Support', 'post_processing': ''},
+    },
+}
+
+PYTHON_TABLES_HEADER = '''
+import datetime
+from sys import intern
+
+from pcgw_api.utils import FieldSpec, SupportValue, Table
+'''
+
+_CLASS = re.compile(r'^class (\w+)\(Table\):$', re.M)
+_ANY_ANNOTATION = re.compile(r'^    \w+: Any\b', re.M)
+_FIELD_SPEC = re.compile(r'^ +(FieldSpec\("([^"]*)", "([^"]*)", "(\w+)",.*\)),$', re.M)
+
+class Field:
+    """
+    Field of a table as described by a cargofields response, and the
+    corresponding attribute of the generated class.
+    """
+    def __init__(self, key: str, j: dict, table: str):
+        self.query_key = key
+        self.key = key.replace('_', ' ')
+        self.name = key.lower()
+
+        self.type = {
+            'String' : 'str',
+            'URL' : 'str',
+            'Page' : 'str',
+            'File' : 'str',
+            'Wikitext' : 'str',
+            'Date' : 'datetime.datetime',
+            }.get(j['type'], 'Any')
+
+        self.post_processing = {
+            'Date' : 'datetime.datetime.fromisoformat',
+            }.get(j['type'], 'str')
+
+        if table in FORCED_TYPES and self.key in FORCED_TYPES[table]:
+            self.type = FORCED_TYPES[table][self.key]['type']
+            self.post_processing = FORCED_TYPES[table][self.key]['post_processing']
+
+        self.is_list = 'isList' in j
+        self.delimiter = j.get('delimiter')
+        if self.is_list and self.post_processing == 'str':
+            # list elements such as store names or genres are repeated across games
+            self.post_processing = 'intern'
+
+    @property
+    def kind(self) -> str:
+        if self.is_list:
+            return 'list'
+        return {'str': 'str', 'Support': 'support'}.get(self.type, 'value')
+
+    @property
+    def spec(self) -> str:
+        delimiter = f'"{self.delimiter}"' if self.is_list else 'None'
+        post_processing = self.post_processing if self.kind in ('list', 'value') else 'None'
+        return f'FieldSpec("{self.name}", "{self.key}", "{self.kind}", {delimiter}, {post_processing})'
+
+    @property
+    def annotation(self) -> str:
+        if self.kind == 'list':
+            return f'tuple[{self.type}, ...]'
+        if self.kind == 'support':
+            return 'SupportValue'
+        return f'{self.type}|None'
+
+    @property
+    def may_be_support(self) -> bool:
+        """
+        Whether the field is a string field whose values must be sampled to
+        find out if it is actually a support field.
+        """
+        return not self.is_list and self.type == 'str'
+
+async def fetch_fields(client: PCGW, table: str) -> list[Field]:
+    """
+    Fetches the description of the fields of a table.
+    """
+    j = await client._async_cargoquery({
+        'action' : 'cargofields',
+        'format' : 'json',
+        'table' : table,
+    })
+    if 'cargofields' not in j:
+        raise RuntimeError(f'cannot fetch the fields of table "{table}": {j.get("error")}')
+    return [Field(k, v, table) for k, v in j['cargofields'].items() if k[0].isalpha()]
+
+async def fetch_values(client: PCGW, table: str, field: Field) -> set[str]:
+    """
+    Fetches the distinct values of a field of a table among the games.
+    """
+    params = {
+        'action' : 'cargoquery',
+        'format' : 'json',
+        'where' : 'Infobox_game._pageName LIKE "%"',
+        'tables' : ','.join(dict.fromkeys(['Infobox_game', table])),
+        'fields' : f'{table}.{field.query_key}',
+        'group_by' : f'{table}.{field.query_key}',
+    }
+    if table != 'Infobox_game':
+        params['join_on'] = f'Infobox_game._pageID={table}._pageID'
+    rows = (await client._async_cargoquery(params)).get('cargoquery', [])
+    return {row.get('title', {}).get(field.key, 'null') or 'null' for row in rows}
+
+async def infer_support_fields(client: PCGW, table: str, fields: list[Field]):
+    """
+    Turns into support fields the string fields of a table whose values
+    are all support values, sampling the values of the fields concurrently.
+    """
+    candidates = [field for field in fields if field.may_be_support]
+    samples = await asyncio.gather(*(fetch_values(client, table, field) for field in candidates))
+    for field, values in zip(candidates, samples):
+        if values.issubset(SUPPORT_VALUES):
+            field.type = 'Support'
+
+def generate_class(table: str, fields: list[Field]) -> str:
+    """
+    Returns the source of the class of a table.
+    """
+    source = f'''
+class {table}(Table):
+    __slots__ = ({''.join(f"'{field.name}', " for field in fields)})
+    FIELDS = (
+'''
+    for field in fields:
+        source += ' '*8 + f'{field.spec},\n'
+    source += '''    )
+
+'''
+    for field in fields:
+        source += ' '*4 + f'{field.name}: {field.annotation}\n'
+    return source
+
+def generate_module(class_sources: list[str]) -> str:
+    """
+    Returns the source of the tables module made of the sources of its
+    classes, importing typing.Any only if the type of a field is unknown.
+    """
+    source = ''.join(class_sources)
+    header = PYTHON_TABLES_HEADER
+    if _ANY_ANNOTATION.search(source):
+        header = header.replace('from sys import intern\n', 'from sys import intern\nfrom typing import Any\n')
+    return header + source
+
+def split_classes(source: str) -> dict[str, str]:
+    """
+    Splits the source of the tables module into the sources of its classes,
+    indexed by table name.
+    """
+    matches = list(_CLASS.finditer(source))
+    ends = [match.start() for match in matches[1:]] + [len(source)]
+    return {match.group(1): '\n' + source[match.start():end].rstrip('\n') + '\n'
+            for match, end in zip(matches, ends)}
+
+def is_unchanged(fields: list[Field], class_source: str|None) -> bool:
+    """
+    Returns whether the fields of a table match the class generated
+    previously. The string fields whose values have not been sampled match
+    support fields as well.
+    """
+    if class_source is None:
+        return False
+    previous = _FIELD_SPEC.findall(class_source)
+    return len(previous) == len(fields) and all(
+            spec == field.spec or (field.may_be_support and kind == 'support'
+                                   and (name, key) == (field.name, field.key))
+            for field, (spec, name, key, kind) in zip(fields, previous))
+
+async def update_schema(client: PCGW, tables: tuple[str, ...] = TABLES, regenerate_all: bool = False,
+                        tables_info_filename: str = TABLES_INFO_FILENAME,
+                        python_tables_filename: str = PYTHON_TABLES_FILENAME,
+                        dry_run: bool = False) -> dict[str, tuple[list[str], list[str]]]:
+    """
+    Updates tables.json and the tables module from the PCGamingWiki database.
+
+    The fields of every table are fetched concurrently and compared with the
+    previous schema: only the classes of the tables whose fields changed are
+    generated again, which requires sampling the values of their string
+    fields to find the support fields.
+
+    Parameters:
+        client: API client, whose cache and rate limiter are used for the requests.
+        tables: names of the tables.
+        regenerate_all: whether to generate every class again.
+        tables_info_filename: path of tables.json.
+        python_tables_filename: path of tables.py.
+        dry_run: whether to only compute the changes, without writing the files.
+
+    Returns:
+        The names of the fields added and removed, indexed by the names of
+        the tables regenerated.
+    """
+    try:
+        with open(tables_info_filename) as f:
+            previous_info = json.load(f)
+    except FileNotFoundError:
+        previous_info = {}
+    try:
+        with open(python_tables_filename) as f:
+            previous_classes = split_classes(f.read())
+    except FileNotFoundError:
+        previous_classes = {}
+
+    all_fields = dict(zip(tables, await asyncio.gather(*(fetch_fields(client, table) for table in tables))))
+    changed = [table for table, fields in all_fields.items()
+               if regenerate_all or not is_unchanged(fields, previous_classes.get(table))]
+    await asyncio.gather(*(infer_support_fields(client, table, all_fields[table]) for table in changed))
+
+    changes = {}
+    for table in changed:
+        keys = [field.query_key for field in all_fields[table]]
+        previous_keys = previous_info.get(table, [])
+        changes[table] = ([key for key in keys if key not in previous_keys],
+                          [key for key in previous_keys if key not in keys])
+    if not dry_run:
+        with open(python_tables_filename, "w") as f:
+            f.write(generate_module([
+                    generate_class(table, all_fields[table]) if table in changed else previous_classes[table]
+                    for table in tables]))
+        with open(tables_info_filename, "w") as f:
+            json.dump({table: [field.query_key for field in fields] for table, fields in all_fields.items()}, f)
+    return changes
+
+def main():
+    parser = argparse.ArgumentParser(
+            prog='python -m pcgw_api.schema',
+            description='Updates tables.json and tables.py from the PCGamingWiki database.')
+    parser.add_argument('--all', action='store_true', help='generate every table class again')
+    parser.add_argument('--dry-run', action='store_true', help='show the changes without writing the files')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILENAME,
+                        help='SQLite database caching the API responses (default: %(default)s)')
+    parser.add_argument('--max-age', type=float, default=86400,
+                        help='time to live of the cached responses in seconds (default: %(default)s)')
+    parser.add_argument('--rate', type=float, default=5,
+                        help='maximum number of requests per second (default: %(default)s)')
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.cache)), exist_ok=True)
+    cache = SQLiteCache(args.cache, ttl=args.max_age)
+    client = PCGW(cache=cache, rate_limiter=RateLimiter(rate=args.rate))
+    async def update():
+        async with client:
+            return await update_schema(client, regenerate_all=args.all, dry_run=args.dry_run)
+    try:
+        changes = asyncio.run(update())
+    finally:
+        cache.close()
+    for table, (added, removed) in changes.items():
+        print(f'{table}: regenerated' + ''.join(f'\n  + {key}' for key in added)
+                                      + ''.join(f'\n  - {key}' for key in removed))
+    if not changes:
+        print('no table changed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Collection, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from pcgw_api.pcgw import PCGW, Game
+
+MAGIC = b'PCGWSNAP'
+VERSION = 1
+
+# magic, version, number of games, of columns and of strings, string index of
+# the loaded tables, then the offset and length in bytes of every section
+_HEADER = struct.Struct('<8sIIIII4x' + 'QQ' * 10)
+_SECTIONS = (
+    ('string_offsets', 'I'),
+    ('string_data', 'B'),
+    ('column_names', 'I'),
+    ('page_ids', 'I'),
+    ('layout_offsets', 'I'),
+    ('layout_columns', 'H'),
+    ('row_layouts', 'I'),
+    ('row_offsets', 'I'),
+    ('cell_columns', 'H'),
+    ('cell_values', 'I'),
+)
+
+def write_snapshot(path: str, rows: Iterable[dict], loaded_tables: Collection[str]|None = None) -> int:
+    """
+    Writes the data of games to a snapshot file.
+
+    The file holds a table of the distinct strings of the data, the
+    distinct sets of columns of the games (the API returning every field
+    requested, with empty strings for the fields without value), and for
+    every game, in ascending page ID order, its set of columns and the pairs
+    of column and string indices of its non-empty values. Every section is
+    an array of little-endian integers, so that the file can be
+    memory-mapped by Snapshot. The file is written to a temporary file
+    first, then renamed.
+
+    Parameters:
+        path: path of the file, replaced if it exists.
+        rows: data of the games as returned by the API, with the page name
+              and ID aliased as Page and PageID.
+        loaded_tables: names of the tables present in the rows, every table
+                       if None.
+
+    Returns:
+        The number of games written.
+    """
+    by_page_id: dict[int, dict] = {}
+    for j in rows:
+        try:
+            by_page_id[int(j.get('PageID', '') or '')] = j
+        except ValueError:
+            continue
+    strings: dict[str, int] = {'': 0}
+    columns: dict[str, int] = {}
+    layouts: dict[tuple[int, ...], int] = {}
+    page_ids = array('I', sorted(by_page_id))
+    row_layouts = array('I')
+    row_offsets = array('I', [0])
+    cell_columns = array('H')
+    cell_values = array('I')
+    for page_id in page_ids:
+        layout = []
+        for key, value in by_page_id[page_id].items():
+            if value is None:
+                continue
+            column = columns.setdefault(key, len(columns))
+            layout.append(column)
+            if value:
+                cell_columns.append(column)
+                cell_values.append(strings.setdefault(value, len(strings)))
+        row_layouts.append(layouts.setdefault(tuple(layout), len(layouts)))
+        row_offsets.append(len(cell_values))
+    layout_offsets = array('I', [0])
+    layout_columns = array('H')
+    for layout in layouts:
+        layout_columns.extend(layout)
+        layout_offsets.append(len(layout_columns))
+    loaded = 0
+    if loaded_tables is not None:
+        loaded = strings.setdefault(','.join(sorted(loaded_tables)), len(strings))
+    column_names = array('I', [strings.setdefault(key, len(strings)) for key in columns])
+
+    encoded = [s.encode() for s in strings]
+    string_offsets = array('I', [0])
+    for s in encoded:
+        string_offsets.append(string_offsets[-1] + len(s))
+    sections = [string_offsets, array('B', b''.join(encoded)), column_names, page_ids,
+                layout_offsets, layout_columns, row_layouts, row_offsets, cell_columns, cell_values]
+    if sys.byteorder == 'big':
+        for section in sections:
+            section.byteswap()
+
+    locations = []
+    offset = _HEADER.size
+    for section in sections:
+        locations += [offset, section.itemsize * len(section)]
+        offset += -(-locations[-1] // 8) * 8
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(page_ids), len(columns), len(strings), loaded, *locations))
+        for section, length in zip(sections, locations[1::2]):
+            f.write(section.tobytes())
+            f.write(b'\0' * (-length % 8))
+    os.replace(temporary_path, path)
+    return len(page_ids)
+
+class Snapshot(Mapping):
+    """
+    Games of a snapshot file written by write_snapshot or PCGW.save_snapshot,
+    indexed by page ID.
+
+    The file is memory-mapped, so opening it does not depend on its size:
+    the data of a game is read from the file on first access, and its
+    tables are deserialized on first access as for the games returned by
+    the API. The games are kept once built.
+
+    Attributes:
+        loaded_tables: names of the tables present in the snapshot, None if
+                       every table is.
+    """
+    def __init__(self, path: str, pcgw_client: "PCGW|None" = None, drop_json_data: bool = False):
+        """
+        Constructor for a Snapshot.
+
+        Parameters:
+            path: path of the snapshot file.
+            pcgw_client: API client passed to the games, to fetch their
+                         association tables.
+            drop_json_data: whether the games release their json_data once
+                            every table has been deserialized.
+
+        Raises:
+            ValueError: if the file is not a snapshot of a supported version.
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, n_games, _, _, loaded, *locations = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f'"{path}" is not a snapshot file of version {VERSION}')
+        view = memoryview(self._mmap)
+        self._views = [view]
+        for (name, typecode), offset, length in zip(_SECTIONS, locations[::2], locations[1::2]):
+            section = view[offset:offset+length].cast(typecode)
+            if sys.byteorder == 'big':
+                section = array(typecode, section)
+                section.byteswap()
+            else:
+                self._views.append(section)
+            setattr(self, f'_{name}', section)
+        self._strings: dict[int, str] = {}
+        self._column_names = [self._string(i) for i in self._column_names]
+        self._layouts: dict[int, tuple[str, ...]] = {}
+        self.loaded_tables = frozenset(self._string(loaded).split(',')) if loaded else None
+        self._pcgw_client = pcgw_client
+        self._drop_json_data = drop_json_data
+        self._games: dict[int, Game] = {}
+        self._len = n_games
+
+    def _string(self, index: int) -> str:
+        try:
+            return self._strings[index]
+        except KeyError:
+            s = self._strings[index] = str(self._string_data[self._string_offsets[index]:
+                                                             self._string_offsets[index+1]], 'utf-8')
+            return s
+
+    def _index(self, page_id: int) -> int|None:
+        i = bisect.bisect_left(self._page_ids, page_id)
+        if i < self._len and self._page_ids[i] == page_id:
+            return i
+        return None
+
+    def get_json_data(self, page_id: int) -> dict|None:
+        """
+        Returns the data of a game as returned by the API, None if it is not
+        in the snapshot.
+        """
+        i = self._index(page_id)
+        if i is None:
+            return None
+        j = dict.fromkeys(self._layout(self._row_layouts[i]), '')
+        start, end = self._row_offsets[i], self._row_offsets[i+1]
+        names = self._column_names
+        for column, value in zip(self._cell_columns[start:end], self._cell_values[start:end]):
+            j[names[column]] = self._string(value)
+        return j
+
+    def _layout(self, index: int) -> tuple[str, ...]:
+        try:
+            return self._layouts[index]
+        except KeyError:
+            names = self._column_names
+            layout = self._layouts[index] = tuple(names[column] for column in self._layout_columns[
+                    self._layout_offsets[index]:self._layout_offsets[index+1]])
+            return layout
+
+    def __getitem__(self, page_id: int) -> "Game":
+        game = self._games.get(page_id)
+        if game is None:
+            j = self.get_json_data(page_id)
+            if j is None:
+                raise KeyError(page_id)
+            from pcgw_api.pcgw import Game
+            game = self._games[page_id] = Game(j, self._pcgw_client, self._drop_json_data, self.loaded_tables)
+        return game
+
+    def __contains__(self, page_id: object) -> bool:
+        return isinstance(page_id, int) and self._index(page_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._page_ids)
+
+    def __len__(self):
+        return self._len
+
+    def close(self):
+        """
+        Unmaps the file. The games already built remain usable.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
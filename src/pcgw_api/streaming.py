@@ -0,0 +1,72 @@
+import json
+import re
+
+from pcgw_api.errors import raise_for_error
+
+class CargoqueryParser:
+    """
+    Incremental parser of the rows of a cargoquery response.
+
+    The text of the response is fed as it is received, and the rows of the
+    "cargoquery" array are returned as soon as they are complete, so that the
+    whole response never needs to be held in memory at once.
+    """
+    _START = re.compile(r'"cargoquery"\s*:\s*\[')
+    _ERROR = re.compile(r'"error"\s*:\s*\{')
+    _SEPARATORS = ' \t\r\n,'
+
+    def __init__(self):
+        self._buffer = ''
+        self._started = False
+        self._done = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> list[dict]:
+        """
+        Parses a chunk of the response.
+
+        Parameters:
+            text: next chunk of the text of the response.
+
+        Returns:
+            The content of the "title" key of the rows completed by the chunk.
+
+        Raises:
+            PCGWAPIError: if the response is an error of the API.
+        """
+        if self._done:
+            return []
+        buffer = self._buffer + text
+        if not self._started:
+            if (match := self._ERROR.search(buffer)) is not None:
+                try:
+                    error, _ = self._decoder.raw_decode(buffer, match.end() - 1)
+                except json.JSONDecodeError:
+                    # wait for the rest of the error
+                    self._buffer = buffer[match.start():]
+                    return []
+                raise_for_error({'error': error})
+            if (match := self._START.search(buffer)) is None:
+                # keep enough characters for a start marker split between chunks
+                self._buffer = buffer[-32:]
+                return []
+            buffer = buffer[match.end():]
+            self._started = True
+        rows = []
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in self._SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                self._done = True
+                pos = len(buffer)
+                break
+            try:
+                row, pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            rows.append(row.get('title', {}) if isinstance(row, dict) else {})
+        self._buffer = buffer[pos:]
+        return rows
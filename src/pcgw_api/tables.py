@@ -1,324 +1,643 @@
 
 import datetime
-from typing import Any
+from sys import intern
 
-from pcgw_api.utils import parse_list, parse_value, parse_support_enum, Support
+from pcgw_api.utils import FieldSpec, SupportValue, Table
 
-class API:
-    def __init__(self, j):
-        self.direct3d_versions: list[str] = parse_list(j, "Direct3D versions", ",", str)
-        self.directdraw_versions: list[str] = parse_list(j, "DirectDraw versions", ",", str)
-        self.wing: Support = parse_support_enum(j, "WinG")
-        self.opengl_versions: list[str] = parse_list(j, "OpenGL versions", ",", str)
-        self.glide_versions: list[str] = parse_list(j, "Glide versions", ",", str)
-        self.software_renderer: Support = parse_support_enum(j, "Software renderer")
-        self.mantle_support: Support = parse_support_enum(j, "Mantle support")
-        self.metal_support: Support = parse_support_enum(j, "Metal support")
-        self.vulkan_versions: list[str] = parse_list(j, "Vulkan versions", ",", str)
-        self.dos_video_modes: list[str] = parse_list(j, "DOS video modes", ",", str)
-        self.windows_16bit_executable: Support = parse_support_enum(j, "Windows 16bit executable")
-        self.windows_32bit_executable: Support = parse_support_enum(j, "Windows 32bit executable")
-        self.windows_64bit_executable: str|None = j.get("Windows 64bit executable")
-        self.windows_arm_app: Support = parse_support_enum(j, "Windows ARM app")
-        self.mac_os_x_powerpc_app: str|None = j.get("Mac OS X PowerPC app")
-        self.macos_intel_32bit_app: Support = parse_support_enum(j, "macOS Intel 32bit app")
-        self.macos_intel_64bit_app: Support = parse_support_enum(j, "macOS Intel 64bit app")
-        self.macos_arm_app: Support = parse_support_enum(j, "macOS ARM app")
-        self.linux_powerpc_app: Support = parse_support_enum(j, "Linux PowerPC app")
-        self.linux_32bit_executable: Support = parse_support_enum(j, "Linux 32bit executable")
-        self.linux_64bit_executable: str|None = j.get("Linux 64bit executable")
-        self.linux_arm_app: Support = parse_support_enum(j, "Linux ARM app")
-        self.linux_68k_app: Support = parse_support_enum(j, "Linux 68k app")
-        self.mac_os_68k_app: Support = parse_support_enum(j, "Mac OS 68K app")
-        self.mac_os_powerpc_app: Support = parse_support_enum(j, "Mac OS PowerPC app")
+class API(Table):
+    __slots__ = ('direct3d_versions', 'directdraw_versions', 'wing', 'opengl_versions', 'glide_versions', 'software_renderer', 'mantle_support', 'metal_support', 'vulkan_versions', 'dos_video_modes', 'windows_16bit_executable', 'windows_32bit_executable', 'windows_64bit_executable', 'windows_arm_app', 'mac_os_x_powerpc_app', 'macos_intel_32bit_app', 'macos_intel_64bit_app', 'macos_arm_app', 'linux_powerpc_app', 'linux_32bit_executable', 'linux_64bit_executable', 'linux_arm_app', 'linux_68k_app', 'mac_os_68k_app', 'mac_os_powerpc_app', )
+    FIELDS = (
+        FieldSpec("direct3d_versions", "Direct3D versions", "list", ",", intern),
+        FieldSpec("directdraw_versions", "DirectDraw versions", "list", ",", intern),
+        FieldSpec("wing", "WinG", "support", None, None),
+        FieldSpec("opengl_versions", "OpenGL versions", "list", ",", intern),
+        FieldSpec("glide_versions", "Glide versions", "list", ",", intern),
+        FieldSpec("software_renderer", "Software renderer", "support", None, None),
+        FieldSpec("mantle_support", "Mantle support", "support", None, None),
+        FieldSpec("metal_support", "Metal support", "support", None, None),
+        FieldSpec("vulkan_versions", "Vulkan versions", "list", ",", intern),
+        FieldSpec("dos_video_modes", "DOS video modes", "list", ",", intern),
+        FieldSpec("windows_16bit_executable", "Windows 16bit executable", "support", None, None),
+        FieldSpec("windows_32bit_executable", "Windows 32bit executable", "support", None, None),
+        FieldSpec("windows_64bit_executable", "Windows 64bit executable", "str", None, None),
+        FieldSpec("windows_arm_app", "Windows ARM app", "support", None, None),
+        FieldSpec("mac_os_x_powerpc_app", "Mac OS X PowerPC app", "str", None, None),
+        FieldSpec("macos_intel_32bit_app", "macOS Intel 32bit app", "support", None, None),
+        FieldSpec("macos_intel_64bit_app", "macOS Intel 64bit app", "support", None, None),
+        FieldSpec("macos_arm_app", "macOS ARM app", "support", None, None),
+        FieldSpec("linux_powerpc_app", "Linux PowerPC app", "support", None, None),
+        FieldSpec("linux_32bit_executable", "Linux 32bit executable", "support", None, None),
+        FieldSpec("linux_64bit_executable", "Linux 64bit executable", "str", None, None),
+        FieldSpec("linux_arm_app", "Linux ARM app", "support", None, None),
+        FieldSpec("linux_68k_app", "Linux 68k app", "support", None, None),
+        FieldSpec("mac_os_68k_app", "Mac OS 68K app", "support", None, None),
+        FieldSpec("mac_os_powerpc_app", "Mac OS PowerPC app", "support", None, None),
+    )
 
-class Audio:
-    def __init__(self, j):
-        self.separate_volume_controls: Support = parse_support_enum(j, "Separate volume controls")
-        self.surround_sound: Support = parse_support_enum(j, "Surround sound")
-        self.subtitles: Support = parse_support_enum(j, "Subtitles")
-        self.closed_captions: Support = parse_support_enum(j, "Closed captions")
-        self.mute_on_focus_lost: Support = parse_support_enum(j, "Mute on focus lost")
-        self.eax_support: Support = parse_support_enum(j, "EAX support")
-        self.royalty_free_audio: Support = parse_support_enum(j, "Royalty free audio")
-        self.red_book_cd_audio: Support = parse_support_enum(j, "Red Book CD audio")
-        self.general_midi_audio: Support = parse_support_enum(j, "General MIDI audio")
+    direct3d_versions: tuple[str, ...]
+    directdraw_versions: tuple[str, ...]
+    wing: SupportValue
+    opengl_versions: tuple[str, ...]
+    glide_versions: tuple[str, ...]
+    software_renderer: SupportValue
+    mantle_support: SupportValue
+    metal_support: SupportValue
+    vulkan_versions: tuple[str, ...]
+    dos_video_modes: tuple[str, ...]
+    windows_16bit_executable: SupportValue
+    windows_32bit_executable: SupportValue
+    windows_64bit_executable: str|None
+    windows_arm_app: SupportValue
+    mac_os_x_powerpc_app: str|None
+    macos_intel_32bit_app: SupportValue
+    macos_intel_64bit_app: SupportValue
+    macos_arm_app: SupportValue
+    linux_powerpc_app: SupportValue
+    linux_32bit_executable: SupportValue
+    linux_64bit_executable: str|None
+    linux_arm_app: SupportValue
+    linux_68k_app: SupportValue
+    mac_os_68k_app: SupportValue
+    mac_os_powerpc_app: SupportValue
 
-class Availability:
-    def __init__(self, j):
-        self.available_from: list[str] = parse_list(j, "Available from", ",", str)
-        self.available_from_historically: list[str] = parse_list(j, "Available from historically", ",", str)
-        self.uses_drm: list[str] = parse_list(j, "Uses DRM", ",", str)
-        self.removed_drm: list[str] = parse_list(j, "Removed DRM", ",", str)
-        self.retail_drm: list[str] = parse_list(j, "Retail DRM", ",", str)
-        self.retail_keys: list[str] = parse_list(j, "Retail keys", ",", str)
-        self.developer_website_drm: list[str] = parse_list(j, "Developer website DRM", ",", str)
-        self.developer_website_keys: list[str] = parse_list(j, "Developer website keys", ",", str)
-        self.publisher_website_drm: list[str] = parse_list(j, "Publisher website DRM", ",", str)
-        self.publisher_website_keys: list[str] = parse_list(j, "Publisher website keys", ",", str)
-        self.official_website_drm: list[str] = parse_list(j, "Official website DRM", ",", str)
-        self.official_website_keys: list[str] = parse_list(j, "Official website keys", ",", str)
-        self.amazon_us_drm: list[str] = parse_list(j, "Amazon US DRM", ",", str)
-        self.amazon_us_keys: list[str] = parse_list(j, "Amazon US keys", ",", str)
-        self.amazon_uk_drm: list[str] = parse_list(j, "Amazon UK DRM", ",", str)
-        self.amazon_uk_keys: list[str] = parse_list(j, "Amazon UK keys", ",", str)
-        self.battlenet_drm: list[str] = parse_list(j, "Battlenet DRM", ",", str)
-        self.battlenet_keys: list[str] = parse_list(j, "Battlenet keys", ",", str)
-        self.bethesdanet_drm: list[str] = parse_list(j, "Bethesdanet DRM", ",", str)
-        self.bethesdanet_keys: list[str] = parse_list(j, "Bethesdanet keys", ",", str)
-        self.discord_drm: list[str] = parse_list(j, "Discord DRM", ",", str)
-        self.discord_keys: list[str] = parse_list(j, "Discord keys", ",", str)
-        self.ea_app_drm: list[str] = parse_list(j, "EA app DRM", ",", str)
-        self.ea_app_keys: list[str] = parse_list(j, "EA app keys", ",", str)
-        self.epic_games_store_drm: list[str] = parse_list(j, "Epic Games Store DRM", ",", str)
-        self.epic_games_store_keys: list[str] = parse_list(j, "Epic Games Store keys", ",", str)
-        self.gamersgate_drm: list[str] = parse_list(j, "GamersGate DRM", ",", str)
-        self.gamersgate_keys: list[str] = parse_list(j, "GamersGate keys", ",", str)
-        self.gamesplanet_drm: list[str] = parse_list(j, "Gamesplanet DRM", ",", str)
-        self.gamesplanet_keys: list[str] = parse_list(j, "Gamesplanet keys", ",", str)
-        self.gogcom_drm: list[str] = parse_list(j, "GOGcom DRM", ",", str)
-        self.gogcom_keys: list[str] = parse_list(j, "GOGcom keys", ",", str)
-        self.green_man_gaming_drm: list[str] = parse_list(j, "Green Man Gaming DRM", ",", str)
-        self.green_man_gaming_keys: list[str] = parse_list(j, "Green Man Gaming keys", ",", str)
-        self.humble_store_drm: list[str] = parse_list(j, "Humble Store DRM", ",", str)
-        self.humble_store_keys: list[str] = parse_list(j, "Humble Store keys", ",", str)
-        self.itchio_drm: list[str] = parse_list(j, "itchio DRM", ",", str)
-        self.itchio_keys: list[str] = parse_list(j, "itchio keys", ",", str)
-        self.mac_app_store_drm: list[str] = parse_list(j, "Mac App Store DRM", ",", str)
-        self.mac_app_store_keys: list[str] = parse_list(j, "Mac App Store keys", ",", str)
-        self.meta_store_drm: list[str] = parse_list(j, "Meta Store DRM", ",", str)
-        self.meta_store_keys: list[str] = parse_list(j, "Meta Store keys", ",", str)
-        self.microsoft_store_drm: list[str] = parse_list(j, "Microsoft Store DRM", ",", str)
-        self.microsoft_store_keys: list[str] = parse_list(j, "Microsoft Store keys", ",", str)
-        self.steam_drm: list[str] = parse_list(j, "Steam DRM", ",", str)
-        self.steam_keys: list[str] = parse_list(j, "Steam keys", ",", str)
-        self.twitch_drm: list[str] = parse_list(j, "Twitch DRM", ",", str)
-        self.twitch_keys: list[str] = parse_list(j, "Twitch keys", ",", str)
-        self.ubisoft_store_drm: list[str] = parse_list(j, "Ubisoft Store DRM", ",", str)
-        self.ubisoft_store_keys: list[str] = parse_list(j, "Ubisoft Store keys", ",", str)
-        self.viveport_drm: list[str] = parse_list(j, "Viveport DRM", ",", str)
-        self.viveport_keys: list[str] = parse_list(j, "Viveport keys", ",", str)
-        self.zoom_platform_drm: list[str] = parse_list(j, "Zoom Platform DRM", ",", str)
-        self.zoom_platform_keys: list[str] = parse_list(j, "Zoom Platform keys", ",", str)
-        self.apple_arcade: Support = parse_support_enum(j, "Apple Arcade")
-        self.ea_play: Support = parse_support_enum(j, "EA Play")
-        self.ea_play_pro: Support = parse_support_enum(j, "EA Play Pro")
-        self.ea_play_steam: Support = parse_support_enum(j, "EA Play Steam")
-        self.ea_play_epic: Support = parse_support_enum(j, "EA Play Epic")
-        self.ubisoft_plus: Support = parse_support_enum(j, "Ubisoft Plus")
-        self.xbox_play_anywhere: Support = parse_support_enum(j, "Xbox Play Anywhere")
-        self.xbox_game_pass: Support = parse_support_enum(j, "Xbox Game Pass")
-        self.gfwl_type: str|None = j.get("GFWL type")
-        self.gfwl_zdpp: Support = parse_support_enum(j, "GFWL ZDPP")
-        self.gfwl_local_profile: Support = parse_support_enum(j, "GFWL local profile")
+class Audio(Table):
+    __slots__ = ('separate_volume_controls', 'surround_sound', 'subtitles', 'closed_captions', 'mute_on_focus_lost', 'eax_support', 'royalty_free_audio', 'red_book_cd_audio', 'general_midi_audio', )
+    FIELDS = (
+        FieldSpec("separate_volume_controls", "Separate volume controls", "support", None, None),
+        FieldSpec("surround_sound", "Surround sound", "support", None, None),
+        FieldSpec("subtitles", "Subtitles", "support", None, None),
+        FieldSpec("closed_captions", "Closed captions", "support", None, None),
+        FieldSpec("mute_on_focus_lost", "Mute on focus lost", "support", None, None),
+        FieldSpec("eax_support", "EAX support", "support", None, None),
+        FieldSpec("royalty_free_audio", "Royalty free audio", "support", None, None),
+        FieldSpec("red_book_cd_audio", "Red Book CD audio", "support", None, None),
+        FieldSpec("general_midi_audio", "General MIDI audio", "support", None, None),
+    )
 
-class Cloud:
-    def __init__(self, j):
-        self.discord: Support = parse_support_enum(j, "Discord")
-        self.epic_games_launcher: Support = parse_support_enum(j, "Epic Games Launcher")
-        self.gog_galaxy: Support = parse_support_enum(j, "GOG Galaxy")
-        self.ea_app: Support = parse_support_enum(j, "EA app")
-        self.onedrive: Support = parse_support_enum(j, "OneDrive")
-        self.steam: Support = parse_support_enum(j, "Steam")
-        self.ubisoft_connect: Support = parse_support_enum(j, "Ubisoft Connect")
-        self.xbox: Support = parse_support_enum(j, "Xbox")
+    separate_volume_controls: SupportValue
+    surround_sound: SupportValue
+    subtitles: SupportValue
+    closed_captions: SupportValue
+    mute_on_focus_lost: SupportValue
+    eax_support: SupportValue
+    royalty_free_audio: SupportValue
+    red_book_cd_audio: SupportValue
+    general_midi_audio: SupportValue
 
-class Infobox_game:
-    def __init__(self, j):
-        self.cover: str|None = j.get("Cover")
-        self.cover_url: str|None = j.get("Cover URL")
-        self.developers: list[str] = parse_list(j, "Developers", ",", str)
-        self.porters_pc_booter: list[str] = parse_list(j, "Porters PC booter", ",", str)
-        self.porters_dos: list[str] = parse_list(j, "Porters DOS", ",", str)
-        self.porters_windows_3x: list[str] = parse_list(j, "Porters Windows 3x", ",", str)
-        self.porters_windows: list[str] = parse_list(j, "Porters Windows", ",", str)
-        self.porters_mac_os: list[str] = parse_list(j, "Porters Mac OS", ",", str)
-        self.porters_os_x: list[str] = parse_list(j, "Porters OS X", ",", str)
-        self.porters_linux: list[str] = parse_list(j, "Porters Linux", ",", str)
-        self.publishers: list[str] = parse_list(j, "Publishers", ",", str)
-        self.engines: list[str] = parse_list(j, "Engines", ",", str)
-        self.available_on: list[str] = parse_list(j, "Available on", ",", str)
-        self.released: list[datetime.datetime] = parse_list(j, "Released", ";", datetime.datetime.fromisoformat)
-        self.released_pc_booter: datetime.datetime|None = parse_value(j, "Released PC booter", datetime.datetime.fromisoformat)
-        self.released_dos: datetime.datetime|None = parse_value(j, "Released DOS", datetime.datetime.fromisoformat)
-        self.released_windows_3x: datetime.datetime|None = parse_value(j, "Released Windows 3x", datetime.datetime.fromisoformat)
-        self.released_windows: datetime.datetime|None = parse_value(j, "Released Windows", datetime.datetime.fromisoformat)
-        self.released_mac_os: datetime.datetime|None = parse_value(j, "Released Mac OS", datetime.datetime.fromisoformat)
-        self.released_os_x: datetime.datetime|None = parse_value(j, "Released OS X", datetime.datetime.fromisoformat)
-        self.released_linux: datetime.datetime|None = parse_value(j, "Released Linux", datetime.datetime.fromisoformat)
-        self.wrappers: list[str] = parse_list(j, "Wrappers", ",", str)
-        self.wrappers_windows_3x: list[str] = parse_list(j, "Wrappers Windows 3x", ",", str)
-        self.wrappers_windows: list[str] = parse_list(j, "Wrappers Windows", ",", str)
-        self.wrappers_os_x: list[str] = parse_list(j, "Wrappers OS X", ",", str)
-        self.wrappers_linux: list[str] = parse_list(j, "Wrappers Linux", ",", str)
-        self.monetization: list[str] = parse_list(j, "Monetization", ",", str)
-        self.microtransactions: list[str] = parse_list(j, "Microtransactions", ",", str)
-        self.modes: list[str] = parse_list(j, "Modes", ",", str)
-        self.pacing: list[str] = parse_list(j, "Pacing", ",", str)
-        self.perspectives: list[str] = parse_list(j, "Perspectives", ",", str)
-        self.controls: list[str] = parse_list(j, "Controls", ",", str)
-        self.genres: list[str] = parse_list(j, "Genres", ",", str)
-        self.sports: list[str] = parse_list(j, "Sports", ",", str)
-        self.vehicles: list[str] = parse_list(j, "Vehicles", ",", str)
-        self.art_styles: list[str] = parse_list(j, "Art styles", ",", str)
-        self.themes: list[str] = parse_list(j, "Themes", ",", str)
-        self.series: list[str] = parse_list(j, "Series", ",", str)
-        self.steam_appid: list[str] = parse_list(j, "Steam AppID", ",", str)
-        self.gogcom_id: list[str] = parse_list(j, "GOGcom ID", ",", str)
-        self.strategywiki: str|None = j.get("StrategyWiki")
-        self.wikipedia: str|None = j.get("Wikipedia")
-        self.license: str|None = j.get("License")
+class Availability(Table):
+    __slots__ = ('available_from', 'available_from_historically', 'uses_drm', 'removed_drm', 'retail_drm', 'retail_keys', 'developer_website_drm', 'developer_website_keys', 'publisher_website_drm', 'publisher_website_keys', 'official_website_drm', 'official_website_keys', 'amazon_us_drm', 'amazon_us_keys', 'amazon_uk_drm', 'amazon_uk_keys', 'battlenet_drm', 'battlenet_keys', 'bethesdanet_drm', 'bethesdanet_keys', 'discord_drm', 'discord_keys', 'ea_app_drm', 'ea_app_keys', 'epic_games_store_drm', 'epic_games_store_keys', 'gamersgate_drm', 'gamersgate_keys', 'gamesplanet_drm', 'gamesplanet_keys', 'gogcom_drm', 'gogcom_keys', 'green_man_gaming_drm', 'green_man_gaming_keys', 'humble_store_drm', 'humble_store_keys', 'itchio_drm', 'itchio_keys', 'mac_app_store_drm', 'mac_app_store_keys', 'meta_store_drm', 'meta_store_keys', 'microsoft_store_drm', 'microsoft_store_keys', 'steam_drm', 'steam_keys', 'twitch_drm', 'twitch_keys', 'ubisoft_store_drm', 'ubisoft_store_keys', 'viveport_drm', 'viveport_keys', 'zoom_platform_drm', 'zoom_platform_keys', 'apple_arcade', 'ea_play', 'ea_play_pro', 'ea_play_steam', 'ea_play_epic', 'ubisoft_plus', 'xbox_play_anywhere', 'xbox_game_pass', 'gfwl_type', 'gfwl_zdpp', 'gfwl_local_profile', )
+    FIELDS = (
+        FieldSpec("available_from", "Available from", "list", ",", intern),
+        FieldSpec("available_from_historically", "Available from historically", "list", ",", intern),
+        FieldSpec("uses_drm", "Uses DRM", "list", ",", intern),
+        FieldSpec("removed_drm", "Removed DRM", "list", ",", intern),
+        FieldSpec("retail_drm", "Retail DRM", "list", ",", intern),
+        FieldSpec("retail_keys", "Retail keys", "list", ",", intern),
+        FieldSpec("developer_website_drm", "Developer website DRM", "list", ",", intern),
+        FieldSpec("developer_website_keys", "Developer website keys", "list", ",", intern),
+        FieldSpec("publisher_website_drm", "Publisher website DRM", "list", ",", intern),
+        FieldSpec("publisher_website_keys", "Publisher website keys", "list", ",", intern),
+        FieldSpec("official_website_drm", "Official website DRM", "list", ",", intern),
+        FieldSpec("official_website_keys", "Official website keys", "list", ",", intern),
+        FieldSpec("amazon_us_drm", "Amazon US DRM", "list", ",", intern),
+        FieldSpec("amazon_us_keys", "Amazon US keys", "list", ",", intern),
+        FieldSpec("amazon_uk_drm", "Amazon UK DRM", "list", ",", intern),
+        FieldSpec("amazon_uk_keys", "Amazon UK keys", "list", ",", intern),
+        FieldSpec("battlenet_drm", "Battlenet DRM", "list", ",", intern),
+        FieldSpec("battlenet_keys", "Battlenet keys", "list", ",", intern),
+        FieldSpec("bethesdanet_drm", "Bethesdanet DRM", "list", ",", intern),
+        FieldSpec("bethesdanet_keys", "Bethesdanet keys", "list", ",", intern),
+        FieldSpec("discord_drm", "Discord DRM", "list", ",", intern),
+        FieldSpec("discord_keys", "Discord keys", "list", ",", intern),
+        FieldSpec("ea_app_drm", "EA app DRM", "list", ",", intern),
+        FieldSpec("ea_app_keys", "EA app keys", "list", ",", intern),
+        FieldSpec("epic_games_store_drm", "Epic Games Store DRM", "list", ",", intern),
+        FieldSpec("epic_games_store_keys", "Epic Games Store keys", "list", ",", intern),
+        FieldSpec("gamersgate_drm", "GamersGate DRM", "list", ",", intern),
+        FieldSpec("gamersgate_keys", "GamersGate keys", "list", ",", intern),
+        FieldSpec("gamesplanet_drm", "Gamesplanet DRM", "list", ",", intern),
+        FieldSpec("gamesplanet_keys", "Gamesplanet keys", "list", ",", intern),
+        FieldSpec("gogcom_drm", "GOGcom DRM", "list", ",", intern),
+        FieldSpec("gogcom_keys", "GOGcom keys", "list", ",", intern),
+        FieldSpec("green_man_gaming_drm", "Green Man Gaming DRM", "list", ",", intern),
+        FieldSpec("green_man_gaming_keys", "Green Man Gaming keys", "list", ",", intern),
+        FieldSpec("humble_store_drm", "Humble Store DRM", "list", ",", intern),
+        FieldSpec("humble_store_keys", "Humble Store keys", "list", ",", intern),
+        FieldSpec("itchio_drm", "itchio DRM", "list", ",", intern),
+        FieldSpec("itchio_keys", "itchio keys", "list", ",", intern),
+        FieldSpec("mac_app_store_drm", "Mac App Store DRM", "list", ",", intern),
+        FieldSpec("mac_app_store_keys", "Mac App Store keys", "list", ",", intern),
+        FieldSpec("meta_store_drm", "Meta Store DRM", "list", ",", intern),
+        FieldSpec("meta_store_keys", "Meta Store keys", "list", ",", intern),
+        FieldSpec("microsoft_store_drm", "Microsoft Store DRM", "list", ",", intern),
+        FieldSpec("microsoft_store_keys", "Microsoft Store keys", "list", ",", intern),
+        FieldSpec("steam_drm", "Steam DRM", "list", ",", intern),
+        FieldSpec("steam_keys", "Steam keys", "list", ",", intern),
+        FieldSpec("twitch_drm", "Twitch DRM", "list", ",", intern),
+        FieldSpec("twitch_keys", "Twitch keys", "list", ",", intern),
+        FieldSpec("ubisoft_store_drm", "Ubisoft Store DRM", "list", ",", intern),
+        FieldSpec("ubisoft_store_keys", "Ubisoft Store keys", "list", ",", intern),
+        FieldSpec("viveport_drm", "Viveport DRM", "list", ",", intern),
+        FieldSpec("viveport_keys", "Viveport keys", "list", ",", intern),
+        FieldSpec("zoom_platform_drm", "Zoom Platform DRM", "list", ",", intern),
+        FieldSpec("zoom_platform_keys", "Zoom Platform keys", "list", ",", intern),
+        FieldSpec("apple_arcade", "Apple Arcade", "support", None, None),
+        FieldSpec("ea_play", "EA Play", "support", None, None),
+        FieldSpec("ea_play_pro", "EA Play Pro", "support", None, None),
+        FieldSpec("ea_play_steam", "EA Play Steam", "support", None, None),
+        FieldSpec("ea_play_epic", "EA Play Epic", "support", None, None),
+        FieldSpec("ubisoft_plus", "Ubisoft Plus", "support", None, None),
+        FieldSpec("xbox_play_anywhere", "Xbox Play Anywhere", "support", None, None),
+        FieldSpec("xbox_game_pass", "Xbox Game Pass", "support", None, None),
+        FieldSpec("gfwl_type", "GFWL type", "str", None, None),
+        FieldSpec("gfwl_zdpp", "GFWL ZDPP", "support", None, None),
+        FieldSpec("gfwl_local_profile", "GFWL local profile", "support", None, None),
+    )
 
-class Infobox_game_engine:
-    def __init__(self, j):
-        self.engine: str|None = j.get("Engine")
-        self.build: str|None = j.get("Build")
+    available_from: tuple[str, ...]
+    available_from_historically: tuple[str, ...]
+    uses_drm: tuple[str, ...]
+    removed_drm: tuple[str, ...]
+    retail_drm: tuple[str, ...]
+    retail_keys: tuple[str, ...]
+    developer_website_drm: tuple[str, ...]
+    developer_website_keys: tuple[str, ...]
+    publisher_website_drm: tuple[str, ...]
+    publisher_website_keys: tuple[str, ...]
+    official_website_drm: tuple[str, ...]
+    official_website_keys: tuple[str, ...]
+    amazon_us_drm: tuple[str, ...]
+    amazon_us_keys: tuple[str, ...]
+    amazon_uk_drm: tuple[str, ...]
+    amazon_uk_keys: tuple[str, ...]
+    battlenet_drm: tuple[str, ...]
+    battlenet_keys: tuple[str, ...]
+    bethesdanet_drm: tuple[str, ...]
+    bethesdanet_keys: tuple[str, ...]
+    discord_drm: tuple[str, ...]
+    discord_keys: tuple[str, ...]
+    ea_app_drm: tuple[str, ...]
+    ea_app_keys: tuple[str, ...]
+    epic_games_store_drm: tuple[str, ...]
+    epic_games_store_keys: tuple[str, ...]
+    gamersgate_drm: tuple[str, ...]
+    gamersgate_keys: tuple[str, ...]
+    gamesplanet_drm: tuple[str, ...]
+    gamesplanet_keys: tuple[str, ...]
+    gogcom_drm: tuple[str, ...]
+    gogcom_keys: tuple[str, ...]
+    green_man_gaming_drm: tuple[str, ...]
+    green_man_gaming_keys: tuple[str, ...]
+    humble_store_drm: tuple[str, ...]
+    humble_store_keys: tuple[str, ...]
+    itchio_drm: tuple[str, ...]
+    itchio_keys: tuple[str, ...]
+    mac_app_store_drm: tuple[str, ...]
+    mac_app_store_keys: tuple[str, ...]
+    meta_store_drm: tuple[str, ...]
+    meta_store_keys: tuple[str, ...]
+    microsoft_store_drm: tuple[str, ...]
+    microsoft_store_keys: tuple[str, ...]
+    steam_drm: tuple[str, ...]
+    steam_keys: tuple[str, ...]
+    twitch_drm: tuple[str, ...]
+    twitch_keys: tuple[str, ...]
+    ubisoft_store_drm: tuple[str, ...]
+    ubisoft_store_keys: tuple[str, ...]
+    viveport_drm: tuple[str, ...]
+    viveport_keys: tuple[str, ...]
+    zoom_platform_drm: tuple[str, ...]
+    zoom_platform_keys: tuple[str, ...]
+    apple_arcade: SupportValue
+    ea_play: SupportValue
+    ea_play_pro: SupportValue
+    ea_play_steam: SupportValue
+    ea_play_epic: SupportValue
+    ubisoft_plus: SupportValue
+    xbox_play_anywhere: SupportValue
+    xbox_game_pass: SupportValue
+    gfwl_type: str|None
+    gfwl_zdpp: SupportValue
+    gfwl_local_profile: SupportValue
 
-class Input:
-    def __init__(self, j):
-        self.key_remapping: Support = parse_support_enum(j, "Key remapping")
-        self.mouse_acceleration: Support = parse_support_enum(j, "Mouse acceleration")
-        self.mouse_sensitivity: Support = parse_support_enum(j, "Mouse sensitivity")
-        self.mouse_input_in_menus: Support = parse_support_enum(j, "Mouse input in menus")
-        self.keyboard_and_mouse_prompts: Support = parse_support_enum(j, "Keyboard and mouse prompts")
-        self.mouse_y_axis_inversion: Support = parse_support_enum(j, "Mouse Y axis inversion")
-        self.touchscreen: Support = parse_support_enum(j, "Touchscreen")
-        self.controller_support: Support = parse_support_enum(j, "Controller support")
-        self.full_controller_support: Support = parse_support_enum(j, "Full controller support")
-        self.controller_support_level: Support = parse_support_enum(j, "Controller support level")
-        self.controller_remapping: Support = parse_support_enum(j, "Controller remapping")
-        self.controller_sensitivity: Support = parse_support_enum(j, "Controller sensitivity")
-        self.controller_y_axis_inversion: Support = parse_support_enum(j, "Controller Y axis inversion")
-        self.xinput_controller_support: Support = parse_support_enum(j, "XInput controller support")
-        self.xbox_prompts: Support = parse_support_enum(j, "Xbox prompts")
-        self.xbox_one_impulse_triggers: Support = parse_support_enum(j, "Xbox One Impulse Triggers")
-        self.playstation_controller_support: Support = parse_support_enum(j, "Playstation controller support")
-        self.playstation_prompts: Support = parse_support_enum(j, "Playstation prompts")
-        self.playstation_motion_sensors: Support = parse_support_enum(j, "Playstation motion sensors")
-        self.playstation_motion_sensors_modes: list[str] = parse_list(j, "Playstation motion sensors modes", ",", str)
-        self.playstation_light_bar_support: str|None = j.get("Playstation light bar support")
-        self.dualsense_adaptive_trigger_support: Support = parse_support_enum(j, "DualSense adaptive trigger support")
-        self.dualsense_haptic_feedback_support: Support = parse_support_enum(j, "DualSense haptic feedback support")
-        self.playstation_controller_models: list[str] = parse_list(j, "PlayStation controller models", ",", str)
-        self.playstation_connection_modes: list[str] = parse_list(j, "Playstation connection modes", ",", str)
-        self.tracked_motion_controllers: Support = parse_support_enum(j, "Tracked motion controllers")
-        self.tracked_motion_controller_prompts: Support = parse_support_enum(j, "Tracked motion controller prompts")
-        self.other_controller_support: Support = parse_support_enum(j, "Other controller support")
-        self.other_button_prompts: list[str] = parse_list(j, "Other button prompts", ",", str)
-        self.controller_hotplugging: Support = parse_support_enum(j, "Controller hotplugging")
-        self.input_prompt_override: Support = parse_support_enum(j, "Input prompt override")
-        self.controller_haptic_feedback: Support = parse_support_enum(j, "Controller haptic feedback")
-        self.simultaneous_input: Support = parse_support_enum(j, "Simultaneous input")
-        self.steam_input_api_support: Support = parse_support_enum(j, "Steam Input API support")
-        self.steam_hook_input: Support = parse_support_enum(j, "Steam hook input")
-        self.steam_input_prompts: Support = parse_support_enum(j, "Steam Input prompts")
-        self.steam_input_prompts_icons: list[str] = parse_list(j, "Steam Input prompts icons", ",", str)
-        self.steam_input_prompts_styles: list[str] = parse_list(j, "Steam Input prompts styles", ",", str)
-        self.steam_controller_prompts: Support = parse_support_enum(j, "Steam Controller prompts")
-        self.steam_deck_prompts: Support = parse_support_enum(j, "Steam Deck prompts")
-        self.steam_input_motion_sensors: Support = parse_support_enum(j, "Steam Input motion sensors")
-        self.steam_input_motion_sensors_modes: list[str] = parse_list(j, "Steam Input motion sensors modes", ",", str)
-        self.steam_input_presets: Support = parse_support_enum(j, "Steam Input presets")
-        self.steam_input_mouse_cursor_detection: Support = parse_support_enum(j, "Steam Input mouse cursor detection")
+class Cloud(Table):
+    __slots__ = ('discord', 'epic_games_launcher', 'gog_galaxy', 'ea_app', 'onedrive', 'steam', 'ubisoft_connect', 'xbox', )
+    FIELDS = (
+        FieldSpec("discord", "Discord", "support", None, None),
+        FieldSpec("epic_games_launcher", "Epic Games Launcher", "support", None, None),
+        FieldSpec("gog_galaxy", "GOG Galaxy", "support", None, None),
+        FieldSpec("ea_app", "EA app", "support", None, None),
+        FieldSpec("onedrive", "OneDrive", "support", None, None),
+        FieldSpec("steam", "Steam", "support", None, None),
+        FieldSpec("ubisoft_connect", "Ubisoft Connect", "support", None, None),
+        FieldSpec("xbox", "Xbox", "support", None, None),
+    )
 
-class L10n:
-    def __init__(self, j):
-        self.language: str|None = j.get("Language")
-        self.status: str|None = j.get("Status")
-        self.interface: Support = parse_support_enum(j, "Interface")
-        self.audio: Support = parse_support_enum(j, "Audio")
-        self.subtitles: Support = parse_support_enum(j, "Subtitles")
-        self.notes: str|None = j.get("Notes")
+    discord: SupportValue
+    epic_games_launcher: SupportValue
+    gog_galaxy: SupportValue
+    ea_app: SupportValue
+    onedrive: SupportValue
+    steam: SupportValue
+    ubisoft_connect: SupportValue
+    xbox: SupportValue
 
-class Middleware:
-    def __init__(self, j):
-        self.physics: list[str] = parse_list(j, "Physics", ",", str)
-        self.audio: list[str] = parse_list(j, "Audio", ",", str)
-        self.interface: list[str] = parse_list(j, "Interface", ",", str)
-        self.input: list[str] = parse_list(j, "Input", ",", str)
-        self.cutscenes: list[str] = parse_list(j, "Cutscenes", ",", str)
-        self.multiplayer: list[str] = parse_list(j, "Multiplayer", ",", str)
-        self.anticheat: list[str] = parse_list(j, "Anticheat", ",", str)
+class Infobox_game(Table):
+    __slots__ = ('cover', 'cover_url', 'developers', 'porters_pc_booter', 'porters_dos', 'porters_windows_3x', 'porters_windows', 'porters_mac_os', 'porters_os_x', 'porters_linux', 'publishers', 'engines', 'available_on', 'released', 'released_pc_booter', 'released_dos', 'released_windows_3x', 'released_windows', 'released_mac_os', 'released_os_x', 'released_linux', 'wrappers', 'wrappers_windows_3x', 'wrappers_windows', 'wrappers_os_x', 'wrappers_linux', 'monetization', 'microtransactions', 'modes', 'pacing', 'perspectives', 'controls', 'genres', 'sports', 'vehicles', 'art_styles', 'themes', 'series', 'steam_appid', 'gogcom_id', 'strategywiki', 'wikipedia', 'license', )
+    FIELDS = (
+        FieldSpec("cover", "Cover", "str", None, None),
+        FieldSpec("cover_url", "Cover URL", "str", None, None),
+        FieldSpec("developers", "Developers", "list", ",", intern),
+        FieldSpec("porters_pc_booter", "Porters PC booter", "list", ",", intern),
+        FieldSpec("porters_dos", "Porters DOS", "list", ",", intern),
+        FieldSpec("porters_windows_3x", "Porters Windows 3x", "list", ",", intern),
+        FieldSpec("porters_windows", "Porters Windows", "list", ",", intern),
+        FieldSpec("porters_mac_os", "Porters Mac OS", "list", ",", intern),
+        FieldSpec("porters_os_x", "Porters OS X", "list", ",", intern),
+        FieldSpec("porters_linux", "Porters Linux", "list", ",", intern),
+        FieldSpec("publishers", "Publishers", "list", ",", intern),
+        FieldSpec("engines", "Engines", "list", ",", intern),
+        FieldSpec("available_on", "Available on", "list", ",", intern),
+        FieldSpec("released", "Released", "list", ";", datetime.datetime.fromisoformat),
+        FieldSpec("released_pc_booter", "Released PC booter", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_dos", "Released DOS", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_windows_3x", "Released Windows 3x", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_windows", "Released Windows", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_mac_os", "Released Mac OS", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_os_x", "Released OS X", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("released_linux", "Released Linux", "value", None, datetime.datetime.fromisoformat),
+        FieldSpec("wrappers", "Wrappers", "list", ",", intern),
+        FieldSpec("wrappers_windows_3x", "Wrappers Windows 3x", "list", ",", intern),
+        FieldSpec("wrappers_windows", "Wrappers Windows", "list", ",", intern),
+        FieldSpec("wrappers_os_x", "Wrappers OS X", "list", ",", intern),
+        FieldSpec("wrappers_linux", "Wrappers Linux", "list", ",", intern),
+        FieldSpec("monetization", "Monetization", "list", ",", intern),
+        FieldSpec("microtransactions", "Microtransactions", "list", ",", intern),
+        FieldSpec("modes", "Modes", "list", ",", intern),
+        FieldSpec("pacing", "Pacing", "list", ",", intern),
+        FieldSpec("perspectives", "Perspectives", "list", ",", intern),
+        FieldSpec("controls", "Controls", "list", ",", intern),
+        FieldSpec("genres", "Genres", "list", ",", intern),
+        FieldSpec("sports", "Sports", "list", ",", intern),
+        FieldSpec("vehicles", "Vehicles", "list", ",", intern),
+        FieldSpec("art_styles", "Art styles", "list", ",", intern),
+        FieldSpec("themes", "Themes", "list", ",", intern),
+        FieldSpec("series", "Series", "list", ",", intern),
+        FieldSpec("steam_appid", "Steam AppID", "list", ",", intern),
+        FieldSpec("gogcom_id", "GOGcom ID", "list", ",", intern),
+        FieldSpec("strategywiki", "StrategyWiki", "str", None, None),
+        FieldSpec("wikipedia", "Wikipedia", "str", None, None),
+        FieldSpec("license", "License", "str", None, None),
+    )
 
-class Multiplayer:
-    def __init__(self, j):
-        self.local: Support = parse_support_enum(j, "Local")
-        self.local_players: int|None = parse_value(j, "Local players", int)
-        self.local_modes: list[str] = parse_list(j, "Local modes", ",", str)
-        self.lan: Support = parse_support_enum(j, "LAN")
-        self.lan_players: int|None = parse_value(j, "LAN players", int)
-        self.lan_modes: list[str] = parse_list(j, "LAN modes", ",", str)
-        self.online: Support = parse_support_enum(j, "Online")
-        self.online_players: int|None = parse_value(j, "Online players", int)
-        self.online_modes: list[str] = parse_list(j, "Online modes", ",", str)
-        self.asynchronous: Support = parse_support_enum(j, "Asynchronous")
-        self.crossplay: Support = parse_support_enum(j, "Crossplay")
-        self.crossplay_platforms: list[str] = parse_list(j, "Crossplay platforms", ",", str)
+    cover: str|None
+    cover_url: str|None
+    developers: tuple[str, ...]
+    porters_pc_booter: tuple[str, ...]
+    porters_dos: tuple[str, ...]
+    porters_windows_3x: tuple[str, ...]
+    porters_windows: tuple[str, ...]
+    porters_mac_os: tuple[str, ...]
+    porters_os_x: tuple[str, ...]
+    porters_linux: tuple[str, ...]
+    publishers: tuple[str, ...]
+    engines: tuple[str, ...]
+    available_on: tuple[str, ...]
+    released: tuple[datetime.datetime, ...]
+    released_pc_booter: datetime.datetime|None
+    released_dos: datetime.datetime|None
+    released_windows_3x: datetime.datetime|None
+    released_windows: datetime.datetime|None
+    released_mac_os: datetime.datetime|None
+    released_os_x: datetime.datetime|None
+    released_linux: datetime.datetime|None
+    wrappers: tuple[str, ...]
+    wrappers_windows_3x: tuple[str, ...]
+    wrappers_windows: tuple[str, ...]
+    wrappers_os_x: tuple[str, ...]
+    wrappers_linux: tuple[str, ...]
+    monetization: tuple[str, ...]
+    microtransactions: tuple[str, ...]
+    modes: tuple[str, ...]
+    pacing: tuple[str, ...]
+    perspectives: tuple[str, ...]
+    controls: tuple[str, ...]
+    genres: tuple[str, ...]
+    sports: tuple[str, ...]
+    vehicles: tuple[str, ...]
+    art_styles: tuple[str, ...]
+    themes: tuple[str, ...]
+    series: tuple[str, ...]
+    steam_appid: tuple[str, ...]
+    gogcom_id: tuple[str, ...]
+    strategywiki: str|None
+    wikipedia: str|None
+    license: str|None
 
-class Tags:
-    def __init__(self, j):
-        self.stub: Support = parse_support_enum(j, "Stub")
-        self.cleanup: Support = parse_support_enum(j, "Cleanup")
-        self.top: str|None = j.get("Top")
-        self.warnings: str|None = j.get("Warnings")
-        self.gamespy: Support = parse_support_enum(j, "GameSpy")
-        self.always_online: Support = parse_support_enum(j, "Always online")
-        self.available_digitally: Support = parse_support_enum(j, "Available digitally")
-        self.config_data: Support = parse_support_enum(j, "Config data")
-        self.save_data: Support = parse_support_enum(j, "Save data")
-        self.tickcross_unknown: str|None = j.get("Tickcross unknown")
-        self.settings_screenshots: Support = parse_support_enum(j, "Settings screenshots")
-        self.video_screenshots: Support = parse_support_enum(j, "Video screenshots")
-        self.input_screenshots: Support = parse_support_enum(j, "Input screenshots")
-        self.audio_screenshots: Support = parse_support_enum(j, "Audio screenshots")
-        self.network_screenshots: Support = parse_support_enum(j, "Network screenshots")
-        self.vr_screenshots: Support = parse_support_enum(j, "VR screenshots")
+class Infobox_game_engine(Table):
+    __slots__ = ('engine', 'build', )
+    FIELDS = (
+        FieldSpec("engine", "Engine", "str", None, None),
+        FieldSpec("build", "Build", "str", None, None),
+    )
 
-class VR_support:
-    def __init__(self, j):
-        self.native_3d: Support = parse_support_enum(j, "Native 3D")
-        self.nvidia_3d_vision: Support = parse_support_enum(j, "Nvidia 3D Vision")
-        self.vorpx: Support = parse_support_enum(j, "vorpX")
-        self.vorpx_modes: list[str] = parse_list(j, "vorpX modes", ",", str)
-        self.vr_only: Support = parse_support_enum(j, "VR only")
-        self.openxr: Support = parse_support_enum(j, "OpenXR")
-        self.steamvr: Support = parse_support_enum(j, "SteamVR")
-        self.oculusvr: Support = parse_support_enum(j, "OculusVR")
-        self.windows_mixed_reality: Support = parse_support_enum(j, "Windows Mixed Reality")
-        self.osvr: Support = parse_support_enum(j, "OSVR")
-        self.forte_vfx1: Support = parse_support_enum(j, "Forte VFX1")
-        self.keyboard_mouse: Support = parse_support_enum(j, "Keyboard mouse")
-        self.body_tracking: Support = parse_support_enum(j, "Body tracking")
-        self.hand_tracking: Support = parse_support_enum(j, "Hand tracking")
-        self.face_tracking: Support = parse_support_enum(j, "Face tracking")
-        self.eye_tracking: Support = parse_support_enum(j, "Eye tracking")
-        self.tobii_eye_tracking: Support = parse_support_enum(j, "Tobii Eye Tracking")
-        self.trackir: Support = parse_support_enum(j, "TrackIR")
-        self.novint_falcon: Support = parse_support_enum(j, "Novint Falcon")
-        self.play_area_seated: Support = parse_support_enum(j, "Play area seated")
-        self.play_area_standing: Support = parse_support_enum(j, "Play area standing")
-        self.play_area_room_scale: Support = parse_support_enum(j, "Play area room scale")
+    engine: str|None
+    build: str|None
 
-class Video:
-    def __init__(self, j):
-        self.wsgf_link: str|None = j.get("WSGF Link")
-        self.widescreen_wsgf_award: str|None = j.get("Widescreen WSGF award")
-        self.multimonitor_wsgf_award: str|None = j.get("Multimonitor WSGF award")
-        self.ultrawidescreen_wsgf_award: str|None = j.get("Ultrawidescreen WSGF award")
-        self.widescreen_resolution: Support = parse_support_enum(j, "Widescreen resolution")
-        self.multimonitor: Support = parse_support_enum(j, "Multimonitor")
-        self.ultrawidescreen: Support = parse_support_enum(j, "Ultrawidescreen")
-        self.field_of_view: Support = parse_support_enum(j, "Field of view")
-        self.windowed: Support = parse_support_enum(j, "Windowed")
-        self.borderless_fullscreen_windowed: Support = parse_support_enum(j, "Borderless fullscreen windowed")
-        self.anisotropic_filtering: Support = parse_support_enum(j, "Anisotropic filtering")
-        self.antialiasing: Support = parse_support_enum(j, "Antialiasing")
-        self.upscaling: list[str] = parse_list(j, "Upscaling", ",", str)
-        self.vsync: Support = parse_support_enum(j, "Vsync")
-        self.hdr: Support = parse_support_enum(j, "HDR")
-        self.ray_tracing: Support = parse_support_enum(j, "Ray tracing")
-        self.color_blind: Support = parse_support_enum(j, "Color blind")
+class Input(Table):
+    __slots__ = ('key_remapping', 'mouse_acceleration', 'mouse_sensitivity', 'mouse_input_in_menus', 'keyboard_and_mouse_prompts', 'mouse_y_axis_inversion', 'touchscreen', 'controller_support', 'full_controller_support', 'controller_support_level', 'controller_remapping', 'controller_sensitivity', 'controller_y_axis_inversion', 'xinput_controller_support', 'xbox_prompts', 'xbox_one_impulse_triggers', 'playstation_controller_support', 'playstation_prompts', 'playstation_motion_sensors', 'playstation_motion_sensors_modes', 'playstation_light_bar_support', 'dualsense_adaptive_trigger_support', 'dualsense_haptic_feedback_support', 'playstation_controller_models', 'playstation_connection_modes', 'tracked_motion_controllers', 'tracked_motion_controller_prompts', 'other_controller_support', 'other_button_prompts', 'controller_hotplugging', 'input_prompt_override', 'controller_haptic_feedback', 'simultaneous_input', 'steam_input_api_support', 'steam_hook_input', 'steam_input_prompts', 'steam_input_prompts_icons', 'steam_input_prompts_styles', 'steam_controller_prompts', 'steam_deck_prompts', 'steam_input_motion_sensors', 'steam_input_motion_sensors_modes', 'steam_input_presets', 'steam_input_mouse_cursor_detection', )
+    FIELDS = (
+        FieldSpec("key_remapping", "Key remapping", "support", None, None),
+        FieldSpec("mouse_acceleration", "Mouse acceleration", "support", None, None),
+        FieldSpec("mouse_sensitivity", "Mouse sensitivity", "support", None, None),
+        FieldSpec("mouse_input_in_menus", "Mouse input in menus", "support", None, None),
+        FieldSpec("keyboard_and_mouse_prompts", "Keyboard and mouse prompts", "support", None, None),
+        FieldSpec("mouse_y_axis_inversion", "Mouse Y axis inversion", "support", None, None),
+        FieldSpec("touchscreen", "Touchscreen", "support", None, None),
+        FieldSpec("controller_support", "Controller support", "support", None, None),
+        FieldSpec("full_controller_support", "Full controller support", "support", None, None),
+        FieldSpec("controller_support_level", "Controller support level", "support", None, None),
+        FieldSpec("controller_remapping", "Controller remapping", "support", None, None),
+        FieldSpec("controller_sensitivity", "Controller sensitivity", "support", None, None),
+        FieldSpec("controller_y_axis_inversion", "Controller Y axis inversion", "support", None, None),
+        FieldSpec("xinput_controller_support", "XInput controller support", "support", None, None),
+        FieldSpec("xbox_prompts", "Xbox prompts", "support", None, None),
+        FieldSpec("xbox_one_impulse_triggers", "Xbox One Impulse Triggers", "support", None, None),
+        FieldSpec("playstation_controller_support", "Playstation controller support", "support", None, None),
+        FieldSpec("playstation_prompts", "Playstation prompts", "support", None, None),
+        FieldSpec("playstation_motion_sensors", "Playstation motion sensors", "support", None, None),
+        FieldSpec("playstation_motion_sensors_modes", "Playstation motion sensors modes", "list", ",", intern),
+        FieldSpec("playstation_light_bar_support", "Playstation light bar support", "str", None, None),
+        FieldSpec("dualsense_adaptive_trigger_support", "DualSense adaptive trigger support", "support", None, None),
+        FieldSpec("dualsense_haptic_feedback_support", "DualSense haptic feedback support", "support", None, None),
+        FieldSpec("playstation_controller_models", "PlayStation controller models", "list", ",", intern),
+        FieldSpec("playstation_connection_modes", "Playstation connection modes", "list", ",", intern),
+        FieldSpec("tracked_motion_controllers", "Tracked motion controllers", "support", None, None),
+        FieldSpec("tracked_motion_controller_prompts", "Tracked motion controller prompts", "support", None, None),
+        FieldSpec("other_controller_support", "Other controller support", "support", None, None),
+        FieldSpec("other_button_prompts", "Other button prompts", "list", ",", intern),
+        FieldSpec("controller_hotplugging", "Controller hotplugging", "support", None, None),
+        FieldSpec("input_prompt_override", "Input prompt override", "support", None, None),
+        FieldSpec("controller_haptic_feedback", "Controller haptic feedback", "support", None, None),
+        FieldSpec("simultaneous_input", "Simultaneous input", "support", None, None),
+        FieldSpec("steam_input_api_support", "Steam Input API support", "support", None, None),
+        FieldSpec("steam_hook_input", "Steam hook input", "support", None, None),
+        FieldSpec("steam_input_prompts", "Steam Input prompts", "support", None, None),
+        FieldSpec("steam_input_prompts_icons", "Steam Input prompts icons", "list", ",", intern),
+        FieldSpec("steam_input_prompts_styles", "Steam Input prompts styles", "list", ",", intern),
+        FieldSpec("steam_controller_prompts", "Steam Controller prompts", "support", None, None),
+        FieldSpec("steam_deck_prompts", "Steam Deck prompts", "support", None, None),
+        FieldSpec("steam_input_motion_sensors", "Steam Input motion sensors", "support", None, None),
+        FieldSpec("steam_input_motion_sensors_modes", "Steam Input motion sensors modes", "list", ",", intern),
+        FieldSpec("steam_input_presets", "Steam Input presets", "support", None, None),
+        FieldSpec("steam_input_mouse_cursor_detection", "Steam Input mouse cursor detection", "support", None, None),
+    )
 
-class XDG:
-    def __init__(self, j):
-        self.supported: Support = parse_support_enum(j, "Supported")
+    key_remapping: SupportValue
+    mouse_acceleration: SupportValue
+    mouse_sensitivity: SupportValue
+    mouse_input_in_menus: SupportValue
+    keyboard_and_mouse_prompts: SupportValue
+    mouse_y_axis_inversion: SupportValue
+    touchscreen: SupportValue
+    controller_support: SupportValue
+    full_controller_support: SupportValue
+    controller_support_level: SupportValue
+    controller_remapping: SupportValue
+    controller_sensitivity: SupportValue
+    controller_y_axis_inversion: SupportValue
+    xinput_controller_support: SupportValue
+    xbox_prompts: SupportValue
+    xbox_one_impulse_triggers: SupportValue
+    playstation_controller_support: SupportValue
+    playstation_prompts: SupportValue
+    playstation_motion_sensors: SupportValue
+    playstation_motion_sensors_modes: tuple[str, ...]
+    playstation_light_bar_support: str|None
+    dualsense_adaptive_trigger_support: SupportValue
+    dualsense_haptic_feedback_support: SupportValue
+    playstation_controller_models: tuple[str, ...]
+    playstation_connection_modes: tuple[str, ...]
+    tracked_motion_controllers: SupportValue
+    tracked_motion_controller_prompts: SupportValue
+    other_controller_support: SupportValue
+    other_button_prompts: tuple[str, ...]
+    controller_hotplugging: SupportValue
+    input_prompt_override: SupportValue
+    controller_haptic_feedback: SupportValue
+    simultaneous_input: SupportValue
+    steam_input_api_support: SupportValue
+    steam_hook_input: SupportValue
+    steam_input_prompts: SupportValue
+    steam_input_prompts_icons: tuple[str, ...]
+    steam_input_prompts_styles: tuple[str, ...]
+    steam_controller_prompts: SupportValue
+    steam_deck_prompts: SupportValue
+    steam_input_motion_sensors: SupportValue
+    steam_input_motion_sensors_modes: tuple[str, ...]
+    steam_input_presets: SupportValue
+    steam_input_mouse_cursor_detection: SupportValue
+
+class L10n(Table):
+    __slots__ = ('language', 'status', 'interface', 'audio', 'subtitles', 'notes', )
+    FIELDS = (
+        FieldSpec("language", "Language", "str", None, None),
+        FieldSpec("status", "Status", "str", None, None),
+        FieldSpec("interface", "Interface", "support", None, None),
+        FieldSpec("audio", "Audio", "support", None, None),
+        FieldSpec("subtitles", "Subtitles", "support", None, None),
+        FieldSpec("notes", "Notes", "str", None, None),
+    )
+
+    language: str|None
+    status: str|None
+    interface: SupportValue
+    audio: SupportValue
+    subtitles: SupportValue
+    notes: str|None
+
+class Middleware(Table):
+    __slots__ = ('physics', 'audio', 'interface', 'input', 'cutscenes', 'multiplayer', 'anticheat', )
+    FIELDS = (
+        FieldSpec("physics", "Physics", "list", ",", intern),
+        FieldSpec("audio", "Audio", "list", ",", intern),
+        FieldSpec("interface", "Interface", "list", ",", intern),
+        FieldSpec("input", "Input", "list", ",", intern),
+        FieldSpec("cutscenes", "Cutscenes", "list", ",", intern),
+        FieldSpec("multiplayer", "Multiplayer", "list", ",", intern),
+        FieldSpec("anticheat", "Anticheat", "list", ",", intern),
+    )
+
+    physics: tuple[str, ...]
+    audio: tuple[str, ...]
+    interface: tuple[str, ...]
+    input: tuple[str, ...]
+    cutscenes: tuple[str, ...]
+    multiplayer: tuple[str, ...]
+    anticheat: tuple[str, ...]
+
+class Multiplayer(Table):
+    __slots__ = ('local', 'local_players', 'local_modes', 'lan', 'lan_players', 'lan_modes', 'online', 'online_players', 'online_modes', 'asynchronous', 'crossplay', 'crossplay_platforms', )
+    FIELDS = (
+        FieldSpec("local", "Local", "support", None, None),
+        FieldSpec("local_players", "Local players", "value", None, int),
+        FieldSpec("local_modes", "Local modes", "list", ",", intern),
+        FieldSpec("lan", "LAN", "support", None, None),
+        FieldSpec("lan_players", "LAN players", "value", None, int),
+        FieldSpec("lan_modes", "LAN modes", "list", ",", intern),
+        FieldSpec("online", "Online", "support", None, None),
+        FieldSpec("online_players", "Online players", "value", None, int),
+        FieldSpec("online_modes", "Online modes", "list", ",", intern),
+        FieldSpec("asynchronous", "Asynchronous", "support", None, None),
+        FieldSpec("crossplay", "Crossplay", "support", None, None),
+        FieldSpec("crossplay_platforms", "Crossplay platforms", "list", ",", intern),
+    )
+
+    local: SupportValue
+    local_players: int|None
+    local_modes: tuple[str, ...]
+    lan: SupportValue
+    lan_players: int|None
+    lan_modes: tuple[str, ...]
+    online: SupportValue
+    online_players: int|None
+    online_modes: tuple[str, ...]
+    asynchronous: SupportValue
+    crossplay: SupportValue
+    crossplay_platforms: tuple[str, ...]
+
+class Tags(Table):
+    __slots__ = ('stub', 'cleanup', 'top', 'warnings', 'gamespy', 'always_online', 'available_digitally', 'config_data', 'save_data', 'tickcross_unknown', 'settings_screenshots', 'video_screenshots', 'input_screenshots', 'audio_screenshots', 'network_screenshots', 'vr_screenshots', )
+    FIELDS = (
+        FieldSpec("stub", "Stub", "support", None, None),
+        FieldSpec("cleanup", "Cleanup", "support", None, None),
+        FieldSpec("top", "Top", "str", None, None),
+        FieldSpec("warnings", "Warnings", "str", None, None),
+        FieldSpec("gamespy", "GameSpy", "support", None, None),
+        FieldSpec("always_online", "Always online", "support", None, None),
+        FieldSpec("available_digitally", "Available digitally", "support", None, None),
+        FieldSpec("config_data", "Config data", "support", None, None),
+        FieldSpec("save_data", "Save data", "support", None, None),
+        FieldSpec("tickcross_unknown", "Tickcross unknown", "str", None, None),
+        FieldSpec("settings_screenshots", "Settings screenshots", "support", None, None),
+        FieldSpec("video_screenshots", "Video screenshots", "support", None, None),
+        FieldSpec("input_screenshots", "Input screenshots", "support", None, None),
+        FieldSpec("audio_screenshots", "Audio screenshots", "support", None, None),
+        FieldSpec("network_screenshots", "Network screenshots", "support", None, None),
+        FieldSpec("vr_screenshots", "VR screenshots", "support", None, None),
+    )
+
+    stub: SupportValue
+    cleanup: SupportValue
+    top: str|None
+    warnings: str|None
+    gamespy: SupportValue
+    always_online: SupportValue
+    available_digitally: SupportValue
+    config_data: SupportValue
+    save_data: SupportValue
+    tickcross_unknown: str|None
+    settings_screenshots: SupportValue
+    video_screenshots: SupportValue
+    input_screenshots: SupportValue
+    audio_screenshots: SupportValue
+    network_screenshots: SupportValue
+    vr_screenshots: SupportValue
+
+class VR_support(Table):
+    __slots__ = ('native_3d', 'nvidia_3d_vision', 'vorpx', 'vorpx_modes', 'vr_only', 'openxr', 'steamvr', 'oculusvr', 'windows_mixed_reality', 'osvr', 'forte_vfx1', 'keyboard_mouse', 'body_tracking', 'hand_tracking', 'face_tracking', 'eye_tracking', 'tobii_eye_tracking', 'trackir', 'novint_falcon', 'play_area_seated', 'play_area_standing', 'play_area_room_scale', )
+    FIELDS = (
+        FieldSpec("native_3d", "Native 3D", "support", None, None),
+        FieldSpec("nvidia_3d_vision", "Nvidia 3D Vision", "support", None, None),
+        FieldSpec("vorpx", "vorpX", "support", None, None),
+        FieldSpec("vorpx_modes", "vorpX modes", "list", ",", intern),
+        FieldSpec("vr_only", "VR only", "support", None, None),
+        FieldSpec("openxr", "OpenXR", "support", None, None),
+        FieldSpec("steamvr", "SteamVR", "support", None, None),
+        FieldSpec("oculusvr", "OculusVR", "support", None, None),
+        FieldSpec("windows_mixed_reality", "Windows Mixed Reality", "support", None, None),
+        FieldSpec("osvr", "OSVR", "support", None, None),
+        FieldSpec("forte_vfx1", "Forte VFX1", "support", None, None),
+        FieldSpec("keyboard_mouse", "Keyboard mouse", "support", None, None),
+        FieldSpec("body_tracking", "Body tracking", "support", None, None),
+        FieldSpec("hand_tracking", "Hand tracking", "support", None, None),
+        FieldSpec("face_tracking", "Face tracking", "support", None, None),
+        FieldSpec("eye_tracking", "Eye tracking", "support", None, None),
+        FieldSpec("tobii_eye_tracking", "Tobii Eye Tracking", "support", None, None),
+        FieldSpec("trackir", "TrackIR", "support", None, None),
+        FieldSpec("novint_falcon", "Novint Falcon", "support", None, None),
+        FieldSpec("play_area_seated", "Play area seated", "support", None, None),
+        FieldSpec("play_area_standing", "Play area standing", "support", None, None),
+        FieldSpec("play_area_room_scale", "Play area room scale", "support", None, None),
+    )
+
+    native_3d: SupportValue
+    nvidia_3d_vision: SupportValue
+    vorpx: SupportValue
+    vorpx_modes: tuple[str, ...]
+    vr_only: SupportValue
+    openxr: SupportValue
+    steamvr: SupportValue
+    oculusvr: SupportValue
+    windows_mixed_reality: SupportValue
+    osvr: SupportValue
+    forte_vfx1: SupportValue
+    keyboard_mouse: SupportValue
+    body_tracking: SupportValue
+    hand_tracking: SupportValue
+    face_tracking: SupportValue
+    eye_tracking: SupportValue
+    tobii_eye_tracking: SupportValue
+    trackir: SupportValue
+    novint_falcon: SupportValue
+    play_area_seated: SupportValue
+    play_area_standing: SupportValue
+    play_area_room_scale: SupportValue
+
+class Video(Table):
+    __slots__ = ('wsgf_link', 'widescreen_wsgf_award', 'multimonitor_wsgf_award', 'ultrawidescreen_wsgf_award', 'widescreen_resolution', 'multimonitor', 'ultrawidescreen', 'field_of_view', 'windowed', 'borderless_fullscreen_windowed', 'anisotropic_filtering', 'antialiasing', 'upscaling', 'vsync', 'hdr', 'ray_tracing', 'color_blind', )
+    FIELDS = (
+        FieldSpec("wsgf_link", "WSGF Link", "str", None, None),
+        FieldSpec("widescreen_wsgf_award", "Widescreen WSGF award", "str", None, None),
+        FieldSpec("multimonitor_wsgf_award", "Multimonitor WSGF award", "str", None, None),
+        FieldSpec("ultrawidescreen_wsgf_award", "Ultrawidescreen WSGF award", "str", None, None),
+        FieldSpec("widescreen_resolution", "Widescreen resolution", "support", None, None),
+        FieldSpec("multimonitor", "Multimonitor", "support", None, None),
+        FieldSpec("ultrawidescreen", "Ultrawidescreen", "support", None, None),
+        FieldSpec("field_of_view", "Field of view", "support", None, None),
+        FieldSpec("windowed", "Windowed", "support", None, None),
+        FieldSpec("borderless_fullscreen_windowed", "Borderless fullscreen windowed", "support", None, None),
+        FieldSpec("anisotropic_filtering", "Anisotropic filtering", "support", None, None),
+        FieldSpec("antialiasing", "Antialiasing", "support", None, None),
+        FieldSpec("upscaling", "Upscaling", "list", ",", intern),
+        FieldSpec("vsync", "Vsync", "support", None, None),
+        FieldSpec("hdr", "HDR", "support", None, None),
+        FieldSpec("ray_tracing", "Ray tracing", "support", None, None),
+        FieldSpec("color_blind", "Color blind", "support", None, None),
+    )
+
+    wsgf_link: str|None
+    widescreen_wsgf_award: str|None
+    multimonitor_wsgf_award: str|None
+    ultrawidescreen_wsgf_award: str|None
+    widescreen_resolution: SupportValue
+    multimonitor: SupportValue
+    ultrawidescreen: SupportValue
+    field_of_view: SupportValue
+    windowed: SupportValue
+    borderless_fullscreen_windowed: SupportValue
+    anisotropic_filtering: SupportValue
+    antialiasing: SupportValue
+    upscaling: tuple[str, ...]
+    vsync: SupportValue
+    hdr: SupportValue
+    ray_tracing: SupportValue
+    color_blind: SupportValue
+
+class XDG(Table):
+    __slots__ = ('supported', )
+    FIELDS = (
+        FieldSpec("supported", "Supported", "support", None, None),
+    )
+
+    supported: SupportValue
@@ -0,0 +1,144 @@
+import asyncio
+import datetime
+import email.utils
+import random
+import threading
+import time
+
+import httpx
+
+class RateLimiter:
+    """
+    Token bucket limiting the rate of the requests sent to the API.
+
+    A same limiter can be shared by the synchronous and asynchronous clients
+    of one or more PCGW objects, and by several threads.
+
+    Attributes:
+        rate: number of requests allowed per second.
+        burst: maximum number of requests that can be sent at once after
+               a period of inactivity.
+    """
+    def __init__(self, rate: float = 5, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """
+        Adds the tokens accumulated since the last update, the lock being held.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """
+        Takes a token from the bucket and returns the time to wait before
+        the token is actually available.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0., -self._tokens / self.rate)
+
+    def acquire(self):
+        """
+        Waits until a request can be sent.
+        """
+        if (delay := self._reserve()) > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self):
+        """
+        Waits until a request can be sent, asynchronous version.
+        """
+        if (delay := self._reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, delay: float):
+        """
+        Delays every following request by at least delay seconds, for instance
+        when the server asked to retry later.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -delay * self.rate)
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Requests are retried on transport errors, on the HTTP statuses in
+    retry_statuses and on the MediaWiki errors in retry_api_errors (such as
+    maxlag), after an exponential backoff with jitter, or after the delay
+    given by the Retry-After header of the response when there is one.
+
+    Attributes:
+        max_retries: maximum number of retries of a request.
+        backoff_base: delay before the first retry, in seconds.
+        backoff_max: maximum delay between two retries, in seconds.
+        jitter: maximum fraction of the delay added at random.
+        retry_statuses: HTTP statuses of the responses to retry.
+        retry_api_errors: MediaWiki error codes of the responses to retry.
+    """
+    def __init__(self, max_retries: int = 3, backoff_base: float = .5,
+                       backoff_max: float = 30, jitter: float = .5,
+                       retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504),
+                       retry_api_errors: tuple[str, ...] = ('maxlag', 'ratelimited')):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.retry_api_errors = retry_api_errors
+
+    def should_retry(self, response: httpx.Response) -> bool:
+        """
+        Returns whether the response calls for a retry of the request.
+        """
+        return (response.status_code in self.retry_statuses
+                or response.headers.get('MediaWiki-API-Error') in self.retry_api_errors)
+
+    def get_delay(self, attempt: int, response: httpx.Response|None = None) -> float|None:
+        """
+        Returns the delay before retrying a request.
+
+        Parameters:
+            attempt: number of retries already made.
+            response: response to the request, None in case of transport error.
+
+        Returns:
+            The delay in seconds, or None if the request must not be retried.
+        """
+        if attempt >= self.max_retries or (response is not None and not self.should_retry(response)):
+            return None
+        if response is not None and (retry_after := parse_retry_after(response)) is not None:
+            return retry_after
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return delay * (1 + random.uniform(0, self.jitter))
+
+def parse_retry_after(response: httpx.Response) -> float|None:
+    """
+    Parses the Retry-After header of a response, given either in seconds
+    or as an HTTP date.
+
+    Returns:
+        The delay in seconds or None if the header is absent or invalid.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0., float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0., (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
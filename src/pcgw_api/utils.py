@@ -1,12 +1,174 @@
+import datetime
 from enum import Enum
+import functools
+import json
 import os
-from typing import Callable, Any
+from sys import intern
+from types import MappingProxyType
+from typing import Callable, Any, Mapping, NamedTuple
 
 TABLES_INFO_FILENAME = os.path.join(os.path.dirname(__file__), "tables.json")
 
-def parse_list(j: dict, key: str, delimiter: str, post_processing: Callable[[str], Any]) -> list:
+ASSOCIATION_TABLES = ('L10n', 'Infobox_game_engine')
+
+class FieldSpec(NamedTuple):
+    """
+    Describes how a field of a table is deserialized, as generated in the
+    FIELDS attribute of the classes of the tables module.
+
+    Attributes:
+        name: name of the attribute of the class.
+        key: key of the field in the rows returned by the API.
+        kind: "str", "list", "support" or "value", respectively for values
+              kept as strings, split into tuples, parsed into SupportValue
+              objects and parsed with post_processing.
+        delimiter: delimiter of the elements of a list field.
+        post_processing: function processing the values of list and value fields.
+    """
+    name: str
+    key: str
+    kind: str
+    delimiter: str|None
+    post_processing: Callable[[str], Any]|None
+
+class TableSchema(NamedTuple):
+    """
+    Describes a table of the PCGamingWiki database and the pieces of
+    cargoquery parameters needed to request it.
+
+    Attributes:
+        name: name of the table.
+        fields: names of the fields of the table as used in requests.
+        join_on: join clause of the table with Infobox_game.
+        fields_string: comma-separated list of the fields prefixed by the table name.
+        fields_by_attr: names of the fields indexed by the corresponding
+                        attribute names of the class from the tables module.
+    """
+    name: str
+    fields: tuple[str, ...]
+    join_on: str
+    fields_string: str
+    fields_by_attr: Mapping[str, str]
+
+    @classmethod
+    def from_fields(cls, name: str, fields: list[str]) -> "TableSchema":
+        return cls(
+            name,
+            tuple(fields),
+            f'Infobox_game._pageID={name}._pageID',
+            ','.join(f'{name}.{field}' for field in fields),
+            MappingProxyType({field.lower(): field for field in fields}),
+        )
+
+class GameProjection(NamedTuple):
     """
-    Parses a string value in a dictionary into a list.
+    Parameters of a cargoquery request for a selection of the game tables.
+
+    Attributes:
+        tables: comma-separated list of the tables to join.
+        join_on: join clauses of the tables.
+        fields: comma-separated list of the fields to request.
+        loaded_tables: names of the tables whose fields are requested,
+                       None if every table is.
+    """
+    tables: str
+    join_on: str
+    fields: str
+    loaded_tables: frozenset[str]|None
+
+class Schema:
+    """
+    Immutable description of the tables of the PCGamingWiki database used by
+    the client, as saved in the tables.json file by the schema module.
+
+    Attributes:
+        tables: table schemas indexed by table name.
+        game_tables: names of the tables joined to request a game, that is
+                     every table except the association tables.
+        game_joins: join clauses of the game tables.
+        game_fields: fields of the game tables, with the page name and ID
+                     aliased as Page and PageID.
+    """
+    __slots__ = ('tables', 'game_tables', 'game_joins', 'game_fields')
+
+    def __init__(self, tables_info: dict[str, list[str]]):
+        self.tables: Mapping[str, TableSchema] = MappingProxyType(
+                {name: TableSchema.from_fields(name, fields) for name, fields in tables_info.items()})
+        self.game_tables: tuple[str, ...] = tuple(table for table in self.tables
+                                                  if table not in ASSOCIATION_TABLES)
+        self.game_joins = ','.join(self.tables[table].join_on for table in self.game_tables
+                                   if table != 'Infobox_game')
+        self.game_fields = ','.join(['Infobox_game._pageName=Page', 'Infobox_game._pageID=PageID'] +
+                                    [self.tables[table].fields_string for table in self.game_tables
+                                     if self.tables[table].fields])
+
+    @functools.lru_cache(maxsize=256)
+    def game_projection(self, tables: tuple[str, ...]|None = None,
+                              fields: tuple[str, ...]|None = None) -> GameProjection:
+        """
+        Builds the parameters of a request for a selection of the game tables.
+
+        Parameters:
+            tables: names of the tables to request entirely.
+            fields: fields to request, as "<table>.<field>" strings where the field
+                    is either the name of the field in the database or the name
+                    of the attribute of the class from the tables module.
+            If both are None, every field of every game table is requested.
+
+        Returns:
+            A GameProjection.
+
+        Raises:
+            ValueError: if a table or field is not part of the game tables.
+        """
+        if tables is None and fields is None:
+            return GameProjection(','.join(self.game_tables), self.game_joins, self.game_fields, None)
+        selected: dict[str, list[str]] = {}
+        for table in tables or ():
+            if table not in self.game_tables:
+                raise ValueError(f'unknown game table "{table}"')
+            selected[table] = list(self.tables[table].fields)
+        for field in fields or ():
+            table, _, name = field.partition('.')
+            if table not in self.game_tables:
+                raise ValueError(f'unknown game table "{table}"')
+            table_schema = self.tables[table]
+            name = name if name in table_schema.fields else table_schema.fields_by_attr.get(name.lower())
+            if name is None:
+                raise ValueError(f'unknown field "{field}"')
+            if name not in selected.setdefault(table, []):
+                selected[table].append(name)
+        joined = ['Infobox_game'] + [table for table in self.game_tables
+                                     if table in selected and table != 'Infobox_game']
+        return GameProjection(
+            ','.join(joined),
+            ','.join(self.tables[table].join_on for table in joined[1:]),
+            ','.join(['Infobox_game._pageName=Page', 'Infobox_game._pageID=PageID'] +
+                     [f'{table}.{field}' for table in joined for field in selected.get(table, [])]),
+            frozenset(selected),
+        )
+
+    def __getitem__(self, table: str) -> TableSchema:
+        return self.tables[table]
+
+    def get(self, table: str) -> TableSchema:
+        """
+        Returns the schema of a table, an empty one if the table is unknown.
+        """
+        return self.tables.get(table) or TableSchema.from_fields(table, [])
+
+@functools.cache
+def get_schema() -> Schema:
+    """
+    Returns the schema of the PCGamingWiki tables, loaded from tables.json
+    on the first call and shared afterwards.
+    """
+    with open(TABLES_INFO_FILENAME) as f:
+        return Schema(json.load(f))
+
+def parse_list(j: dict, key: str, delimiter: str, post_processing: Callable[[str], Any]) -> tuple:
+    """
+    Parses a string value in a dictionary into a tuple.
 
     Parameters:
         j: dictionary to get the value from.
@@ -15,7 +177,8 @@ def parse_list(j: dict, key: str, delimiter: str, post_processing: Callable[[str
         post_processing: function with wich to process each string element parsed.
 
     Returns:
-        A list of values of the type returned by the post_processing function.
+        A tuple of values of the type returned by the post_processing function,
+        the shared empty tuple if there is no value.
     """
     if s := j.get(key):
         l = []
@@ -24,9 +187,9 @@ def parse_list(j: dict, key: str, delimiter: str, post_processing: Callable[[str
                 l.append(post_processing(x))
             except ValueError:
                 pass
-        return l
+        return tuple(l)
     else:
-        return []
+        return ()
 
 def parse_value(j: dict, key: str, post_processing: Callable[[str], Any]) -> Any|None:
     """
@@ -49,40 +212,27 @@ def parse_value(j: dict, key: str, post_processing: Callable[[str], Any]) -> Any
     except (TypeError, ValueError):
         return None
 
-def parse_support_enum(j: dict, key: str) -> "Support":
+def parse_support_enum(j: dict, key: str) -> "SupportValue":
     """
-    Parses a string value from a dictionary into a Support object.
+    Parses a string value from a dictionary into a SupportValue object.
 
-    The string value is used to initialize a Support object of the
-    matching enum value.
+    The string value is mapped to the matching enum value of Support.
     If the value is erroneous or a synonym of a value of Support,
     it is translated into the corresponding enum value,
     for instance "fakse" −> "false" or "yes" −> "true".
-    If the value does not match any enum value of Support, the 
-    Support object is initialized to OTHER_VALUE.
-    In any case the attribute raw_value of the Support object is
-    set to the value obtained from the input dictionary.
+    If the value does not match any enum value of Support, it is
+    mapped to OTHER_VALUE.
+    In any case the attribute raw_value of the SupportValue object is
+    the value obtained from the input dictionary.
 
     Parameters:
         j: dictionary to get the string value from.
         key: key of the value to parse in the dictionary.
 
     Returns:
-        A Support object.
-    """
-    value = j.get(key)
-    if value in [field.value for field in Support]:
-        new_enum = Support(value)
-    elif value == 'fakse': # normalize erroneous values
-        new_enum = Support('false')
-    elif value == 'yes': # normalize erroneous values
-        new_enum = Support('true')
-    elif value == 'partial': # normalize erroneous values
-        new_enum = Support('limited')
-    else:
-        new_enum = Support('other value')
-    new_enum.raw_value = value
-    return new_enum
+        A SupportValue object, shared by every parse of the same value.
+    """
+    return SupportValue.of(j.get(key))
 
 class Support(Enum):
     """
@@ -100,7 +250,8 @@ class Support(Enum):
         COMPLETE: feature completely supported.
         ALWAYS_ON: feature supported and cannot be deactivated.
         OTHER_VALUE represents any value not enumerated. The actual value parsed
-                    from the database is available in the attribute raw_value.
+                    from the database is available in the attribute raw_value
+                    of the SupportValue objects.
 
     When used as a boolean, an object of this class is True when the enum value
     is not NULL, UNKNOWN, NA or FALSE.
@@ -115,8 +266,183 @@ class Support(Enum):
     COMPLETE = 'complete'
     ALWAYS_ON = 'always on'
     OTHER_VALUE = 'other value'
-    def __init__(self, *args):
-        super().__init__(*args)
-        self.raw_value: str|None = None
     def __bool__(self):
         return self.name not in ('NULL', 'UNKNOWN', 'NA', 'FALSE')
+
+SUPPORT_NORMALIZATION: dict[str|None, Support] = {
+    **{field.value: field for field in Support},
+    'fakse': Support.FALSE,
+    'yes': Support.TRUE,
+    'partial': Support.LIMITED,
+}
+
+class SupportValue:
+    """
+    Immutable support status of a feature of a game as parsed from the
+    PCGamingWiki database: a Support enum value along with the raw value
+    it was parsed from.
+
+    The objects are interned by raw value, use SupportValue.of to get them.
+    A SupportValue compares equal to its Support enum value (and to the
+    other SupportValue objects of the same enum value) and has the same
+    truth value.
+
+    Attributes:
+        support: Support enum value.
+        raw_value: value parsed from the database.
+    """
+    __slots__ = ('support', 'raw_value')
+    MAX_INTERNED = 4096
+    _interned: dict[str|None, "SupportValue"] = {}
+
+    def __init__(self, support: Support, raw_value: str|None):
+        object.__setattr__(self, 'support', support)
+        object.__setattr__(self, 'raw_value', raw_value)
+
+    @classmethod
+    def of(cls, raw_value: str|None) -> "SupportValue":
+        """
+        Returns the SupportValue corresponding to a raw value of the database.
+        """
+        try:
+            return cls._interned[raw_value]
+        except KeyError:
+            value = cls(SUPPORT_NORMALIZATION.get(raw_value, Support.OTHER_VALUE), raw_value)
+            if len(cls._interned) < cls.MAX_INTERNED:
+                value = cls._interned.setdefault(raw_value, value)
+            return value
+
+    @property
+    def name(self) -> str:
+        return self.support.name
+
+    @property
+    def value(self) -> str|None:
+        return self.support.value
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} objects are immutable')
+
+    def __reduce__(self):
+        return (SupportValue.of, (self.raw_value,))
+
+    def __eq__(self, other):
+        if isinstance(other, SupportValue):
+            return self.support is other.support
+        if isinstance(other, Support):
+            return self.support is other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.support)
+
+    def __bool__(self):
+        return bool(self.support)
+
+    def __repr__(self):
+        if self.raw_value == self.support.value:
+            return str(self.support)
+        return f'{type(self).__name__}({self.support}, {self.raw_value!r})'
+
+    def __str__(self):
+        return str(self.support)
+
+for _raw_value in SUPPORT_NORMALIZATION:
+    SupportValue.of(_raw_value)
+
+@functools.lru_cache(maxsize=65536)
+def parse_date(s: str) -> datetime.datetime:
+    """
+    datetime.datetime.fromisoformat with its results cached, as the same
+    dates are found in many rows.
+    """
+    return datetime.datetime.fromisoformat(s)
+
+def _cached_post_processing(post_processing: Callable[[str], Any]) -> Callable[[str], Any]:
+    return parse_date if post_processing == datetime.datetime.fromisoformat else post_processing
+
+@functools.cache
+def list_decoder(delimiter: str, post_processing: Callable[[str], Any]) -> Callable[[str|None], tuple]:
+    """
+    Returns a function decoding the string value of a list field into a
+    tuple, as parse_list does. The tuples are cached by string value, so
+    that the lists shared by many games are split and processed only once.
+
+    Parameters:
+        delimiter: character delimiting the elements of the list.
+        post_processing: function with which to process each element.
+    """
+    post_processing = _cached_post_processing(post_processing)
+    if post_processing is intern:
+        @functools.lru_cache(maxsize=4096)
+        def split(s: str) -> tuple:
+            return tuple({intern(x) for x in s.split(delimiter) if x.strip()})
+    else:
+        @functools.lru_cache(maxsize=4096)
+        def split(s: str) -> tuple:
+            l = []
+            for x in {x for x in s.split(delimiter) if x.strip()}:
+                try:
+                    l.append(post_processing(x))
+                except ValueError:
+                    pass
+            return tuple(l)
+    def decode(s: str|None) -> tuple:
+        return split(s) if s else ()
+    return decode
+
+@functools.cache
+def value_decoder(post_processing: Callable[[str], Any]) -> Callable[[str|None], Any]:
+    """
+    Returns a function decoding the string value of a field with
+    post_processing, as parse_value does.
+    """
+    post_processing = _cached_post_processing(post_processing)
+    def decode(s: str|None) -> Any|None:
+        if not s:
+            return None
+        try:
+            return post_processing(s)
+        except (TypeError, ValueError):
+            return None
+    return decode
+
+def field_decoder(spec: FieldSpec) -> Callable[[str|None], Any]|None:
+    """
+    Returns the function decoding the string values of a field,
+    None for the fields kept as strings.
+    """
+    if spec.kind == 'list':
+        return list_decoder(spec.delimiter, spec.post_processing)
+    if spec.kind == 'support':
+        return SupportValue.of
+    if spec.kind == 'value':
+        return value_decoder(spec.post_processing)
+    return None
+
+class Table:
+    """
+    Base class of the classes of the tables module.
+
+    The decoding plan of each table is built once from its FIELDS when the
+    class is created: the keys of the fields kept as strings, and the keys
+    and decoding functions of the other fields, so that decoding a row is
+    a loop over the plan.
+    """
+    __slots__ = ()
+    FIELDS: tuple[FieldSpec, ...] = ()
+    _RAW_PLAN: tuple[tuple[str, str], ...] = ()
+    _DECODED_PLAN: tuple[tuple[str, str, Callable[[str|None], Any]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        decoders = [(spec.name, spec.key, field_decoder(spec)) for spec in cls.FIELDS]
+        cls._RAW_PLAN = tuple((name, key) for name, key, decoder in decoders if decoder is None)
+        cls._DECODED_PLAN = tuple(plan for plan in decoders if plan[2] is not None)
+
+    def __init__(self, j: dict):
+        get = j.get
+        for name, key in self._RAW_PLAN:
+            setattr(self, name, get(key))
+        for name, key, decode in self._DECODED_PLAN:
+            setattr(self, name, decode(get(key)))
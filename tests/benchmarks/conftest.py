@@ -0,0 +1,74 @@
+import json
+import os
+import re
+import urllib.parse
+from typing import Iterator
+
+import httpx
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import pcgw_api
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def load_fixture(name: str):
+    with open(os.path.join(FIXTURES_DIR, name)) as f:
+        return json.load(f)
+
+class FixtureAPI:
+    """
+    Serves the API responses of the fixtures directory (synthetic ones made
+    by generate.py, unless recorded again with record.py), filtered
+    according to the parameters of the requests as the API would.
+
+    Attributes:
+        games: rows of the games, with every field of the game tables.
+        associations: rows of the association tables indexed by table name.
+        cargofields: responses to cargofields requests indexed by table name.
+        requests: number of requests served.
+    """
+    def __init__(self):
+        self.games = [row['title'] for row in load_fixture('cargoquery_games.json')['cargoquery']]
+        self.associations = {
+            'L10n': [row['title'] for row in load_fixture('cargoquery_l10n.json')['cargoquery']],
+            'Infobox_game_engine': [row['title'] for row in
+                                    load_fixture('cargoquery_infobox_game_engine.json')['cargoquery']],
+        }
+        self.cargofields = load_fixture('cargofields.json')
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        params = dict(urllib.parse.parse_qsl(request.content.decode()) if request.method == 'POST'
+                      else request.url.params)
+        if params.get('action') == 'cargofields':
+            return httpx.Response(200, json=self.cargofields.get(params.get('table'), {}))
+        where = params.get('where', '')
+        if params.get('tables') in self.associations:
+            page_ids = set(re.findall(r'\d+', where.partition(' IN ')[2]))
+            rows = [row for row in self.associations[params['tables']] if row['PageID'] in page_ids]
+        else:
+            rows = self.games
+            if match := re.search(r'_pageID>(\d+)', where):
+                rows = [row for row in rows if int(row['PageID']) > int(match.group(1))]
+            names = set(re.findall(r'_pageName="([^"]*)"', where))
+            page_ids = set(re.findall(r'_pageID="(\d+)"', where))
+            if names or page_ids:
+                rows = [row for row in rows if row['Page'] in names or row['PageID'] in page_ids]
+            if match := re.search(r'LIKE "%(.*)%"', where):
+                rows = [row for row in rows if match.group(1).lower() in row['Page'].lower()]
+        offset = int(params.get('offset', 0))
+        rows = rows[offset:offset + int(params.get('limit', 50))]
+        return httpx.Response(200, json={'cargoquery': [{'title': row} for row in rows]})
+
+@pytest.fixture(scope='session')
+def api() -> FixtureAPI:
+    return FixtureAPI()
+
+@pytest.fixture
+def client(api: FixtureAPI) -> Iterator[pcgw_api.PCGW]:
+    with pcgw_api.PCGW(transport=httpx.MockTransport(api),
+                       async_transport=httpx.MockTransport(api)) as client:
+        yield client
@@ -0,0 +1,133 @@
+#!/bin/env python
+"""
+Generates the synthetic fixtures of the benchmarks: the games named in
+record.GAMES, with made-up page IDs, store IDs and field values drawn from
+a seeded random generator, so that the fixtures are the same on every run.
+
+The fixtures have the shape of the API responses (every field of every game
+table, empty strings for the fields without value) but not their content;
+python -m tests.benchmarks.record replaces them with recorded responses.
+
+Run from the root of the repository with python -m tests.benchmarks.generate.
+"""
+
+import random
+
+from pcgw_api import tables
+from pcgw_api.utils import FieldSpec, get_schema
+
+from tests.benchmarks.record import GAMES, write_fixture
+
+SEED = 17
+
+VOCABULARY = {
+    'Genres': ['Action', 'Platform', 'Puzzle', 'RPG', 'Roguelike', 'Adventure', 'Metroidvania', 'Shooter',
+               'Simulation', 'Strategy'],
+    'Developers': ['Company:Valve', 'Company:Supergiant Games', 'Company:Team Cherry', 'Company:Maddy Makes Games',
+                   'Company:ConcernedApe'],
+    'Publishers': ['Company:Valve', 'Company:Annapurna Interactive', 'Company:Devolver Digital',
+                   'Company:Team Cherry'],
+    'Engines': ['Engine:Unity', 'Engine:Source', 'Engine:Unreal Engine 4', 'Engine:XNA', 'Engine:FNA',
+                'Engine:MonoGame'],
+    'Available on': ['Windows', 'OS X', 'Linux'],
+    'Available from': ['Steam', 'GOG.com', 'Humble Store', 'Epic Games Store', 'itch.io', 'Microsoft Store'],
+    'Modes': ['Singleplayer', 'Multiplayer'],
+    'Perspectives': ['Side view', 'Scrolling', 'Isometric', 'First-person', 'Third-person'],
+    'Controls': ['Direct control', 'Point and select'],
+    'Pacing': ['Real-time', 'Turn-based'],
+    'Art styles': ['Pixel art', 'Stylized', 'Realistic', 'Cartoon'],
+    'Themes': ['Fantasy', 'Sci-fi', 'Dark', 'Contemporary'],
+    'Monetization': ['One-time game purchase', 'DLC'],
+    'Microtransactions': ['None'],
+    'Direct3D versions': ['9', '10', '11', '12'],
+    'OpenGL versions': ['2.1', '3.3', '4.1', '4.5'],
+    'Vulkan versions': ['1.0', '1.1', '1.2'],
+    'Local modes': ['Co-op', 'Versus'],
+    'Online modes': ['Co-op', 'Versus'],
+    'Upscaling': ['FSR 1.0', 'DLSS 2.0', 'XeSS'],
+    'Physics': ['PhysX', 'Havok', 'Box2D'],
+    'Audio': ['FMOD', 'Wwise'],
+    'Anticheat': ['Easy Anti-Cheat', 'Valve Anti-Cheat'],
+}
+SUPPORT = ['true', 'true', 'true', 'false', 'false', 'limited', 'unknown', 'n/a', 'hackable', 'always on', None, None]
+DRM = ['DRM-free', 'Steam', 'GOG Galaxy', 'Epic Games Store']
+LANGUAGES = ['English', 'French', 'German', 'Spanish', 'Italian', 'Japanese', 'Korean', 'Brazilian Portuguese',
+             'Russian', 'Simplified Chinese']
+CARGO_TYPES = {'list': 'String', 'str': 'String', 'support': 'String', 'value': 'Integer'}
+
+def random_date(rnd: random.Random) -> str:
+    return f'20{rnd.randint(10, 24)}-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}'
+
+def generate_value(rnd: random.Random, spec: FieldSpec, i: int) -> str|None:
+    """
+    Returns a value of a field of the i-th game, None for no value.
+    """
+    name = GAMES[i % len(GAMES)]
+    if spec.kind == 'support':
+        return rnd.choice(SUPPORT)
+    if spec.kind == 'list':
+        if spec.key == 'Released':
+            return ';'.join(sorted(random_date(rnd) for _ in range(rnd.randint(1, 3))))
+        if spec.key == 'Steam AppID':
+            return str(200000 + i * 1379)
+        if spec.key == 'GOGcom ID':
+            return str(1200000000 + i * 7919) if rnd.random() < .7 else None
+        if spec.key.endswith('DRM'):
+            return ','.join(rnd.sample(DRM, rnd.randint(1, 2))) if rnd.random() < .3 else None
+        words = VOCABULARY.get(spec.key)
+        if words is None:
+            return None
+        return ','.join(rnd.sample(words, rnd.randint(1, min(3, len(words)))))
+    if spec.kind == 'value':
+        if spec.key.endswith('players'):
+            return str(rnd.choice([1, 2, 4, 8])) if rnd.random() < .4 else None
+        if spec.key.startswith('Released'):
+            return random_date(rnd) if rnd.random() < .5 else None
+        return None
+    if spec.key == 'Cover':
+        return f'{name} cover.jpg'
+    if spec.key == 'Cover URL':
+        return f'https://images.pcgamingwiki.com/{i:02x}/{name.replace(" ", "_")}_cover.jpg'
+    if spec.key == 'Wikipedia':
+        return name
+    return None
+
+def generate(seed: int = SEED):
+    rnd = random.Random(seed)
+    schema = get_schema()
+    games = []
+    for i, name in enumerate(GAMES):
+        row = {'Page': name, 'PageID': str(1000 + i * 37)}
+        for table in schema.game_tables:
+            for spec in getattr(tables, table).FIELDS:
+                row[spec.key] = generate_value(rnd, spec, i) or ''
+        games.append(row)
+    write_fixture('cargoquery_games.json', {'cargoquery': [{'title': row} for row in games]})
+
+    languages = []
+    engines = []
+    for row in games:
+        for language in rnd.sample(LANGUAGES, rnd.randint(1, 8)):
+            languages.append({'PageID': row['PageID'], 'Language': language,
+                              'Interface': rnd.choice(SUPPORT[:5]), 'Audio': rnd.choice(SUPPORT) or '',
+                              'Subtitles': rnd.choice(SUPPORT[:5]), 'Status': '', 'Notes': ''})
+        engines.append({'PageID': row['PageID'],
+                        'Engine': 'Engine:' + rnd.choice(['Unity', 'Source', 'XNA', 'FNA']), 'Build': ''})
+    write_fixture('cargoquery_l10n.json', {'cargoquery': [{'title': row} for row in languages]})
+    write_fixture('cargoquery_infobox_game_engine.json', {'cargoquery': [{'title': row} for row in engines]})
+
+    cargofields = {}
+    for table in schema.tables:
+        fields = {}
+        for query_key, spec in zip(schema[table].fields, getattr(tables, table).FIELDS):
+            is_date = spec.post_processing is not None and 'fromisoformat' in repr(spec.post_processing)
+            field = {'type': 'Date' if is_date else CARGO_TYPES[spec.kind]}
+            if spec.kind == 'list':
+                field['isList'] = ''
+                field['delimiter'] = spec.delimiter
+            fields[query_key] = field
+        cargofields[table] = {'cargofields': fields}
+    write_fixture('cargofields.json', cargofields)
+
+if __name__ == '__main__':
+    generate()
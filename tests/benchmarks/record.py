@@ -0,0 +1,62 @@
+#!/bin/env python
+"""
+Records the fixtures of the benchmarks from the PCGamingWiki API, replacing
+the synthetic fixtures made by generate.py.
+
+Run from the root of the repository with python -m tests.benchmarks.record.
+"""
+
+import json
+import os
+
+import pcgw_api
+from pcgw_api.utils import get_schema
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+GAMES = (
+    "Celeste", "Hollow Knight", "Hades", "Stardew Valley", "Portal 2", "Half-Life 2",
+    "The Witcher 3: Wild Hunt", "Dark Souls III", "Cuphead", "Terraria", "Undertale", "Doom (2016)",
+    "Disco Elysium", "Outer Wilds", "Factorio", "RimWorld", "Slay the Spire", "Dead Cells",
+    "Ori and the Blind Forest", "Super Meat Boy", "Braid", "Limbo", "Inside", "Fez", "Bastion",
+    "Transistor", "Katana Zero", "Shovel Knight", "Spelunky 2", "Into the Breach",
+    "FTL: Faster Than Light", "Subnautica", "Return of the Obra Dinn", "Baba Is You", "Tunic",
+    "Hotline Miami", "Papers, Please", "Death's Door", "Hyper Light Drifter", "Axiom Verge", "Owlboy",
+    "Night in the Woods", "Firewatch", "Oxenfree", "Kentucky Route Zero",
+    "Celeste 64: Fragments of the Mountain", "Hollow Knight: Silksong", "Hades II", "Half-Life", "Portal",
+)
+
+def write_fixture(name: str, j: dict):
+    with open(os.path.join(FIXTURES_DIR, name), 'w') as f:
+        json.dump(j, f, separators=(',', ':'))
+
+def record(client: pcgw_api.PCGW):
+    games = client.get_games(page_names=GAMES)
+    write_fixture('cargoquery_games.json',
+                  {'cargoquery': [{'title': game.json_data} for game in games.values() if game is not None]})
+
+    page_ids = [game.id for game in games.values() if game is not None]
+    for table in ('L10n', 'Infobox_game_engine'):
+        rows = []
+        for offset in range(0, 10 * len(page_ids), client.MAX_LIMIT):
+            response = client._cargoquery(client._build_association_request(table, page_ids, offset))
+            rows += response.get('cargoquery', [])
+            if len(response.get('cargoquery', [])) < client.MAX_LIMIT:
+                break
+        write_fixture(f'cargoquery_{table.lower()}.json', {'cargoquery': rows})
+
+    cargofields = {}
+    for table in get_schema().tables:
+        cargofields[table] = client._post({
+            'action': 'cargofields',
+            'format': 'json',
+            'table' : table,
+        }).json()
+    write_fixture('cargofields.json', cargofields)
+
+def main():
+    with pcgw_api.PCGW(rate_limiter=pcgw_api.RateLimiter(rate=2)) as client:
+        record(client)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+from pcgw_api import GameFrame
+from pcgw_api.pcgw import Game, PCGW
+
+def test_game_construction(benchmark, api):
+    rows = api.games
+    games = benchmark(lambda: [Game(j) for j in rows])
+    assert len(games) == len(rows)
+
+def test_game_load_tables(benchmark, api):
+    rows = api.games
+    def decode():
+        for j in rows:
+            Game(j).load_tables()
+    benchmark(decode)
+
+def test_game_frame(benchmark, api):
+    fields = PCGW()._frame_fields(PCGW._projection(None, None))
+    frame = benchmark(GameFrame.from_rows, api.games, fields)
+    assert len(frame) == len(api.games)
@@ -0,0 +1,30 @@
+import json
+import tracemalloc
+
+from pcgw_api.pcgw import Game
+
+def decode(rows: list[dict]) -> list[Game]:
+    games = [Game(j, drop_json_data=True) for j in rows]
+    for game in games:
+        game.load_tables()
+    return games
+
+def test_game_memory(benchmark, api):
+    """
+    Measures with tracemalloc the memory held by a game with every table
+    deserialized and json_data released, the strings it keeps from the
+    response included, saved as bytes_per_game in the extra_info of the
+    benchmark.
+    """
+    rows = api.games
+    response = json.dumps(rows)
+    decode(rows) # fills the caches of the interned strings, lists and dates
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        games = decode(json.loads(response))
+        bytes_per_game = (tracemalloc.get_traced_memory()[0] - before) / len(games)
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info['bytes_per_game'] = round(bytes_per_game)
+    assert len(benchmark(decode, rows)) == len(rows)
@@ -0,0 +1,26 @@
+import pytest
+
+def test_search(benchmark, client):
+    games = benchmark(client.search, 'celeste')
+    assert {game.name for game in games} == {'Celeste', 'Celeste 64: Fragments of the Mountain'}
+
+def test_get_game(benchmark, client, api):
+    game = benchmark(client.get_game, page_id=int(api.games[0]['PageID']))
+    assert game.name == api.games[0]['Page']
+
+@pytest.mark.parametrize('count', [10, 50])
+def test_get_games(benchmark, client, api, count):
+    names = [j['Page'] for j in api.games[:count]]
+    games = benchmark(client.get_games, page_names=names)
+    assert all(games[name] is not None for name in names)
+
+def test_prefetch_associations(benchmark, client, api):
+    games = client.get_games(page_names=[j['Page'] for j in api.games]).values()
+    def prefetch():
+        for game in games:
+            game._fetched_associations.clear()
+            game.languages = []
+            game.engines = []
+        client.prefetch_associations(list(games))
+    benchmark(prefetch)
+    assert all(game.languages and game.engines for game in games)
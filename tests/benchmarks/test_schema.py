@@ -0,0 +1,24 @@
+import json
+
+from pcgw_api import tables
+from pcgw_api.utils import TABLES_INFO_FILENAME, Schema, get_schema
+
+def test_schema_load(benchmark):
+    with open(TABLES_INFO_FILENAME) as f:
+        tables_info = json.load(f)
+    schema = benchmark(Schema, tables_info)
+    assert schema.game_fields == get_schema().game_fields
+
+def test_game_projection(benchmark):
+    schema = get_schema()
+    projection = benchmark(schema.game_projection.__wrapped__, schema,
+                           ('Infobox_game',), ('Input.controller_support', 'Video.hdr'))
+    assert projection.loaded_tables == {'Infobox_game', 'Input', 'Video'}
+
+def test_cargofields_schema(benchmark, api):
+    def load():
+        return Schema({table: [key for key in response['cargofields'] if key[0].isalpha()]
+                       for table, response in api.cargofields.items()})
+    schema = benchmark(load)
+    assert set(schema.tables) == set(get_schema().tables)
+    assert all(len(schema[table].fields) == len(getattr(tables, table).FIELDS) for table in schema.tables)
@@ -0,0 +1,22 @@
+from typing import Callable
+
+import httpx
+import pytest
+
+import pcgw_api
+
+def empty_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={'cargoquery': []})
+
+@pytest.fixture
+def make_client() -> Callable[..., pcgw_api.PCGW]:
+    """
+    Returns a factory of clients whose requests are answered by a handler of
+    httpx.MockTransport (the asynchronous requests by async_handler if given),
+    the other arguments being passed to PCGW.
+    """
+    def make_client(handler: Callable = empty_response, async_handler: Callable|None = None,
+                    **options) -> pcgw_api.PCGW:
+        return pcgw_api.PCGW(transport=httpx.MockTransport(handler),
+                             async_transport=httpx.MockTransport(async_handler or handler), **options)
+    return make_client
@@ -0,0 +1,64 @@
+import asyncio
+import re
+import urllib.parse
+
+import httpx
+
+from pcgw_api.pcgw import Game
+
+ROWS = {
+    'L10n': [{'PageID': '1', 'Language': 'English', 'Audio': 'true'},
+             {'PageID': '1', 'Language': 'French', 'Audio': 'false'},
+             {'PageID': '3', 'Language': 'German', 'Audio': 'true'}],
+    'Infobox_game_engine': [{'PageID': '1', 'Engine': 'Unity'},
+                            {'PageID': '2', 'Engine': 'Godot'}],
+}
+
+class AssociationAPI:
+    """
+    API answering the association requests with the ROWS of the pages
+    requested and recording the requests.
+    """
+    def __init__(self):
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        self.requests.append(params)
+        page_ids = set(re.search(r'IN \(([\d,]*)\)', params['where']).group(1).split(','))
+        return httpx.Response(200, json={'cargoquery': [{'title': row} for row in ROWS[params['tables']]
+                                                        if row['PageID'] in page_ids]})
+
+def make_games(client) -> list[Game]:
+    return [Game({'Page': f'Game {id}', 'PageID': str(id)}, client) for id in (1, 2, 3)]
+
+def check_games(games: list[Game]):
+    assert [[l.language for l in game.languages] for game in games] == [['English', 'French'], [], ['German']]
+    assert [[e.engine for e in game.engines] for game in games] == [['Unity'], ['Godot'], []]
+
+def test_prefetch_associations(make_client):
+    api = AssociationAPI()
+    with make_client(api) as client:
+        games = make_games(client)
+        client.prefetch_associations(games)
+        assert [params['tables'] for params in api.requests] == ['L10n', 'Infobox_game_engine']
+        assert all(params['where'].endswith('._pageID IN (1,2,3)') for params in api.requests)
+        check_games(games)
+        for game in games:
+            assert game.get_languages() == game.languages
+            assert game.get_engines() == game.engines
+    assert len(api.requests) == 2
+
+def test_async_prefetch_associations(make_client):
+    api = AssociationAPI()
+    async def run():
+        async with make_client(api) as client:
+            games = make_games(client)
+            await client.async_prefetch_associations(games, chunk_size=2)
+            for game in games:
+                await game.async_get_languages()
+                await game.async_get_engines()
+            return games
+    check_games(asyncio.run(run()))
+    assert sorted((params['tables'], params['where'].partition(' IN ')[2]) for params in api.requests) == [
+            ('Infobox_game_engine', '(1,2)'), ('Infobox_game_engine', '(3)'), ('L10n', '(1,2)'), ('L10n', '(3)')]
@@ -0,0 +1,61 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+import pcgw_api
+
+RESPONSE = {'cargoquery': [{'title': {'Page': 'Celeste', 'PageID': '1000'}}]}
+
+class ConditionalAPI:
+    """
+    Answers 304 to the requests with validators and records the requests.
+    """
+    def __init__(self):
+        self.conditional = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        conditional = 'If-None-Match' in request.headers
+        self.conditional.append(conditional)
+        if conditional:
+            return httpx.Response(304)
+        return httpx.Response(200, json=RESPONSE, headers={'ETag': '"v1"'})
+
+def test_revalidation(make_client):
+    api = ConditionalAPI()
+    cache = pcgw_api.MemoryCache(ttl=0)
+    with make_client(api, cache=cache) as client:
+        assert client.get_game(page_id=1000).name == 'Celeste'
+        assert client.get_game(page_id=1000).name == 'Celeste'
+    assert api.conditional == [False, True]
+    assert cache.revalidations == 1
+
+def test_revalidation_of_evicted_entry(make_client):
+    api = ConditionalAPI()
+    cache = pcgw_api.MemoryCache(ttl=0)
+    with make_client(api, cache=cache) as client:
+        client.get_game(page_id=1000)
+        lookup = cache.lookup
+        def lookup_then_evict(params):
+            value, headers = lookup(params)
+            cache.clear()
+            return value, headers
+        cache.lookup = lookup_then_evict
+        assert client.get_game(page_id=1000).name == 'Celeste'
+    assert api.conditional == [False, True, False]
+
+def test_counters_under_concurrent_lookups():
+    cache = pcgw_api.MemoryCache()
+    params = {'action': 'cargoquery', 'tables': 'Infobox_game'}
+    cache.store(params, httpx.Response(200, json=RESPONSE))
+    def lookup(i: int):
+        for _ in range(2000):
+            cache.lookup(params if i % 2 else {**params, 'where': str(i)})
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lookup, range(8)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert (cache.hits, cache.misses) == (8000, 8000)
@@ -0,0 +1,174 @@
+import asyncio
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pcgw_api.coalescing import AsyncMicroBatcher, AsyncSingleFlight, MicroBatcher, SingleFlight
+
+class SlowAPI:
+    """
+    API answering every request after a delay, with the games whose page
+    IDs are requested, and recording the requests.
+    """
+    def __init__(self, delay: float = .1):
+        self.delay = delay
+        self.requests: list[str] = []
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        where = dict(urllib.parse.parse_qsl(request.content.decode()))['where']
+        self.requests.append(where)
+        return httpx.Response(200, json={'cargoquery': [
+            {'title': {'Page': f'Game {id}', 'PageID': id}} for id in re.findall(r'_pageID="(\d+)"', where)]})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        return self.response(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self.response(request)
+
+def test_identical_requests_share_one_request(make_client):
+    api = SlowAPI()
+    with make_client(api, api.handle_async) as client:
+        with ThreadPoolExecutor(8) as executor:
+            games = list(executor.map(lambda _: client.get_game(page_id=1), range(8)))
+        assert all(game.id == 1 for game in games)
+        async def run():
+            async with client:
+                return await asyncio.gather(*(client.async_get_game(page_id=2) for _ in range(8)))
+        assert all(game.id == 2 for game in asyncio.run(run()))
+    assert len(api.requests) == 2
+
+def test_coalescing_can_be_disabled(make_client):
+    api = SlowAPI(.05)
+    with make_client(api, coalesce=False) as client:
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda _: client.get_game(page_id=1), range(4)))
+    assert len(api.requests) == 4
+
+def test_batch_window_groups_get_game_calls(make_client):
+    api = SlowAPI(0)
+    with make_client(api, api.handle_async, batch_window=.2) as client:
+        with ThreadPoolExecutor(5) as executor:
+            games = list(executor.map(lambda id: client.get_game(page_id=id), range(1, 6)))
+        assert [game.id for game in games] == [1, 2, 3, 4, 5]
+        async def run():
+            async with client:
+                return await asyncio.gather(*(client.async_get_game(page_id=id) for id in range(6, 11)))
+        assert [game.id for game in asyncio.run(run())] == [6, 7, 8, 9, 10]
+    assert len(api.requests) == 2
+
+def test_single_flight_error_reaches_every_waiter():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+    def fail():
+        calls.append(None)
+        release.wait()
+        raise RuntimeError('failed')
+    def call(_):
+        try:
+            flight.do('key', fail)
+        except RuntimeError as e:
+            return e
+    with ThreadPoolExecutor(5) as executor:
+        futures = [executor.submit(call, i) for i in range(5)]
+        time.sleep(.1)
+        release.set()
+        errors = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert flight._calls == {}
+    assert flight.do('key', lambda: 42) == 42
+
+def test_async_single_flight_error_reaches_every_waiter():
+    flight = AsyncSingleFlight()
+    calls = []
+    async def fail():
+        calls.append(None)
+        await asyncio.sleep(.01)
+        raise RuntimeError('failed')
+    async def succeed():
+        return 42
+    async def run():
+        results = await asyncio.gather(*(flight.do('key', fail) for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight._tasks == {}
+        return await flight.do('key', succeed)
+    assert asyncio.run(run()) == 42
+    assert len(calls) == 1
+
+def test_async_single_flight_across_event_loops():
+    flight = AsyncSingleFlight()
+    calls = []
+    async def call(name: str) -> str:
+        async def function():
+            calls.append(name)
+            await asyncio.sleep(.05)
+            return name
+        return await flight.do('key', function)
+    def run(name: str) -> list[str]:
+        async def gather():
+            return await asyncio.gather(*(call(name) for _ in range(3)))
+        return asyncio.run(gather())
+    with ThreadPoolExecutor(2) as executor:
+        results = list(executor.map(run, ['a', 'b']))
+    assert results == [['a'] * 3, ['b'] * 3]
+    assert sorted(calls) == ['a', 'b']
+
+def test_micro_batcher_flushes_on_size():
+    batches = []
+    def function(group, keys):
+        batches.append(keys)
+        return {key: key * 10 for key in keys}
+    batcher = MicroBatcher(function, window=10, max_size=3)
+    start = time.monotonic()
+    with ThreadPoolExecutor(3) as executor:
+        results = list(executor.map(lambda key: batcher.submit('group', key), [1, 2, 3]))
+    assert time.monotonic() - start < 5
+    assert results == [10, 20, 30]
+    assert [sorted(keys) for keys in batches] == [[1, 2, 3]]
+
+def test_micro_batcher_flushes_on_window():
+    batches = []
+    def function(group, keys):
+        batches.append((group, sorted(keys)))
+        return {key: key for key in keys if key != 2}
+    batcher = MicroBatcher(function, window=.2, max_size=100)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda args: batcher.submit(*args), [('a', 1), ('a', 2), ('b', 3), ('a', 1)]))
+    assert results == [1, None, 3, 1]
+    assert sorted(batches) == [('a', [1, 2]), ('b', [3])]
+    assert batcher._batches == {}
+
+def test_micro_batcher_error_reaches_every_caller():
+    def function(group, keys):
+        raise RuntimeError('failed')
+    batcher = MicroBatcher(function, window=.05)
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(batcher.submit, 'group', key) for key in range(3)]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+def test_async_micro_batcher_flushes_on_size_and_window():
+    batches = []
+    async def function(group, keys):
+        batches.append(sorted(keys))
+        return {key: -key for key in keys}
+    batcher = AsyncMicroBatcher(function, window=.05, max_size=3)
+    async def run():
+        return await asyncio.gather(*(batcher.submit('group', key) for key in range(1, 6)))
+    start = time.monotonic()
+    assert asyncio.run(run()) == [-1, -2, -3, -4, -5]
+    assert batches == [[1, 2, 3], [4, 5]]
+    # the second event loop gets batches of its own
+    assert asyncio.run(run()) == [-1, -2, -3, -4, -5]
+    assert time.monotonic() - start < 5
+    assert batcher._batches == {}
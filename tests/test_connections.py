@@ -0,0 +1,27 @@
+import asyncio
+import warnings
+
+import pytest
+
+def test_sync_exit_warns_about_open_async_connections(make_client):
+    with pytest.warns(ResourceWarning):
+        with make_client() as client:
+            asyncio.run(client.async_search('celeste'))
+    assert client.http_client.is_closed
+
+def test_async_exit_closes_both(make_client):
+    async def run():
+        async with make_client() as client:
+            await client.async_search('celeste')
+            client.search('celeste')
+        return client
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        client = asyncio.run(run())
+    assert client.http_client.is_closed and client.async_http_client.is_closed
+
+def test_sync_only_client_does_not_warn(make_client):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        with make_client() as client:
+            client.search('celeste')
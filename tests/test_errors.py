@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+import pytest
+
+import pcgw_api
+
+ERROR = {'error': {'code': 'MWException', 'info': 'Error in where clause'}}
+
+def no_retries() -> pcgw_api.RetryPolicy:
+    return pcgw_api.RetryPolicy(max_retries=1, backoff_base=0)
+
+def test_error_status_raises_after_retries(make_client):
+    requests = []
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503, text='<html>Service Unavailable</html>')
+    with make_client(handler, retry_policy=no_retries()) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.search('celeste')
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.async_search('celeste'))
+    assert len(requests) == 4
+
+def test_api_error_raises(make_client):
+    cache = pcgw_api.MemoryCache()
+    with make_client(lambda request: httpx.Response(200, json=ERROR), cache=cache) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError) as info:
+            client.get_game(page_id=1)
+        with pytest.raises(pcgw_api.PCGWAPIError):
+            asyncio.run(client.async_get_game(page_id=1))
+    assert (info.value.code, info.value.info) == ('MWException', 'Error in where clause')
+    assert len(cache) == 0
+
+def test_api_error_raises_without_cache(make_client):
+    with make_client(lambda request: httpx.Response(200, json=ERROR)) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError, match='MWException'):
+            client.search('celeste')
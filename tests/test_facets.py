@@ -0,0 +1,83 @@
+import asyncio
+import time
+import types
+import urllib.parse
+
+import httpx
+import pytest
+
+import pcgw_api
+
+GROUPS = {
+    'Infobox_game.Genres': [('', 5), ('Action', 2), ('Action,Platform', 3), ('Platform, Puzzle', 1)],
+    'Input.Controller_support': [('', 4), ('false', 6), ('true', 10)],
+}
+
+class FacetAPI:
+    """
+    API answering group_by requests with the GROUPS rows of the grouped
+    field, by pages according to the limit and offset of the requests.
+    """
+    def __init__(self):
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        self.requests.append(params)
+        offset = int(params['offset'])
+        rows = GROUPS[params['group_by']][offset:offset + int(params['limit'])]
+        return httpx.Response(200, json={'cargoquery': [{'title': {'Value': value, 'Count': str(count)}}
+                                                        for value, count in rows]})
+
+@pytest.fixture
+def api(monkeypatch) -> FacetAPI:
+    monkeypatch.setattr(pcgw_api.PCGW, 'MAX_LIMIT', 2)
+    return FacetAPI()
+
+FIELDS = [('Infobox_game', 'genres'), ('Input', 'controller_support')]
+FACETS = {
+    ('Infobox_game', 'genres'): {None: 5, 'Action': 5, 'Platform': 4, 'Puzzle': 1},
+    ('Input', 'controller_support'): {None: 4, 'false': 6, 'true': 10},
+}
+
+def test_counts(api, make_client):
+    with make_client(api) as client:
+        assert client.get_facets(FIELDS) == FACETS
+        assert asyncio.run(client.async_get_facets(FIELDS, ttl=0)) == FACETS
+        asyncio.run(client.aclose())
+
+def test_requests(api, make_client):
+    with make_client(api) as client:
+        client.get_facets(FIELDS, concurrency=1)
+    assert [(params['group_by'], params['offset']) for params in api.requests] == [
+            ('Infobox_game.Genres', '0'), ('Infobox_game.Genres', '2'), ('Infobox_game.Genres', '4'),
+            ('Input.Controller_support', '0'), ('Input.Controller_support', '2')]
+    genres, controller_support = api.requests[0], api.requests[3]
+    assert genres['tables'] == 'Infobox_game'
+    assert genres['fields'] == 'Infobox_game.Genres=Value,COUNT(DISTINCT Infobox_game._pageID)=Count'
+    assert genres['order_by'] == 'Infobox_game.Genres'
+    assert 'join_on' not in genres
+    assert controller_support['tables'] == 'Infobox_game,Input'
+    assert controller_support['join_on'] == 'Infobox_game._pageID=Input._pageID'
+    assert all(params['limit'] == '2' for params in api.requests)
+
+def test_ttl(api, make_client, monkeypatch):
+    now = [1000.]
+    monkeypatch.setattr(pcgw_api.pcgw, 'time', types.SimpleNamespace(
+            monotonic=lambda: now[0], perf_counter=time.perf_counter, sleep=time.sleep))
+    with make_client(api) as client:
+        client.get_facets(FIELDS[:1], ttl=60)
+        now[0] += 30
+        facets = client.get_facets(FIELDS, ttl=60)
+        assert len(api.requests) == 5
+        facets[('Infobox_game', 'genres')]['Action'] = 0
+        now[0] += 29
+        assert client.get_facets(FIELDS[:1])[('Infobox_game', 'genres')]['Action'] == 5
+        assert len(api.requests) == 5
+        now[0] += 2
+        client.get_facets(FIELDS)
+        assert len(api.requests) == 8
+
+def test_unknown_field(api, make_client):
+    with make_client(api) as client, pytest.raises(ValueError):
+        client.get_facets([('Infobox_game', 'not_a_field')])
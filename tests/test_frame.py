@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+import pcgw_api.tables as tables
+from pcgw_api import GameFrame, Support
+from pcgw_api.frame import SUPPORT_LABELS
+
+FIELDS = [('infobox.genres', next(spec for spec in tables.Infobox_game.FIELDS if spec.name == 'genres')),
+          ('input.controller_support', next(spec for spec in tables.Input.FIELDS
+                                            if spec.name == 'controller_support'))]
+ROWS = [
+    {'Page': 'Celeste', 'PageID': '3', 'Genres': 'Platform', 'Controller support': 'true'},
+    {'Page': 'Fez', 'PageID': '5', 'Genres': '', 'Controller support': 'yes'},
+    {'Page': 'Braid', 'PageID': '8', 'Controller support': 'fakse'},
+    {'Page': 'Limbo', 'PageID': '9', 'Genres': 'Puzzle,Platform', 'Controller support': 'sometimes'},
+]
+
+@pytest.fixture
+def frame() -> GameFrame:
+    return GameFrame.from_rows(ROWS, FIELDS)
+
+def test_support_codes(frame):
+    column = frame['input.controller_support']
+    assert column.typecode == 'b'
+    assert [SUPPORT_LABELS[code] for code in column] == frame.support_values('input.controller_support') == [
+            Support.TRUE, Support.TRUE, Support.FALSE, Support.OTHER_VALUE]
+    assert len(frame) == 4
+    assert frame['page_id'] == [3, 5, 8, 9]
+    assert frame['name'] == ['Celeste', 'Fez', 'Braid', 'Limbo']
+    assert [set(genres) for genres in frame['infobox.genres']] == [{'Platform'}, set(), set(), {'Puzzle', 'Platform'}]
+
+@pytest.mark.parametrize('method, module', [('to_pandas', 'pandas'), ('to_arrow', 'pyarrow'),
+                                            ('to_parquet', 'pyarrow')])
+def test_missing_optional_dependency(frame, monkeypatch, tmp_path, method, module):
+    monkeypatch.setitem(sys.modules, module, None)
+    args = [str(tmp_path / 'frame.parquet')] if method == 'to_parquet' else []
+    with pytest.raises(ImportError, match=module):
+        getattr(frame, method)(*args)
+
+def test_to_pandas(frame):
+    pytest.importorskip('pandas')
+    df = frame.to_pandas()
+    assert list(df['input.controller_support']) == ['TRUE', 'TRUE', 'FALSE', 'OTHER_VALUE']
+    assert list(df['page_id']) == [3, 5, 8, 9]
+
+def test_to_arrow(frame):
+    pytest.importorskip('pyarrow')
+    table = frame.to_arrow()
+    assert table.column('input.controller_support').to_pylist() == ['TRUE', 'TRUE', 'FALSE', 'OTHER_VALUE']
+    assert table.column('name').to_pylist() == frame['name']
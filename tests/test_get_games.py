@@ -0,0 +1,57 @@
+import asyncio
+import re
+import urllib.parse
+
+import httpx
+import pytest
+
+import pcgw_api
+
+class TruncatingAPI:
+    """
+    API returning one row per requested game, truncated to MAX_LIMIT rows,
+    and recording the number of requests in flight.
+    """
+    MAX_LIMIT = 7
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def rows(self, request: httpx.Request) -> list[dict]:
+        where = dict(urllib.parse.parse_qsl(request.content.decode()))['where']
+        rows = [{'title': {'Page': f'Game {id}', 'PageID': id}} for id in re.findall(r'_pageID="(\d+)"', where)]
+        rows += [{'title': {'Page': name, 'PageID': name.split()[-1]}}
+                 for name in re.findall(r'_pageName="([^"]*)"', where)]
+        return rows[:self.MAX_LIMIT]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'cargoquery': self.rows(request)})
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(.001)
+        self.in_flight -= 1
+        return httpx.Response(200, json={'cargoquery': self.rows(request)})
+
+@pytest.fixture
+def api(monkeypatch) -> TruncatingAPI:
+    monkeypatch.setattr(pcgw_api.PCGW, 'MAX_LIMIT', TruncatingAPI.MAX_LIMIT)
+    return TruncatingAPI()
+
+def test_truncated_responses_lose_no_key(api, make_client):
+    page_ids = list(range(1, 101))
+    with make_client(api, api.handle_async) as client:
+        games = client.get_games(page_ids=page_ids, page_names=['Game 200'], chunk_size=30)
+    assert all(games[id].id == id for id in page_ids)
+    assert games['Game 200'].id == 200
+
+def test_async_truncated_responses_respect_concurrency(api, make_client):
+    page_ids = list(range(1, 201))
+    async def run():
+        async with make_client(api, api.handle_async) as client:
+            return await client.async_get_games(page_ids=page_ids, chunk_size=40, concurrency=3)
+    games = asyncio.run(run())
+    assert all(games[id].id == id for id in page_ids)
+    assert api.max_in_flight <= 3
@@ -0,0 +1,34 @@
+import pytest
+
+import pcgw_api
+
+from tests.test_iter_all_games import Catalogue
+from tests.test_sync import Wiki
+
+def test_completed_build_is_not_resumed(tmp_path, make_client):
+    index = pcgw_api.OfflineIndex(str(tmp_path / 'index.db'))
+    with make_client(Wiki()) as client:
+        assert index.build(client) == 3
+        first_sync = index.last_sync
+        assert index.build(client) == 3
+    assert index.last_sync > first_sync
+    assert len(index) == 3
+    index.close()
+
+def test_interrupted_build_is_resumed(tmp_path, make_client, monkeypatch):
+    monkeypatch.setattr(pcgw_api.PCGW, 'MAX_LIMIT', 5)
+    index = pcgw_api.OfflineIndex(str(tmp_path / 'index.db'))
+    api = Catalogue(20, fail_after=8)
+    with make_client(api) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError):
+            index.build(client, batch_size=4)
+        assert len(index) == 8
+        assert index.last_sync is None
+        api.fail_after = None
+        api.requests.clear()
+        assert index.build(client, batch_size=4) == 12
+    assert api.requests[0] == 8
+    assert len(index) == 20
+    assert index.last_sync is not None
+    assert index._get_meta('last_page_id') is None
+    index.close()
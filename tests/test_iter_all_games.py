@@ -0,0 +1,62 @@
+import asyncio
+import re
+import urllib.parse
+
+import httpx
+import pytest
+
+import pcgw_api
+
+class Catalogue:
+    """
+    API serving games 1 to count by pages ordered by page ID, with the
+    first game of every page repeated as with joined tables, and answering
+    the page after fail_after with an error.
+    """
+    def __init__(self, count: int, fail_after: int|None = None):
+        self.count = count
+        self.fail_after = fail_after
+        self.requests: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        after_page_id = int(re.search(r'_pageID>(\d+)', params['where']).group(1))
+        self.requests.append(after_page_id)
+        if after_page_id == self.fail_after:
+            return httpx.Response(200, json={'error': {'code': 'MWException', 'info': 'Internal error'}})
+        page_ids = list(range(after_page_id + 1, self.count + 1))[:int(params['limit']) - 1]
+        rows = [{'title': {'Page': f'Game {page_id}', 'PageID': str(page_id)}} for page_id in page_ids[:1] + page_ids]
+        return httpx.Response(200, json={'cargoquery': rows})
+
+@pytest.mark.parametrize('count', [23, 24, 0])
+def test_pages(make_client, count):
+    api = Catalogue(count)
+    with make_client(api) as client:
+        assert [game.id for game in client.iter_all_games(page_size=5)] == list(range(1, count + 1))
+    assert api.requests == list(range(0, count + 1, 4))
+
+def test_resume(make_client):
+    api = Catalogue(10)
+    with make_client(api) as client:
+        assert [game.id for game in client.iter_all_games(after_page_id=6, page_size=3)] == [7, 8, 9, 10]
+    assert api.requests == [6, 8, 10]
+
+def test_error_page_raises(make_client):
+    api = Catalogue(20, fail_after=8)
+    games = []
+    with make_client(api) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError):
+            for game in client.iter_all_games(page_size=5):
+                games.append(game.id)
+    assert games == list(range(1, 9))
+
+def test_async_error_page_raises(make_client):
+    api = Catalogue(20, fail_after=8)
+    games = []
+    async def run():
+        async with make_client(api) as client:
+            async for game in client.async_iter_all_games(page_size=5):
+                games.append(game.id)
+    with pytest.raises(pcgw_api.PCGWAPIError):
+        asyncio.run(run())
+    assert games == list(range(1, 9))
@@ -0,0 +1,30 @@
+import asyncio
+import logging
+
+import pcgw_api
+
+class FailingObserver(pcgw_api.Observer):
+    def on_request(self, event):
+        raise RuntimeError('failed')
+
+    def on_decode(self, event):
+        raise RuntimeError('failed')
+
+class RecordingObserver(pcgw_api.Observer):
+    def __init__(self):
+        self.events: list = []
+
+    def on_request(self, event):
+        self.events.append(event)
+
+def test_failing_observer_does_not_fail_requests(make_client, caplog):
+    recording = RecordingObserver()
+    with caplog.at_level(logging.ERROR, logger='pcgw_api.pcgw'):
+        with make_client(observers=[FailingObserver(), recording]) as client:
+            assert client.search('celeste') == []
+            assert asyncio.run(client.async_search('celeste')) == []
+            asyncio.run(client.aclose())
+    assert [event.status for event in recording.events] == [200, 200]
+    assert sum('on_request' in record.getMessage() for record in caplog.records) == 2
+    assert any('on_decode' in record.getMessage() for record in caplog.records)
+    assert all(isinstance(record.exc_info[1], RuntimeError) for record in caplog.records)
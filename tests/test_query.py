@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+
+from pcgw_api import Support, SupportValue
+from pcgw_api.query import API, Infobox_game, Input, L10n, quote
+
+def test_quote():
+    assert quote('Tom "Tommy" O\'Brien') == '"Tom \\"Tommy\\" O\'Brien"'
+    assert quote('C:\\Games\\"x"') == '"C:\\\\Games\\\\\\"x\\""'
+    assert quote('" OR 1=1 OR "') == '"\\" OR 1=1 OR \\""'
+    assert quote(42) == '42'
+    assert quote(datetime.date(2020, 1, 2)) == '"2020-01-02"'
+    with pytest.raises(TypeError):
+        quote(None)
+
+def test_contains_escapes_wildcards():
+    assert Infobox_game.page_name.contains('50%_off').clause == \
+           'Infobox_game._pageName LIKE "%50\\\\%\\\\_off%"'
+
+def test_support_equality():
+    assert (Input.controller_hotplugging == Support.TRUE).clause == \
+           'Input.Controller_hotplugging IN ("true", "yes")'
+    assert (Input.controller_hotplugging == Support.NULL).clause == 'Input.Controller_hotplugging IS NULL'
+    other = (Input.controller_hotplugging == Support.OTHER_VALUE).clause
+    assert other.startswith('(NOT (Input.Controller_hotplugging IN ("unknown", ')
+    assert '"other value"' not in other
+    assert other.endswith('AND (NOT (Input.Controller_hotplugging IS NULL))')
+
+def test_support_value_equality():
+    column = Input.controller_hotplugging
+    for raw_value in ('true', 'yes', None, 'n/a', 'some other value'):
+        value = SupportValue.of(raw_value)
+        assert (column == value).clause == (column == value.support).clause
+        assert (column != value).clause == (column != value.support).clause
+    assert (column == SupportValue.of(None)).clause == 'Input.Controller_hotplugging IS NULL'
+
+def test_support_inequality():
+    assert (Input.controller_hotplugging != Support.FALSE).clause == \
+           '(NOT (Input.Controller_hotplugging IN ("false", "fakse"))) OR (Input.Controller_hotplugging IS NULL)'
+    assert (Input.controller_hotplugging != None).clause == 'NOT (Input.Controller_hotplugging IS NULL)'
+
+def test_build_request_joins_condition_tables(make_client):
+    query = make_client().query(tables=['Infobox_game']).where(
+            API.vulkan_versions.holds('1.2'), Input.controller_hotplugging == Support.TRUE)
+    params = query.build_request(0, 10)
+    assert params['tables'] == 'Infobox_game,API,Input'
+    assert params['join_on'] == 'Infobox_game._pageID=API._pageID,Infobox_game._pageID=Input._pageID'
+    assert params['where'] == ('(API.Vulkan_versions HOLDS "1.2") AND '
+                               '(Input.Controller_hotplugging IN ("true", "yes"))')
+    assert 'group_by' not in params
+    assert params['order_by'] == 'Infobox_game._pageID'
+
+def test_build_request_groups_association_tables(make_client):
+    query = make_client().query(tables=['Infobox_game']).where(L10n.language == 'French') \
+                         .order_by(Infobox_game.page_name.desc()).limit(5).offset(10)
+    params = query.build_request(10, 5)
+    assert params['tables'] == 'Infobox_game,L10n'
+    assert params['join_on'] == 'Infobox_game._pageID=L10n._pageID'
+    assert params['group_by'] == 'Infobox_game._pageID'
+    assert params['order_by'] == 'Infobox_game._pageName DESC,Infobox_game._pageID'
+    assert (params['offset'], params['limit']) == (10, 5)
+
+def test_existing_requests_escape_values(make_client):
+    client = make_client()
+    projection = client._projection(['Infobox_game'], None)
+    assert client._build_get_game_request(None, 'Say "Hi"', None, None, projection)['where'] == \
+           'Infobox_game._pageName="Say \\"Hi\\""'
+    assert client._build_search_request('a"b', projection)['where'] == 'Infobox_game._pageName LIKE "%a\\"b%"'
+    assert client._build_get_games_request([1], ['x"y'], projection)['where'] == \
+           'Infobox_game._pageName="x\\"y" OR Infobox_game._pageID="1"'
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import urllib.parse
+
+import httpx
+
+from pcgw_api.schema import Field, generate_class, generate_module, is_unchanged, split_classes, update_schema
+
+CARGOFIELDS = {
+    'Genres': {'type': 'String', 'isList': '', 'delimiter': ','},
+    'Cover_URL': {'type': 'URL'},
+    'Released': {'type': 'Date'},
+    'Controller_support': {'type': 'String'},
+}
+
+def make_fields(cargofields: dict, table: str = 'Infobox_game') -> list[Field]:
+    return [Field(key, j, table) for key, j in cargofields.items()]
+
+def test_unchanged_schema():
+    fields = make_fields(CARGOFIELDS)
+    assert is_unchanged(make_fields(CARGOFIELDS), generate_class('Infobox_game', fields))
+
+def test_missing_class():
+    assert not is_unchanged(make_fields(CARGOFIELDS), None)
+
+def test_added_and_removed_fields():
+    source = generate_class('Infobox_game', make_fields(CARGOFIELDS))
+    assert not is_unchanged(make_fields({**CARGOFIELDS, 'Engines': {'type': 'Page'}}), source)
+    assert not is_unchanged(make_fields({key: CARGOFIELDS[key] for key in ('Genres', 'Released')}), source)
+
+def test_changed_field_type():
+    source = generate_class('Infobox_game', make_fields(CARGOFIELDS))
+    assert not is_unchanged(make_fields({**CARGOFIELDS, 'Released': {'type': 'String'}}), source)
+
+def test_field_previously_inferred_as_support():
+    inferred = make_fields(CARGOFIELDS)
+    inferred[3].type = 'Support'
+    source = generate_class('Infobox_game', inferred)
+    assert 'FieldSpec("controller_support", "Controller support", "support", None, None)' in source
+    # the fetched field is a string field until its values are sampled
+    assert is_unchanged(make_fields(CARGOFIELDS), source)
+    # a support field turned into a list field has changed
+    assert not is_unchanged(make_fields({**CARGOFIELDS, 'Controller_support': {'type': 'String', 'isList': '',
+                                                                              'delimiter': ','}}), source)
+
+def test_generated_module_imports():
+    module = generate_module([generate_class('Infobox_game', make_fields(CARGOFIELDS))])
+    assert 'from typing import Any' not in module
+    compile(module, 'tables.py', 'exec')
+    module = generate_module([generate_class('Infobox_game', make_fields({'Rating': {'type': 'Integer'}}))])
+    assert 'from typing import Any' in module
+    compile(module, 'tables.py', 'exec')
+
+class SchemaAPI:
+    """
+    API describing Infobox_game with CARGOFIELDS and Cloud with a single
+    string field, whose values are all support values, and recording the
+    tables sampled.
+    """
+    def __init__(self):
+        self.sampled: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        if params['action'] == 'cargofields':
+            fields = CARGOFIELDS if params['table'] == 'Infobox_game' else {'OneDrive': {'type': 'String'}}
+            return httpx.Response(200, json={'cargofields': fields})
+        self.sampled.append(params['fields'])
+        key = params['fields'].partition('.')[2].replace('_', ' ')
+        return httpx.Response(200, json={'cargoquery': [{'title': {key: value}} for value in ('true', 'false', '')]})
+
+def test_update_schema_regenerates_changed_tables(tmp_path, make_client):
+    tables_info = tmp_path / 'tables.json'
+    python_tables = tmp_path / 'tables.py'
+    previous_infobox = generate_class('Infobox_game', make_fields(CARGOFIELDS))
+    previous_cloud = generate_class('Cloud', make_fields({'Steam': {'type': 'String'}}, 'Cloud'))
+    python_tables.write_text(generate_module([previous_infobox, previous_cloud]))
+    tables_info.write_text(json.dumps({'Infobox_game': list(CARGOFIELDS), 'Cloud': ['Steam']}))
+    api = SchemaAPI()
+    async def run():
+        async with make_client(api) as client:
+            return await update_schema(client, ('Infobox_game', 'Cloud'), tables_info_filename=str(tables_info),
+                                       python_tables_filename=str(python_tables))
+    assert asyncio.run(run()) == {'Cloud': (['OneDrive'], ['Steam'])}
+    assert api.sampled == ['Cloud.OneDrive']
+    classes = split_classes(python_tables.read_text())
+    assert classes['Infobox_game'] == previous_infobox
+    assert 'FieldSpec("onedrive", "OneDrive", "support", None, None)' in classes['Cloud']
+    assert json.loads(tables_info.read_text()) == {'Infobox_game': list(CARGOFIELDS), 'Cloud': ['OneDrive']}
@@ -0,0 +1,80 @@
+import struct
+
+import httpx
+import pytest
+
+import pcgw_api
+from pcgw_api.pcgw import Game
+from pcgw_api.snapshot import MAGIC, VERSION
+
+ROWS = [
+    {'Page': 'Hollow Knight', 'PageID': '12', 'Genres': 'Action,Metroidvania', 'Released': '2017-02-24',
+     'Steam AppID': '367520', 'GOGcom ID': '1308320804'},
+    {'Page': 'Celeste', 'PageID': '3', 'Genres': 'Platform', 'Released': '', 'Steam AppID': '504230',
+     'GOGcom ID': ''},
+    {'Page': 'Pokémon 🎮 "Test"', 'PageID': '70000', 'Genres': '', 'Released': '', 'Steam AppID': '',
+     'GOGcom ID': ''},
+    {'Page': 'Fez', 'PageID': '5', 'Genres': 'Puzzle'},
+]
+
+def catalogue(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={'cargoquery': [{'title': row} for row in
+                                                    sorted(ROWS, key=lambda row: int(row['PageID']))]})
+
+def test_round_trip(tmp_path, make_client):
+    path = str(tmp_path / 'catalogue.snap')
+    with make_client(catalogue) as client:
+        assert client.save_snapshot(path, tables=['Infobox_game']) == 4
+        with client.load_snapshot(path) as snapshot:
+            assert len(snapshot) == 4
+            assert list(snapshot) == [3, 5, 12, 70000]
+            assert snapshot.loaded_tables == {'Infobox_game'}
+            for row in ROWS:
+                assert snapshot.get_json_data(int(row['PageID'])) == row
+            game = snapshot[12]
+            assert game.name == 'Hollow Knight' and game.loaded_tables == {'Infobox_game'}
+            assert set(game.infobox.genres) == {'Action', 'Metroidvania'}
+            assert snapshot[12] is game
+            assert 3 in snapshot and 4 not in snapshot and 70001 not in snapshot
+            assert '3' not in snapshot and None not in snapshot
+            assert snapshot.get(4) is None and snapshot.get_json_data(4) is None
+            with pytest.raises(KeyError):
+                snapshot[4]
+
+def test_games_without_loaded_tables(tmp_path, make_client):
+    path = str(tmp_path / 'games.snap')
+    with make_client() as client:
+        client.save_snapshot(path, [Game(row) for row in ROWS[:2]])
+    with pcgw_api.Snapshot(path) as snapshot:
+        assert snapshot.loaded_tables is None
+        assert [snapshot.get_json_data(page_id) for page_id in snapshot] == [ROWS[1], ROWS[0]]
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / 'empty.snap')
+    assert pcgw_api.snapshot.write_snapshot(path, []) == 0
+    with pcgw_api.Snapshot(path) as snapshot:
+        assert len(snapshot) == 0 and list(snapshot) == [] and 1 not in snapshot
+
+def test_dropped_json_data_is_rejected(tmp_path, make_client):
+    game = Game(ROWS[0], drop_json_data=True)
+    game.load_tables()
+    with make_client() as client, pytest.raises(ValueError):
+        client.save_snapshot(str(tmp_path / 'games.snap'), [game])
+
+@pytest.mark.parametrize('header', [b'', b'NOTASNAPSHOT' * 40,
+                                    struct.pack('<8sI', MAGIC, VERSION + 1) + bytes(300)])
+def test_invalid_files_are_rejected(tmp_path, header):
+    path = tmp_path / 'invalid.snap'
+    path.write_bytes(header)
+    with pytest.raises(ValueError):
+        pcgw_api.Snapshot(str(path))
+
+def test_games_outlive_close(tmp_path):
+    path = str(tmp_path / 'catalogue.snap')
+    pcgw_api.snapshot.write_snapshot(path, ROWS)
+    snapshot = pcgw_api.Snapshot(path)
+    game = snapshot[12]
+    snapshot.close()
+    assert game.name == 'Hollow Knight'
+    assert set(game.infobox.genres) == {'Action', 'Metroidvania'}
+    assert game.infobox.steam_appid == ('367520',)
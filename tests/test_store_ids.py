@@ -0,0 +1,31 @@
+import httpx
+import pytest
+
+import pcgw_api
+
+def test_failed_request_does_not_cache_store_ids(make_client):
+    requests = []
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            raise httpx.ConnectError('unreachable', request=request)
+        return httpx.Response(200, json={'cargoquery': [
+            {'title': {'Page': 'Celeste', 'PageID': '1000', 'Steam AppID': '200000', 'GOGcom ID': ''}}]})
+    with make_client(handler, retry_policy=pcgw_api.RetryPolicy(max_retries=0)) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.get_games_by_store_ids(steam_ids=[200000])
+        assert 200000 not in client.store_id_index['steam']
+        results = client.get_games_by_store_ids(steam_ids=[200000])
+    assert [game.name for game in results['steam', 200000]] == ['Celeste']
+    assert client.store_id_index['steam'] == {200000: [1000]}
+
+def test_steam_and_gog_ids_of_same_value_are_kept_apart(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'cargoquery': [
+            {'title': {'Page': 'Celeste', 'PageID': '1000', 'Steam AppID': '42', 'GOGcom ID': ''}},
+            {'title': {'Page': 'Fez', 'PageID': '2000', 'Steam AppID': '', 'GOGcom ID': '42'}}]})
+    with make_client(handler) as client:
+        results = client.get_games_by_store_ids(steam_ids=[42], gog_ids=[42])
+    assert [game.name for game in results['steam', 42]] == ['Celeste']
+    assert [game.name for game in results['gog', 42]] == ['Fez']
+    assert len(results) == 2
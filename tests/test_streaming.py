@@ -0,0 +1,95 @@
+import asyncio
+import json
+import urllib.parse
+
+import httpx
+import pytest
+
+import pcgw_api
+from pcgw_api.streaming import CargoqueryParser
+
+ROWS = [
+    {'Page': 'Pokémon Legends: Arceus', 'PageID': '1'},
+    {'Page': 'Say "Hi" \\ bye', 'PageID': '2', 'Notes': 'a\nb\tc'},
+    {'Page': '東方紅魔郷 ～ the Embodiment of Scarlet Devil', 'PageID': '3'},
+    {'Page': 'Emoji 🎮 game', 'PageID': '4', 'Genres': '[],{}'},
+]
+ERROR = {'error': {'code': 'MWException', 'info': 'Error in where clause'}, 'servedby': 'mw1'}
+
+def body(rows: list[dict], ensure_ascii: bool = False) -> str:
+    return json.dumps({'cargoquery': [{'title': row} for row in rows]}, ensure_ascii=ensure_ascii, indent=1)
+
+def feed_in_chunks(text: str, size: int) -> list[dict]:
+    parser = CargoqueryParser()
+    rows = []
+    for i in range(0, len(text), size):
+        rows += parser.feed(text[i:i+size])
+    return rows
+
+@pytest.mark.parametrize('ensure_ascii', [False, True])
+def test_every_chunk_boundary(ensure_ascii):
+    # with ensure_ascii, the non-ASCII characters are \u escapes, surrogate pairs for the emoji
+    text = body(ROWS, ensure_ascii)
+    for size in range(1, 40):
+        assert feed_in_chunks(text, size) == ROWS
+
+def test_text_after_the_rows_is_ignored():
+    parser = CargoqueryParser()
+    assert parser.feed(body(ROWS[:1]) + ', "warnings": {}}') == ROWS[:1]
+    assert parser.feed('{"title": {}}') == []
+
+def test_error_body_raises():
+    text = json.dumps(ERROR)
+    for size in range(1, len(text) + 1):
+        with pytest.raises(pcgw_api.PCGWAPIError) as info:
+            feed_in_chunks(text, size)
+        assert info.value.code == 'MWException'
+
+def test_escaped_error_key_in_a_row_is_not_an_error():
+    rows = [{'Page': '"error": {"code": "x"}', 'PageID': '1'}]
+    assert feed_in_chunks(body(rows), 5) == rows
+
+class StreamingAPI:
+    """
+    API serving ROWS by pages according to the limit and offset of the
+    requests, the body of the responses being sent one byte at a time so
+    that the chunks split the UTF-8 sequences.
+    """
+    def __init__(self):
+        self.requests: list[dict] = []
+
+    def content(self, request: httpx.Request) -> bytes:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        self.requests.append(params)
+        offset = int(params.get('offset', 0))
+        return body(ROWS[offset:offset + int(params.get('limit', 50))]).encode()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        content = self.content(request)
+        return httpx.Response(200, headers={'Content-Type': 'application/json; charset=utf-8'},
+                              content=(content[i:i+1] for i in range(len(content))))
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        content = self.content(request)
+        async def chunks():
+            for i in range(len(content)):
+                yield content[i:i+1]
+        return httpx.Response(200, headers={'Content-Type': 'application/json; charset=utf-8'},
+                              content=chunks())
+
+def test_search_stream_pages(make_client, monkeypatch):
+    monkeypatch.setattr(pcgw_api.PCGW, 'MAX_LIMIT', 2)
+    api = StreamingAPI()
+    with make_client(api, api.handle_async) as client:
+        assert [game.name for game in client.search_stream('e')] == [row['Page'] for row in ROWS]
+        async def run():
+            return [game.name async for game in client.async_search_stream('e')]
+        assert asyncio.run(run()) == [row['Page'] for row in ROWS]
+        asyncio.run(client.aclose())
+    assert [(params['offset'], params['limit']) for params in api.requests] == [('0', '2'), ('2', '2'), ('4', '2')] * 2
+    assert all(params['order_by'] == 'Infobox_game._pageID' for params in api.requests)
+
+def test_search_stream_error(make_client):
+    with make_client(lambda request: httpx.Response(200, json=ERROR)) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError):
+            list(client.search_stream('celeste'))
@@ -0,0 +1,27 @@
+import copy
+import pickle
+
+from pcgw_api import Support, SupportValue
+from pcgw_api.tables import Input
+
+def test_rows_keep_distinct_raw_values():
+    yes = Input({'Controller hotplugging': 'yes'})
+    true = Input({'Controller hotplugging': 'true'})
+    assert yes.controller_hotplugging.raw_value == 'yes'
+    assert true.controller_hotplugging.raw_value == 'true'
+    assert yes.controller_hotplugging == true.controller_hotplugging == Support.TRUE
+
+def test_synonyms_and_other_values():
+    assert SupportValue.of('fakse') == Support.FALSE
+    assert SupportValue.of('partial') == Support.LIMITED
+    assert SupportValue.of(None) == Support.NULL
+    value = SupportValue.of('with mods')
+    assert value.support is Support.OTHER_VALUE and value.raw_value == 'with mods'
+
+def test_pickle_and_deepcopy():
+    value = SupportValue.of('yes')
+    assert pickle.loads(pickle.dumps(value)) is value
+    assert copy.deepcopy(value) is value
+    assert copy.copy(value) is value
+    table = pickle.loads(pickle.dumps(Input({'Controller hotplugging': 'partial'})))
+    assert table.controller_hotplugging.raw_value == 'partial'
@@ -0,0 +1,67 @@
+import datetime
+import re
+import urllib.parse
+
+import httpx
+import pytest
+
+import pcgw_api
+
+class Wiki:
+    """
+    Wiki with games 1 to 4, where game 2 was edited, game 3 deleted and
+    game 4 moved since the last synchronization.
+    """
+    games = {1: 'Celeste', 2: 'Fez', 4: 'Limbo (2010)'}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(urllib.parse.parse_qsl(request.content.decode()))
+        if params.get('list') == 'recentchanges':
+            return httpx.Response(200, json={'query': {'recentchanges': [{'pageid': 2}]}})
+        if params.get('list') == 'logevents':
+            if 'lecontinue' not in params:
+                return httpx.Response(200, json={'continue': {'lecontinue': 'x', 'continue': '-||'},
+                                                 'query': {'logevents': [
+                                                     {'type': 'delete', 'pageid': 0, 'logpage': 3},
+                                                     {'type': 'upload', 'pageid': 7, 'logpage': 7}]}})
+            return httpx.Response(200, json={'query': {'logevents': [{'type': 'move', 'pageid': 4, 'logpage': 4}]}})
+        if match := re.search(r'_pageID>(\d+)', params['where']):
+            page_ids = {page_id for page_id in self.games if page_id > int(match.group(1))}
+        else:
+            page_ids = {int(id) for id in re.findall(r'_pageID="(\d+)"', params['where'])}
+        return httpx.Response(200, json={'cargoquery': [
+            {'title': {'Page': name, 'PageID': str(page_id)}}
+            for page_id, name in self.games.items() if page_id in page_ids]})
+
+def test_sync_removes_deleted_games(tmp_path, make_client):
+    index = pcgw_api.OfflineIndex(str(tmp_path / 'index.db'))
+    index.add({'Page': name, 'PageID': str(page_id)}
+              for page_id, name in [(1, 'Celeste'), (2, 'Fez'), (3, 'Braid'), (4, 'Limbo')])
+    index.last_sync = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    with make_client(Wiki()) as client:
+        assert client.sync(index) == {2, 3, 4}
+    assert index.get(3) is None
+    assert index.get(4)['Page'] == 'Limbo (2010)'
+    assert len(index) == 3
+    index.close()
+
+class FailingWiki(Wiki):
+    """
+    Wiki answering the requests of game 3 with an error.
+    """
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if '_pageID="3"' not in urllib.parse.unquote_plus(request.content.decode()):
+            return super().__call__(request)
+        return httpx.Response(200, json={'error': {'code': 'MWException', 'info': 'Internal error'}})
+
+def test_failed_sync_leaves_store_untouched(tmp_path, make_client):
+    index = pcgw_api.OfflineIndex(str(tmp_path / 'index.db'))
+    index.add({'Page': name, 'PageID': str(page_id)} for page_id, name in [(2, 'Fez (old)'), (3, 'Braid')])
+    last_sync = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    index.last_sync = last_sync
+    with make_client(FailingWiki()) as client:
+        with pytest.raises(pcgw_api.PCGWAPIError):
+            client.sync(index, chunk_size=1)
+    assert index.get(2)['Page'] == 'Fez (old)' and index.get(3)['Page'] == 'Braid'
+    assert index.last_sync == last_sync
+    index.close()
@@ -0,0 +1,18 @@
+import time
+
+from pcgw_api import RateLimiter
+
+def test_pause_is_not_credited_with_elapsed_time():
+    limiter = RateLimiter(rate=5)
+    limiter.acquire()
+    time.sleep(.3)
+    limiter.pause(1)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= .95
+
+def test_pause_keeps_longer_delays():
+    limiter = RateLimiter(rate=5)
+    limiter.pause(1)
+    limiter.pause(.1)
+    assert limiter._reserve() >= .95